@@ -0,0 +1,319 @@
+"""
+Amortization schedules for the Personal Finance Calculator.
+Produces the period-by-period breakdown behind calculate_monthly_payment.
+"""
+
+from collections import namedtuple
+from collections.abc import Sequence
+import copy
+
+import numpy as np
+
+from finance_calculator.calculator import FinanceCalculator
+from finance_calculator.curve import YieldCurve
+from finance_calculator.batch import (
+    BatchCalculator, BatchResult, ERROR_NONE, ERROR_INVALID_PERIOD, broadcast_inputs
+)
+
+
+ScheduleRow = namedtuple('ScheduleRow', ['period', 'payment', 'interest', 'principal', 'balance'])
+ScheduleRow.__doc__ = """
+One period of an amortization schedule.
+
+Attributes:
+    period (int): Payment number, starting at 1
+    payment (float): Amount paid this period
+    interest (float): Interest portion of the payment
+    principal (float): Principal portion of the payment
+    balance (float): Remaining balance after the payment
+"""
+
+
+def number_of_payments(years):
+    """
+    Convert a loan term in years to a whole number of monthly payments.
+    
+    Args:
+        years (float): Loan term in years
+    
+    Returns:
+        int: Number of monthly payments
+    
+    Raises:
+        ValueError: If the term is not a whole number of months
+    """
+    num_payments = round(years * 12)
+    if abs(num_payments - years * 12) > 1e-9:
+        raise ValueError("Loan term must be a whole number of months")
+    return int(num_payments)
+
+
+def iter_amortization_schedule(loan_amount, annual_rate, years, calculator=None):
+    """
+    Lazily generate the amortization schedule of a monthly loan.
+    
+    Every period pays the payment from calculate_monthly_payment; the final
+    period pays whatever is left so the balance ends at exactly zero. With a
+    curve, each month accrues interest at the curve's forward rate for it.
+    
+    Args:
+        loan_amount (float): Total loan amount
+        annual_rate (float or YieldCurve): Annual interest rate (as
+            percentage), or a curve to discount the payments off
+        years (int): Loan term in years
+        calculator (FinanceCalculator): Calculator used for the payment (optional)
+    
+    Yields:
+        ScheduleRow: One row per monthly payment
+    
+    Raises:
+        ValueError: If the loan parameters are invalid
+    """
+    calculator = calculator or FinanceCalculator()
+    payment = calculator.calculate_monthly_payment(loan_amount, annual_rate, years)
+    num_payments = number_of_payments(years)
+    if isinstance(annual_rate, YieldCurve):
+        discount = annual_rate.monthly_discount_factors(num_payments)
+        monthly_rates = (discount[:-1] / discount[1:] - 1).tolist()
+    else:
+        monthly_rates = [annual_rate / 100 / 12] * num_payments
+    
+    balance = loan_amount
+    for period in range(1, num_payments + 1):
+        interest = balance * monthly_rates[period - 1]
+        if period == num_payments:
+            principal = balance
+            balance = 0.0
+            yield ScheduleRow(period, principal + interest, interest, principal, balance)
+        else:
+            principal = payment - interest
+            balance -= principal
+            yield ScheduleRow(period, payment, interest, principal, balance)
+
+
+def iter_portfolio_schedules(loans, calculator=None):
+    """
+    Lazily generate the schedules of many loans one after another.
+    
+    Args:
+        loans: Iterable of (loan_amount, annual_rate, years) tuples
+        calculator (FinanceCalculator): Calculator used for the payments (optional)
+    
+    Yields:
+        tuple: (loan_index, ScheduleRow) for every period of every loan
+    """
+    calculator = calculator or FinanceCalculator()
+    for loan_index, (loan_amount, annual_rate, years) in enumerate(loans):
+        for row in iter_amortization_schedule(loan_amount, annual_rate, years, calculator):
+            yield loan_index, row
+
+
+def _closed_form_state(loan_amount, annual_rate, years, period):
+    """
+    Evaluate payment, balance and cumulative interest after a given period.
+    
+    Uses the annuity identities behind calculate_monthly_payment, so any
+    period of any loan costs O(1) and many (loan, period) pairs are
+    evaluated together as one array operation. With a curve the balances
+    come from the curve's monthly discount factors instead.
+    
+    Returns:
+        tuple: (payment, balance, interest_paid, errors) arrays
+    """
+    curve = annual_rate if isinstance(annual_rate, YieldCurve) else None
+    loan_amount, annual_rate, years, period = broadcast_inputs(
+        loan_amount, 0 if curve is not None else annual_rate, years, period)
+    payment, errors = BatchCalculator().calculate_monthly_payment(
+        loan_amount, curve if curve is not None else annual_rate, years)
+    num_payments = np.round(years * 12)
+    
+    invalid_period = (period < 0) | (period > num_payments) | (period != np.floor(period))
+    errors = errors | np.where(invalid_period, ERROR_INVALID_PERIOD, ERROR_NONE).astype(np.uint8)
+    
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if curve is not None:
+            valid_terms = np.where(errors == ERROR_NONE, num_payments, 1).astype(np.int64)
+            discount = curve.monthly_discount_factors(int(valid_terms.max(initial=1)))
+            annuity = np.cumsum(discount) - 1
+            
+            def month(k):
+                return np.clip(np.where(errors == ERROR_NONE, k, 0), 0, valid_terms).astype(np.int64)
+            
+            def balance_at(k):
+                # B_k * P_k = L - P * (P_1 + ... + P_k) at the curve's forward rates
+                k = month(k)
+                return (loan_amount - payment * annuity[k]) / discount[k]
+            
+            last_growth = discount[month(num_payments - 1)] / discount[month(num_payments)]
+        else:
+            monthly_rate = annual_rate / 100 / 12
+            log_growth = np.log1p(monthly_rate)
+            
+            def balance_at(k):
+                # B_k = L(1+r)^k - P((1+r)^k - 1) / r, or L - kP without interest
+                growth_minus_one = np.expm1(k * log_growth)
+                amortized = loan_amount * (growth_minus_one + 1) - payment * growth_minus_one / monthly_rate
+                return np.where(monthly_rate == 0, loan_amount - k * payment, amortized)
+            
+            last_growth = 1 + monthly_rate
+        
+        last = period >= num_payments
+        balance = np.where(last, 0.0, balance_at(period))
+        # The final payment clears whatever is left after the second-to-last one
+        final_payment = balance_at(num_payments - 1) * last_growth
+        paid = np.where(last, (num_payments - 1) * payment + final_payment, period * payment)
+        interest_paid = paid - (loan_amount - balance)
+    
+    valid = errors == ERROR_NONE
+    return (
+        np.where(valid, payment, np.nan),
+        np.where(valid, balance, np.nan),
+        np.where(valid, interest_paid, np.nan),
+        errors,
+    )
+
+
+def balance_after_payment(loan_amount, annual_rate, years, period):
+    """
+    Calculate the remaining balance after a given payment in closed form.
+    
+    Args:
+        loan_amount (array-like): Loan amounts
+        annual_rate (array-like or YieldCurve): Annual interest rates (as
+            percentage), or one curve to discount every loan's payments off
+        years (array-like): Loan terms in years
+        period (array-like): Payment numbers (0 for the opening balance)
+    
+    Returns:
+        BatchResult: Remaining balances and error codes
+    """
+    _, balance, _, errors = _closed_form_state(loan_amount, annual_rate, years, period)
+    return BatchResult(balance, errors)
+
+
+def interest_paid_through(loan_amount, annual_rate, years, period):
+    """
+    Calculate the cumulative interest paid up to and including a given payment.
+    
+    Args:
+        loan_amount (array-like): Loan amounts
+        annual_rate (array-like or YieldCurve): Annual interest rates (as
+            percentage), or one curve to discount every loan's payments off
+        years (array-like): Loan terms in years
+        period (array-like): Payment numbers (0 for the opening balance)
+    
+    Returns:
+        BatchResult: Cumulative interest and error codes
+    """
+    _, _, interest_paid, errors = _closed_form_state(loan_amount, annual_rate, years, period)
+    return BatchResult(interest_paid, errors)
+
+
+class AmortizationSchedule(Sequence):
+    """
+    Read-only, lazily evaluated view of an amortization schedule.
+    
+    Rows and columns are computed on demand from the closed-form balance
+    formula, so memory stays constant regardless of the loan term and
+    slicing (e.g. schedule[120:132]) only costs the size of the slice.
+    """
+    
+    COLUMNS = ScheduleRow._fields
+    
+    def __init__(self, loan_amount, annual_rate, years, calculator=None, periods=None):
+        """
+        Create a schedule view.
+        
+        Args:
+            loan_amount (float): Total loan amount
+            annual_rate (float or YieldCurve): Annual interest rate (as
+                percentage), or a curve to discount the payments off
+            years (int): Loan term in years
+            calculator (FinanceCalculator): Calculator used to validate the loan (optional)
+            periods (range): Payment numbers covered by this view (defaults to all)
+        
+        Raises:
+            ValueError: If the loan parameters are invalid
+        """
+        calculator = calculator or FinanceCalculator()
+        payment = calculator.calculate_monthly_payment(loan_amount, annual_rate, years)
+        num_payments = number_of_payments(years)
+        
+        self.loan_amount = loan_amount
+        self.annual_rate = annual_rate
+        self.years = years
+        self.periods = periods if periods is not None else range(1, num_payments + 1)
+        if isinstance(annual_rate, YieldCurve):
+            # Discounting at the curve's monthly forward rates gives
+            # B_k * P_k = L - payment * (P_1 + ... + P_k); the prefix sums are
+            # built once and shared by every slice of this schedule
+            self._payment = payment
+            self._discount = annual_rate.monthly_discount_factors(num_payments)
+            self._annuity = np.cumsum(self._discount) - 1
+    
+    def __len__(self):
+        return len(self.periods)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = copy.copy(self)
+            view.periods = self.periods[index]
+            return view
+        period = self.periods[index]
+        columns = self._columns(np.array([period]))
+        return ScheduleRow(period, *(float(columns[name][0]) for name in self.COLUMNS[1:]))
+    
+    def __iter__(self, chunk_size=256):
+        for start in range(0, len(self.periods), chunk_size):
+            periods = self.periods[start:start + chunk_size]
+            columns = self._columns(np.asarray(periods, dtype=np.int64))
+            for i, period in enumerate(periods):
+                yield ScheduleRow(period, *(float(columns[name][i]) for name in self.COLUMNS[1:]))
+    
+    def __repr__(self):
+        return (f"AmortizationSchedule(loan_amount={self.loan_amount}, annual_rate={self.annual_rate}, "
+                f"years={self.years}, periods={self.periods})")
+    
+    def column(self, name):
+        """
+        Compute one column for every period in this view.
+        
+        Args:
+            name (str): One of 'period', 'payment', 'interest', 'principal', 'balance'
+        
+        Returns:
+            numpy.ndarray: Column values in period order
+        
+        Raises:
+            ValueError: If the column name is unknown
+        """
+        if name not in self.COLUMNS:
+            raise ValueError(f"Unknown schedule column: {name}")
+        return self._columns(np.asarray(self.periods, dtype=np.int64))[name]
+    
+    def _columns(self, periods):
+        """Evaluate all columns for an array of payment numbers."""
+        num_payments = number_of_payments(self.years)
+        if isinstance(self.annual_rate, YieldCurve):
+            discount, annuity = self._discount, self._annuity
+            payment = np.full(periods.shape, self._payment)
+            opening = (self.loan_amount - payment * annuity[periods - 1]) / discount[periods - 1]
+            closing = np.where(periods == num_payments, 0.0,
+                               (self.loan_amount - payment * annuity[periods]) / discount[periods])
+            monthly_rate = discount[periods - 1] / discount[periods] - 1
+        else:
+            _, opening, _, _ = _closed_form_state(self.loan_amount, self.annual_rate, self.years, periods - 1)
+            payment, closing, _, _ = _closed_form_state(self.loan_amount, self.annual_rate, self.years, periods)
+            monthly_rate = self.annual_rate / 100 / 12
+        interest = opening * monthly_rate
+        # Regular periods pay the fixed payment; the final one clears the balance
+        payment = np.where(periods == num_payments, opening + interest, payment)
+        principal = payment - interest
+        
+        return {
+            'period': periods,
+            'payment': payment,
+            'interest': interest,
+            'principal': principal,
+            'balance': closing,
+        }
@@ -0,0 +1,149 @@
+"""
+Adjustable-rate mortgages for the Personal Finance Calculator.
+Each fixed-rate segment is evaluated in closed form and the loan is only
+re-amortized at rate resets, for many loans at once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import as_float_array, broadcast_inputs
+
+
+ARMResult = namedtuple('ARMResult', ['rates', 'payments', 'balances', 'months', 'total_interest'])
+ARMResult.__doc__ = """
+Segment-by-segment result of an adjustable-rate mortgage, indexed [loan, segment].
+
+Attributes:
+    rates (numpy.ndarray): Annual rate applied in each segment (as percentage)
+    payments (numpy.ndarray): Monthly payment in each segment
+    balances (numpy.ndarray): Balance at the end of each segment
+    months (numpy.ndarray): Number of payments in each segment (0 past the term)
+    total_interest (numpy.ndarray): Total interest per loan; the final payment
+        absorbs the rounding residual
+"""
+
+
+def _cap(values, lower, upper):
+    """Clip values to optional (None) bounds."""
+    if lower is not None:
+        values = np.maximum(values, lower)
+    if upper is not None:
+        values = np.minimum(values, upper)
+    return values
+
+
+def _segment_payment(balance, monthly_rate, remaining):
+    """Level payment that amortizes a balance over the remaining months."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortized = balance * monthly_rate / -np.expm1(-remaining * np.log1p(monthly_rate))
+        return np.where(monthly_rate == 0, balance / remaining, amortized)
+
+
+def _segment_balance(balance, monthly_rate, payment, months):
+    """Balance after a number of level payments at a fixed rate."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_growth = months * np.log1p(monthly_rate)
+        annuity = np.where(monthly_rate == 0, months, np.expm1(log_growth) / monthly_rate)
+        return balance * np.exp(log_growth) - payment * annuity
+
+
+def arm_schedule(loan_amounts, initial_rates, years, reset_rates, fixed_months=60,
+                 reset_months=12, initial_cap=None, periodic_cap=None, lifetime_cap=None,
+                 floor=None):
+    """
+    Calculate adjustable-rate mortgage payments segment by segment.
+    
+    The loan pays the initial rate for fixed_months, then resets every
+    reset_months. At each reset the proposed rate (index plus margin) is
+    limited to the periodic cap around the previous rate (the initial cap
+    at the first reset), then to the floor and the lifetime cap above the
+    initial rate, and the remaining balance is re-amortized over the
+    remaining term. Payments are rounded to the cent as in
+    calculate_monthly_payment.
+    
+    Args:
+        loan_amounts (array-like): Loan amounts
+        initial_rates (array-like): Initial annual rates (as percentage)
+        years (array-like): Loan terms in years
+        reset_rates (array-like): Proposed annual rate at each reset, shaped
+            (loans, resets) or (resets,); the last column is reused if the
+            term has more resets
+        fixed_months (array-like): Length of the initial fixed-rate period
+        reset_months (array-like): Months between resets
+        initial_cap (float): Maximum change at the first reset (defaults to
+            periodic_cap)
+        periodic_cap (float): Maximum change at later resets (percentage points)
+        lifetime_cap (float): Maximum rate above the initial rate
+        floor (float): Minimum rate (as percentage)
+    
+    Returns:
+        ARMResult: Rates, payments, ending balances and lengths per segment
+        and total interest per loan
+    
+    Raises:
+        ValueError: If any loan or reset schedule is invalid
+    """
+    loan_amounts, initial_rates, years, fixed_months, reset_months = (
+        np.ravel(values) for values in broadcast_inputs(
+            loan_amounts, initial_rates, years, fixed_months, reset_months)
+    )
+    num_payments = years * 12
+    if np.any(loan_amounts <= 0) or np.any(initial_rates < 0) or np.any(num_payments <= 0) \
+            or np.any(num_payments != np.round(num_payments)) or np.any(fixed_months <= 0) \
+            or np.any(reset_months <= 0):
+        raise ValueError("Invalid loan parameters")
+    num_payments = np.round(num_payments).astype(np.int64)
+    fixed_months = np.round(fixed_months).astype(np.int64)
+    reset_months = np.round(reset_months).astype(np.int64)
+    
+    reset_rates = np.atleast_2d(as_float_array(reset_rates))
+    if reset_rates.shape[1] == 0:
+        raise ValueError("At least one reset rate is required")
+    # Work segment-major so every per-segment slice is contiguous
+    reset_rates = np.ascontiguousarray(
+        np.broadcast_to(reset_rates, (loan_amounts.size, reset_rates.shape[1])).T
+    )
+    
+    # Segment boundaries: 0, fixed, fixed + reset, ... clipped to the term
+    num_resets = int(np.max(-(-np.maximum(num_payments - fixed_months, 0) // reset_months)))
+    segment = np.arange(num_resets + 2)[:, None]
+    starts = np.minimum(
+        np.where(segment == 0, 0, fixed_months + (segment - 1) * reset_months),
+        num_payments,
+    )
+    months = np.diff(starts, axis=0)
+    num_segments = months.shape[0]
+    
+    rates = np.empty(months.shape)
+    payments = np.empty(months.shape)
+    balances = np.empty(months.shape)
+    
+    rate = initial_rates
+    balance = loan_amounts
+    total_paid = np.zeros(loan_amounts.size)
+    lifetime_ceiling = None if lifetime_cap is None else initial_rates + lifetime_cap
+    for index in range(num_segments):
+        if index > 0:
+            proposed = reset_rates[min(index - 1, reset_rates.shape[0] - 1)]
+            cap = initial_cap if index == 1 and initial_cap is not None else periodic_cap
+            if cap is not None:
+                proposed = _cap(proposed, rate - cap, rate + cap)
+            rate = _cap(_cap(proposed, floor, None), None, lifetime_ceiling)
+        
+        active = months[index] > 0
+        monthly_rate = rate / 100 / 12
+        remaining = num_payments - starts[index]
+        payment = np.where(active, np.round(_segment_payment(balance, monthly_rate, remaining), 2), 0.0)
+        ending = np.where(active, _segment_balance(balance, monthly_rate, payment, months[index]), balance)
+        
+        rates[index] = np.where(active, rate, np.nan)
+        payments[index] = payment
+        balances[index] = ending
+        total_paid += payment * months[index]
+        balance = ending
+    
+    # The final payment settles whatever the rounded payments left over
+    total_interest = total_paid + balance - loan_amounts
+    return ARMResult(rates.T, payments.T, balances.T, months.T, total_interest)
@@ -0,0 +1,237 @@
+"""
+Vectorized batch calculations for the Personal Finance Calculator.
+Array-in/array-out counterparts of the FinanceCalculator methods, used to
+price whole portfolios in a single call instead of one quote at a time.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+# Per-row error codes. Codes are bit flags, so a row with several invalid
+# inputs carries the combination (e.g. ERROR_INVALID_AMOUNT | ERROR_INVALID_RATE).
+ERROR_NONE = 0
+ERROR_INVALID_AMOUNT = 1
+ERROR_INVALID_RATE = 2
+ERROR_INVALID_TERM = 4
+ERROR_INVALID_FREQUENCY = 8
+ERROR_INVALID_CONTRIBUTION = 16
+ERROR_INVALID_PERIOD = 32
+
+
+BatchResult = namedtuple('BatchResult', ['values', 'errors'])
+BatchResult.__doc__ = """
+Result of a batch calculation.
+
+Attributes:
+    values (numpy.ndarray): Per-row results (NaN where the row is invalid)
+    errors (numpy.ndarray): Per-row error codes (ERROR_NONE where valid)
+"""
+
+
+def as_float_array(values):
+    """
+    Convert a scalar, sequence or buffer-protocol object to a float array.
+    
+    Args:
+        values: Scalar, list, numpy array or any object exposing the buffer protocol
+    
+    Returns:
+        numpy.ndarray: Float64 array view or copy of the input
+    """
+    return np.asarray(values, dtype=np.float64)
+
+
+def broadcast_inputs(*values):
+    """
+    Convert inputs to float arrays and broadcast them to a common shape.
+    
+    Args:
+        *values: Scalars or array-likes
+    
+    Returns:
+        list: Broadcast float64 arrays, one per input
+    """
+    return np.broadcast_arrays(*[as_float_array(value) for value in values])
+
+
+def error_flags(*checks):
+    """
+    Combine (mask, code) pairs into a per-row error code array.
+    
+    Args:
+        *checks: Tuples of (boolean mask, error code)
+    
+    Returns:
+        numpy.ndarray: uint8 error codes
+    """
+    errors = np.zeros(np.broadcast(*[mask for mask, _ in checks]).shape, dtype=np.uint8)
+    for mask, code in checks:
+        np.bitwise_or(errors, code, out=errors, where=mask)
+    return errors
+
+
+def _finish(values, errors):
+    """Blank out invalid rows and package the result."""
+    values = np.where(errors == ERROR_NONE, values, np.nan)
+    return BatchResult(values, errors)
+
+
+class BatchCalculator:
+    """
+    Vectorized counterpart of FinanceCalculator.
+    
+    Every method accepts scalars or array-likes (broadcast against each other),
+    applies the same validation rules as the scalar methods as per-row masks,
+    and returns a BatchResult instead of raising ValueError.
+    """
+    
+    def calculate_simple_interest(self, principal, rate, time):
+        """
+        Calculate simple interest for many rows at once.
+        
+        Args:
+            principal (array-like): Principal amounts
+            rate (array-like): Interest rates (as percentage)
+            time (array-like): Time periods in years
+        
+        Returns:
+            BatchResult: Simple interest amounts and error codes
+        """
+        principal, rate, time = broadcast_inputs(principal, rate, time)
+        errors = error_flags(
+            (principal < 0, ERROR_INVALID_AMOUNT),
+            (rate < 0, ERROR_INVALID_RATE),
+            (time < 0, ERROR_INVALID_TERM),
+        )
+        
+        return _finish((principal * rate * time) / 100, errors)
+    
+    def calculate_compound_interest(self, principal, rate, time, compound_frequency=1, continuous=False):
+        """
+        Calculate compound interest for many rows at once.
+        
+        Growth is evaluated in log space (see compounding.compound_growth),
+        which stays accurate for very high compounding frequencies.
+        
+        Args:
+            principal (array-like): Principal amounts
+            rate (array-like or YieldCurve): Annual interest rates (as
+                percentage), or one curve to grow every principal along
+            time (array-like): Time periods in years
+            compound_frequency (array-like): Compounding periods per year
+                (numpy.inf for continuous compounding; ignored for a curve)
+            continuous (bool): Compound continuously for every row
+        
+        Returns:
+            BatchResult: Final amounts (rounded to cents) and error codes
+        """
+        # Imported here because the compounding and curve modules build on this one
+        from finance_calculator.compounding import compound_growth
+        from finance_calculator.curve import YieldCurve
+        
+        curve = rate if isinstance(rate, YieldCurve) else None
+        principal, rate, time, compound_frequency = broadcast_inputs(
+            principal, 0 if curve is not None else rate, time, compound_frequency
+        )
+        errors = error_flags(
+            (principal < 0, ERROR_INVALID_AMOUNT),
+            (rate < 0, ERROR_INVALID_RATE),
+            (time < 0, ERROR_INVALID_TERM),
+            (compound_frequency <= 0, ERROR_INVALID_FREQUENCY),
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if curve is not None:
+                amount = principal * curve.growth_factors(np.maximum(time, 0))
+            else:
+                amount = principal * compound_growth(rate, time, compound_frequency, continuous)
+        
+        return _finish(np.round(amount, 2), errors)
+    
+    def calculate_monthly_payment(self, loan_amount, annual_rate, years):
+        """
+        Calculate monthly loan payments for many loans at once.
+        
+        Args:
+            loan_amount (array-like): Loan amounts
+            annual_rate (array-like or YieldCurve): Annual interest rates (as
+                percentage), or one curve to discount every loan's payments off
+            years (array-like): Loan terms in years
+        
+        Returns:
+            BatchResult: Monthly payments and error codes
+        """
+        # Imported here because the curve module builds on this one
+        from finance_calculator.curve import YieldCurve
+        
+        curve = annual_rate if isinstance(annual_rate, YieldCurve) else None
+        loan_amount, annual_rate, years = broadcast_inputs(
+            loan_amount, 0 if curve is not None else annual_rate, years)
+        errors = error_flags(
+            (loan_amount <= 0, ERROR_INVALID_AMOUNT),
+            (annual_rate < 0, ERROR_INVALID_RATE),
+            (years <= 0, ERROR_INVALID_TERM),
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            monthly_rate = annual_rate / 100 / 12
+            num_payments = years * 12
+            growth = (1 + monthly_rate) ** num_payments
+            amortized = np.round(loan_amount * (monthly_rate * growth) / (growth - 1), 2)
+            payment = np.where(annual_rate == 0, loan_amount / num_payments, amortized)
+            if curve is not None:
+                payment = np.round(curve.monthly_payment(loan_amount, np.where(years > 0, years, 1)), 2)
+        
+        return _finish(payment, errors)
+    
+    def calculate_savings_goal(self, target_amount, monthly_contribution, annual_rate):
+        """
+        Calculate the years needed to reach many savings goals at once.
+        
+        Args:
+            target_amount (array-like): Target savings amounts
+            monthly_contribution (array-like): Monthly savings contributions
+            annual_rate (array-like or YieldCurve): Annual interest rates (as
+                percentage), or one curve whose forward rates every plan earns
+        
+        Returns:
+            BatchResult: Years to reach each goal and error codes; goals a
+            curve never reaches are flagged as ERROR_INVALID_RATE
+        """
+        # Imported here because the curve module builds on this one
+        from finance_calculator.curve import YieldCurve
+        
+        curve = annual_rate if isinstance(annual_rate, YieldCurve) else None
+        target_amount, monthly_contribution, annual_rate = broadcast_inputs(
+            target_amount, monthly_contribution, 0 if curve is not None else annual_rate
+        )
+        if curve is not None:
+            valid = (target_amount > 0) & (monthly_contribution > 0)
+            years = np.round(curve.years_to_goal(np.where(valid, target_amount, 1),
+                                                 np.where(valid, monthly_contribution, 1)), 2)
+            errors = error_flags(
+                (target_amount <= 0, ERROR_INVALID_AMOUNT),
+                (monthly_contribution <= 0, ERROR_INVALID_CONTRIBUTION),
+                (np.isnan(years), ERROR_INVALID_RATE),
+            )
+            return _finish(years, errors)
+        
+        errors = error_flags(
+            (target_amount <= 0, ERROR_INVALID_AMOUNT),
+            (monthly_contribution <= 0, ERROR_INVALID_CONTRIBUTION),
+            (annual_rate < 0, ERROR_INVALID_RATE),
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            monthly_rate = annual_rate / 100 / 12
+            months = np.log(1 + (target_amount * monthly_rate) / monthly_contribution) / \
+                np.log(1 + monthly_rate)
+            years = np.where(
+                annual_rate == 0,
+                target_amount / (monthly_contribution * 12),
+                np.round(months / 12, 2),
+            )
+        
+        return _finish(years, errors)
@@ -0,0 +1,231 @@
+"""
+Fixed-coupon bond analytics for the Personal Finance Calculator.
+Prices bonds from yields, solves yields from prices and measures duration
+and convexity for whole arrays of bonds at once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+from finance_calculator.compounding import log_growth
+from finance_calculator.rootfinding import RootResult, newton_bisect
+
+
+BondMetrics = namedtuple('BondMetrics', ['price', 'macaulay_duration', 'modified_duration', 'convexity'])
+BondMetrics.__doc__ = """
+Price and yield sensitivities of a batch of bonds.
+
+Attributes:
+    price (numpy.ndarray): Full (dirty) price
+    macaulay_duration (numpy.ndarray): Cash-flow weighted average time in years
+    modified_duration (numpy.ndarray): -dP/dy / P with the yield as a decimal
+    convexity (numpy.ndarray): d2P/dy2 / P with the yield as a decimal
+"""
+
+
+def _bond_inputs(face, coupon_rate, years, frequency, compound_frequency, *extra):
+    """Broadcast, flatten and validate bond terms plus any extra per-bond inputs."""
+    if compound_frequency is None:
+        compound_frequency = frequency
+    values = broadcast_inputs(face, coupon_rate, years, frequency, compound_frequency, *extra)
+    shape = values[0].shape
+    face, coupon_rate, years, frequency, compound_frequency, *extra = (np.ravel(v) for v in values)
+    if np.any(face <= 0) or np.any(coupon_rate < 0) or np.any(years <= 0) or np.any(frequency <= 0) \
+            or np.any(~np.isfinite(frequency)) or np.any(compound_frequency <= 0):
+        raise ValueError("Invalid bond parameters")
+    return shape, (face, coupon_rate, years, frequency, compound_frequency), extra
+
+
+def _coupon_periods(years, frequency):
+    """Number of remaining coupons and elapsed fraction of the current coupon period."""
+    periods = np.round(years * frequency, 9)
+    num_coupons = np.ceil(periods).astype(np.int64)
+    return num_coupons, num_coupons - periods
+
+
+def _cash_flow_table(face, coupon_rate, years, frequency):
+    """
+    Lay out every bond's remaining cash flows as (bonds x periods) matrices.
+    
+    Returns the cash flows and their times in coupon periods; the next
+    coupon may be less than a full period away.
+    """
+    num_coupons, elapsed = _coupon_periods(years, frequency)
+    coupon_index = np.arange(1, num_coupons.max() + 1)
+    
+    coupon = (face * coupon_rate / 100 / frequency)[:, None]
+    remaining = coupon_index <= num_coupons[:, None]
+    cash_flows = np.where(remaining, coupon, 0.0)
+    cash_flows[np.arange(face.size), num_coupons - 1] += face
+    times = np.where(remaining, coupon_index - elapsed[:, None], 0.0)
+    return cash_flows, times
+
+
+def _discount_rates(yields, frequency, compound_frequency, continuous):
+    """
+    Per-coupon-period log discount and its first two yield derivatives.
+    
+    The yield is compounded as in calculate_compound_interest, so one
+    coupon period discounts by exp(-delta) with delta = log_growth over
+    1 / frequency years. Derivatives are taken with the yield as a decimal.
+    """
+    delta = log_growth(yields, 1 / frequency, compound_frequency, continuous)
+    flat = continuous | np.isinf(compound_frequency)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_period = 1 + yields / 100 / compound_frequency
+        d_delta = np.where(flat, 1 / frequency, 1 / (frequency * per_period))
+        d2_delta = np.where(flat, 0.0, -1 / (frequency * compound_frequency * per_period ** 2))
+    return delta, d_delta, d2_delta
+
+
+def _discounted_moments(cash_flows, times, delta):
+    """Sum of discounted cash flows weighted by 1, t and t^2 per bond."""
+    discounted = cash_flows * np.exp(-times * delta[:, None])
+    weighted = times * discounted
+    return discounted.sum(axis=1), weighted.sum(axis=1), (times * weighted).sum(axis=1)
+
+
+def _check_yields(yields, compound_frequency, continuous):
+    """Reject yields whose per-period growth is not positive."""
+    below = (1 + yields / 100 / compound_frequency <= 0) & np.isfinite(compound_frequency)
+    if not continuous and np.any(below):
+        raise ValueError("Yield is below the compounding limit")
+
+
+def accrued_interest(face, coupon_rate, years, frequency=2):
+    """
+    Calculate the coupon interest accrued since the last coupon date.
+    
+    Accrual is linear in the elapsed fraction of the coupon period, so the
+    clean price is the full price from bond_price minus this amount.
+    
+    Args:
+        face (array-like): Face (par) value
+        coupon_rate (array-like): Annual coupon rate (as percentage)
+        years (array-like): Time to maturity in years
+        frequency (array-like): Coupon payments per year
+    
+    Returns:
+        numpy.ndarray: Accrued interest per bond
+    
+    Raises:
+        ValueError: If any bond is invalid
+    """
+    shape, (face, coupon_rate, years, frequency, _), _ = _bond_inputs(face, coupon_rate, years, frequency, None)
+    _, elapsed = _coupon_periods(years, frequency)
+    return (face * coupon_rate / 100 / frequency * elapsed).reshape(shape)
+
+
+def bond_price(face, coupon_rate, years, yields, frequency=2, compound_frequency=None, continuous=False):
+    """
+    Price fixed-coupon bonds from their yields.
+    
+    Args:
+        face (array-like): Face (par) value
+        coupon_rate (array-like): Annual coupon rate (as percentage)
+        years (array-like): Time to maturity in years; a maturity that is not
+            a whole number of coupon periods puts the next coupon less than a
+            full period away
+        yields (array-like): Annual yield to maturity (as percentage)
+        frequency (array-like): Coupon payments per year
+        compound_frequency (array-like): Yield compounding periods per year
+            (defaults to the coupon frequency); numpy.inf means continuous
+        continuous (bool): Compound the yield continuously
+    
+    Returns:
+        numpy.ndarray: Full (dirty) prices
+    
+    Raises:
+        ValueError: If any bond or yield is invalid
+    """
+    return bond_metrics(face, coupon_rate, years, yields, frequency, compound_frequency, continuous).price
+
+
+def bond_metrics(face, coupon_rate, years, yields, frequency=2, compound_frequency=None, continuous=False):
+    """
+    Calculate price, durations and convexity of fixed-coupon bonds.
+    
+    With delta the log discount per coupon period and t_k the cash-flow
+    times in periods, P = sum CF_k exp(-t_k delta), so both yield
+    derivatives follow from the same three discounted sums.
+    
+    Args:
+        face (array-like): Face (par) value
+        coupon_rate (array-like): Annual coupon rate (as percentage)
+        years (array-like): Time to maturity in years
+        yields (array-like): Annual yield to maturity (as percentage)
+        frequency (array-like): Coupon payments per year
+        compound_frequency (array-like): Yield compounding periods per year
+            (defaults to the coupon frequency)
+        continuous (bool): Compound the yield continuously
+    
+    Returns:
+        BondMetrics: Full price, Macaulay and modified duration and convexity
+    
+    Raises:
+        ValueError: If any bond or yield is invalid
+    """
+    shape, (face, coupon_rate, years, frequency, compound_frequency), (yields,) = _bond_inputs(
+        face, coupon_rate, years, frequency, compound_frequency, yields)
+    _check_yields(yields, compound_frequency, continuous)
+    
+    cash_flows, times = _cash_flow_table(face, coupon_rate, years, frequency)
+    delta, d_delta, d2_delta = _discount_rates(yields, frequency, compound_frequency, continuous)
+    price, first, second = _discounted_moments(cash_flows, times, delta)
+    
+    macaulay = first / (frequency * price)
+    modified = d_delta * first / price
+    convexity = (d_delta ** 2 * second - d2_delta * first) / price
+    return BondMetrics(*(values.reshape(shape) for values in (price, macaulay, modified, convexity)))
+
+
+def bond_yield(prices, face, coupon_rate, years, frequency=2, compound_frequency=None, continuous=False,
+               lower=-90, upper=100, tol=1e-12, max_iter=100):
+    """
+    Solve the yield to maturity of fixed-coupon bonds from their prices.
+    
+    Every bond is solved together with the safeguarded Newton method; the
+    price derivative comes analytically from the same discounted sums as
+    the price, and each iteration only reprices unconverged bonds.
+    
+    Args:
+        prices (array-like): Full (dirty) prices
+        face (array-like): Face (par) value
+        coupon_rate (array-like): Annual coupon rate (as percentage)
+        years (array-like): Time to maturity in years
+        frequency (array-like): Coupon payments per year
+        compound_frequency (array-like): Yield compounding periods per year
+            (defaults to the coupon frequency)
+        continuous (bool): Compound the yield continuously
+        lower (float): Lowest annual yield searched (as percentage)
+        upper (float): Highest annual yield searched (as percentage)
+        tol (float): Relative tolerance
+        max_iter (int): Maximum iterations per bond
+    
+    Returns:
+        RootResult: Annual yields (as percentage), iteration counts and
+        convergence flags; bonds priced outside the searched range are not converged
+    
+    Raises:
+        ValueError: If any bond or price is invalid
+    """
+    shape, (face, coupon_rate, years, frequency, compound_frequency), (prices,) = _bond_inputs(
+        face, coupon_rate, years, frequency, compound_frequency, prices)
+    if np.any(prices <= 0):
+        raise ValueError("Bond prices must be positive")
+    
+    cash_flows, times = _cash_flow_table(face, coupon_rate, years, frequency)
+    
+    def residual(rate, rows):
+        delta, d_delta, _ = _discount_rates(rate * 100, frequency[rows], compound_frequency[rows], continuous)
+        price, first, _ = _discounted_moments(cash_flows[rows], times[rows], delta)
+        return price - prices[rows], -d_delta * first
+    
+    size = prices.size
+    result = newton_bisect(residual, np.full(size, lower / 100),
+                           np.full(size, upper / 100), initial=face * coupon_rate / 100 / prices,
+                           tol=tol, max_iter=max_iter)
+    return RootResult((result.root * 100).reshape(shape), result.iterations.reshape(shape),
+                      result.converged.reshape(shape))
@@ -5,10 +5,23 @@ Contains simple financial calculation methods for testing demonstration.
 
 import math
 
+from finance_calculator.curve import YieldCurve
+from finance_calculator.growth import default_growth_cache
+
 
 class FinanceCalculator:
     """Main calculator class with basic financial operations."""
     
+    def __init__(self, growth_cache=None):
+        """
+        Create a calculator.
+        
+        Args:
+            growth_cache (GrowthFactorCache): Cache for (1 + r) ** n factors
+                (defaults to the cache shared by all calculators)
+        """
+        self.growth_cache = growth_cache if growth_cache is not None else default_growth_cache
+    
     def calculate_simple_interest(self, principal, rate, time):
         """
         Calculate simple interest.
@@ -26,24 +39,35 @@ class FinanceCalculator:
         
         return (principal * rate * time) / 100
     
-    def calculate_compound_interest(self, principal, rate, time, compound_frequency=1):
+    def calculate_compound_interest(self, principal, rate, time, compound_frequency=1, continuous=False):
         """
         Calculate compound interest.
         
         Args:
             principal (float): Principal amount
-            rate (float): Annual interest rate (as percentage)
+            rate (float or YieldCurve): Annual interest rate (as percentage),
+                or a curve to grow the principal along
             time (float): Time period in years
             compound_frequency (int): How many times interest compounds per year
+                (math.inf for continuous compounding; ignored for a curve)
+            continuous (bool): Compound continuously (ignores compound_frequency)
             
         Returns:
             float: Final amount after compound interest
         """
-        if principal < 0 or rate < 0 or time < 0 or compound_frequency <= 0:
+        curve = isinstance(rate, YieldCurve)
+        if principal < 0 or (not curve and rate < 0) or time < 0 or compound_frequency <= 0:
             raise ValueError("Invalid input values")
         
+        if curve:
+            return round(principal * float(rate.growth_factors(time)), 2)
+        
         rate_decimal = rate / 100
-        amount = principal * (1 + rate_decimal / compound_frequency) ** (compound_frequency * time)
+        if continuous or math.isinf(compound_frequency):
+            return round(principal * math.exp(rate_decimal * time), 2)
+        
+        amount = principal * self.growth_cache.growth_factor(rate_decimal / compound_frequency,
+                                                             compound_frequency * time)
         return round(amount, 2)
     
     def calculate_monthly_payment(self, loan_amount, annual_rate, years):
@@ -52,23 +76,28 @@ class FinanceCalculator:
         
         Args:
             loan_amount (float): Total loan amount
-            annual_rate (float): Annual interest rate (as percentage)
+            annual_rate (float or YieldCurve): Annual interest rate (as
+                percentage), or a curve to discount the payments off
             years (int): Loan term in years
             
         Returns:
             float: Monthly payment amount
         """
-        if loan_amount <= 0 or annual_rate < 0 or years <= 0:
+        curve = isinstance(annual_rate, YieldCurve)
+        if loan_amount <= 0 or (not curve and annual_rate < 0) or years <= 0:
             raise ValueError("Invalid loan parameters")
         
+        if curve:
+            return round(float(annual_rate.monthly_payment(loan_amount, years)), 2)
+        
         if annual_rate == 0:
             return loan_amount / (years * 12)
         
         monthly_rate = annual_rate / 100 / 12
         num_payments = years * 12
         
-        monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / \
-                         ((1 + monthly_rate) ** num_payments - 1)
+        growth = self.growth_cache.growth_factor(monthly_rate, num_payments)
+        monthly_payment = loan_amount * (monthly_rate * growth) / (growth - 1)
         
         return round(monthly_payment, 2)
     
@@ -79,14 +108,22 @@ class FinanceCalculator:
         Args:
             target_amount (float): Target savings amount
             monthly_contribution (float): Monthly savings contribution
-            annual_rate (float): Annual interest rate (as percentage)
+            annual_rate (float or YieldCurve): Annual interest rate (as
+                percentage), or a curve whose forward rates the savings earn
             
         Returns:
             float: Time in years to reach the goal
         """
-        if target_amount <= 0 or monthly_contribution <= 0 or annual_rate < 0:
+        curve = isinstance(annual_rate, YieldCurve)
+        if target_amount <= 0 or monthly_contribution <= 0 or (not curve and annual_rate < 0):
             raise ValueError("Invalid savings parameters")
         
+        if curve:
+            years = float(annual_rate.years_to_goal(target_amount, monthly_contribution))
+            if math.isnan(years):
+                raise ValueError("Savings goal is not reached on this curve")
+            return round(years, 2)
+        
         if annual_rate == 0:
             return target_amount / (monthly_contribution * 12)
         
@@ -99,3 +136,21 @@ class FinanceCalculator:
             return round(months / 12, 2)
         
         return target_amount / (monthly_contribution * 12)
+    
+    def amortization_schedule(self, loan_amount, annual_rate, years):
+        """
+        Get a lazily evaluated amortization schedule for a monthly loan.
+        
+        Args:
+            loan_amount (float): Total loan amount
+            annual_rate (float or YieldCurve): Annual interest rate (as
+                percentage), or a curve to discount the payments off
+            years (int): Loan term in years
+        
+        Returns:
+            AmortizationSchedule: Read-only sequence of schedule rows
+        """
+        # Imported here because the amortization module builds on this class
+        from finance_calculator.amortization import AmortizationSchedule
+        
+        return AmortizationSchedule(loan_amount, annual_rate, years, calculator=self)
@@ -0,0 +1,70 @@
+"""
+Numerically stable compounding for the Personal Finance Calculator.
+Evaluates (1 + r/n)^(n t) as exp(n t log1p(r/n)) so daily, per-second or
+continuous compounding over long horizons keeps full float precision.
+"""
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+
+
+def log_growth(rate, time, compound_frequency=1, continuous=False):
+    """
+    Calculate the log of the compound growth factor.
+    
+    Args:
+        rate (array-like): Annual interest rates (as percentage)
+        time (array-like): Time periods in years
+        compound_frequency (array-like): Compounding periods per year;
+            numpy.inf means continuous compounding
+        continuous (bool): Compound continuously regardless of frequency
+    
+    Returns:
+        numpy.ndarray: n t log1p(r / n), or r t for continuous compounding
+    """
+    rate, time, compound_frequency = broadcast_inputs(rate, time, compound_frequency)
+    rate_decimal = rate / 100
+    if continuous:
+        return rate_decimal * time
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discrete = compound_frequency * time * np.log1p(rate_decimal / compound_frequency)
+    return np.where(np.isinf(compound_frequency), rate_decimal * time, discrete)
+
+
+def compound_growth(rate, time, compound_frequency=1, continuous=False):
+    """
+    Calculate the compound growth factor (1 + r/n)^(n t) or e^(r t).
+    
+    Args:
+        rate (array-like): Annual interest rates (as percentage)
+        time (array-like): Time periods in years
+        compound_frequency (array-like): Compounding periods per year
+        continuous (bool): Compound continuously regardless of frequency
+    
+    Returns:
+        numpy.ndarray: Growth factors
+    """
+    return np.exp(log_growth(rate, time, compound_frequency, continuous))
+
+
+def compound_interest_earned(principal, rate, time, compound_frequency=1, continuous=False):
+    """
+    Calculate the interest earned, principal ((1 + r/n)^(n t) - 1).
+    
+    Uses expm1 so tiny rates or short horizons do not lose precision to
+    the cancellation in amount - principal.
+    
+    Args:
+        principal (array-like): Principal amounts
+        rate (array-like): Annual interest rates (as percentage)
+        time (array-like): Time periods in years
+        compound_frequency (array-like): Compounding periods per year
+        continuous (bool): Compound continuously regardless of frequency
+    
+    Returns:
+        numpy.ndarray: Interest earned (unrounded)
+    """
+    return np.asarray(principal, dtype=np.float64) * \
+        np.expm1(log_growth(rate, time, compound_frequency, continuous))
@@ -0,0 +1,259 @@
+"""
+Term-structure curves for the Personal Finance Calculator.
+Discounts cash flows off a yield curve built from pillar zero rates or
+discount factors, so calculators can use a curve instead of a flat rate.
+"""
+
+import numpy as np
+
+from finance_calculator.batch import as_float_array
+from finance_calculator.compounding import log_growth
+
+
+def _annual_rate(log_growth_per_year, compound_frequency, continuous):
+    """Convert log growth per year to an annual percentage rate."""
+    if continuous or np.isinf(compound_frequency):
+        return 100 * log_growth_per_year
+    return 100 * compound_frequency * np.expm1(log_growth_per_year / compound_frequency)
+
+
+class YieldCurve:
+    """
+    Discount curve interpolated log-linearly in discount factors.
+    
+    Between pillars the log discount factor is linear in time (piecewise
+    constant forward rates), and the last forward rate is extended beyond
+    the final pillar. Knots, log discount factors and slopes are computed
+    once, so valuing any array of times is a search and a multiply-add.
+    """
+    
+    def __init__(self, times, zero_rates, compound_frequency=1, continuous=False):
+        """
+        Build a curve from pillar zero rates.
+        
+        Args:
+            times (array-like): Pillar times in years, positive and increasing
+            zero_rates (array-like): Zero rate at each pillar (as percentage)
+            compound_frequency (float): Compounding periods per year of the
+                zero rates; numpy.inf means continuous
+            continuous (bool): Zero rates are continuously compounded
+        
+        Raises:
+            ValueError: If the pillars are invalid
+        """
+        times, zero_rates = as_float_array(times).ravel(), as_float_array(zero_rates).ravel()
+        if times.size == 0 or times.size != zero_rates.size or compound_frequency <= 0 \
+                or np.any(~np.isfinite(times)) or times[0] <= 0 or np.any(np.diff(times) <= 0):
+            raise ValueError("Curve pillars must be positive, increasing times with one rate each")
+        if not continuous and np.isfinite(compound_frequency) \
+                and np.any(1 + zero_rates / 100 / compound_frequency <= 0):
+            raise ValueError("Zero rates are below the compounding limit")
+        
+        self.times = times
+        self._knots = np.concatenate(([0.0], times))
+        pillar_log_discount = -log_growth(zero_rates, times, compound_frequency, continuous)
+        self._log_discount = np.concatenate(([0.0], pillar_log_discount))
+        self._slopes = np.diff(self._log_discount) / np.diff(self._knots)
+        self._monthly = np.ones(1)
+        for values in (self.times, self._knots, self._log_discount, self._slopes):
+            values.flags.writeable = False
+    
+    @classmethod
+    def from_discount_factors(cls, times, discount_factors):
+        """
+        Build a curve from pillar discount factors.
+        
+        Args:
+            times (array-like): Pillar times in years, positive and increasing
+            discount_factors (array-like): Discount factor at each pillar
+        
+        Returns:
+            YieldCurve: The curve
+        
+        Raises:
+            ValueError: If the pillars are invalid
+        """
+        times, discount_factors = as_float_array(times), as_float_array(discount_factors)
+        if np.any(discount_factors <= 0):
+            raise ValueError("Discount factors must be positive")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            zero_rates = -100 * np.log(discount_factors) / times
+        return cls(times, zero_rates, continuous=True)
+    
+    def _segments(self, times):
+        """Interpolation segment of each time (the last one extends past the curve)."""
+        return np.clip(np.searchsorted(self._knots, times, side='right') - 1, 0, self._slopes.size - 1)
+    
+    def log_discount_factors(self, times):
+        """
+        Calculate log discount factors.
+        
+        Args:
+            times (array-like): Times in years
+        
+        Returns:
+            numpy.ndarray: log P(0, t)
+        
+        Raises:
+            ValueError: If a time is negative
+        """
+        times = as_float_array(times)
+        if np.any(times < 0):
+            raise ValueError("Times must be non-negative")
+        segment = self._segments(times)
+        return self._log_discount[segment] + self._slopes[segment] * (times - self._knots[segment])
+    
+    def discount_factors(self, times):
+        """
+        Calculate discount factors P(0, t).
+        
+        Args:
+            times (array-like): Times in years
+        
+        Returns:
+            numpy.ndarray: Discount factors
+        """
+        return np.exp(self.log_discount_factors(times))
+    
+    def zero_rates(self, times, compound_frequency=1, continuous=False):
+        """
+        Calculate zero rates, with the instantaneous forward rate at time 0.
+        
+        Args:
+            times (array-like): Times in years
+            compound_frequency (float): Compounding periods per year of the result
+            continuous (bool): Return continuously compounded rates
+        
+        Returns:
+            numpy.ndarray: Zero rates (as percentage)
+        """
+        times = as_float_array(times)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(times > 0, -self.log_discount_factors(times) / times, -self._slopes[0])
+        return _annual_rate(growth, compound_frequency, continuous)
+    
+    def forward_rates(self, start, end, compound_frequency=1, continuous=False):
+        """
+        Calculate forward rates between two times.
+        
+        Where start equals end the instantaneous forward rate is returned.
+        
+        Args:
+            start (array-like): Forward period start times in years
+            end (array-like): Forward period end times in years
+            compound_frequency (float): Compounding periods per year of the result
+            continuous (bool): Return continuously compounded rates
+        
+        Returns:
+            numpy.ndarray: Forward rates (as percentage)
+        
+        Raises:
+            ValueError: If a period ends before it starts
+        """
+        start, end = np.broadcast_arrays(as_float_array(start), as_float_array(end))
+        if np.any(end < start):
+            raise ValueError("Forward periods must not end before they start")
+        span = end - start
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(
+                span > 0,
+                (self.log_discount_factors(start) - self.log_discount_factors(end)) / span,
+                -self._slopes[self._segments(start)],
+            )
+        return _annual_rate(growth, compound_frequency, continuous)
+    
+    def monthly_discount_factors(self, months):
+        """
+        Get discount factors at every month end from 0 up to months.
+        
+        The grid is cached on the curve and only extended when a longer
+        horizon is requested.
+        
+        Args:
+            months (int): Last month needed
+        
+        Returns:
+            numpy.ndarray: Discount factors for months 0, 1, ..., months
+        """
+        if months >= self._monthly.size:
+            self._monthly = self.discount_factors(np.arange(max(months + 1, 2 * self._monthly.size)) / 12)
+            self._monthly.flags.writeable = False
+        return self._monthly[:months + 1]
+    
+    def growth_factors(self, times):
+        """
+        Calculate the growth of 1 invested from time 0 to each time.
+        
+        Args:
+            times (array-like): Times in years
+        
+        Returns:
+            numpy.ndarray: 1 / P(0, t)
+        """
+        return np.exp(-self.log_discount_factors(times))
+    
+    def monthly_payment(self, loan_amounts, years):
+        """
+        Calculate level monthly payments whose discounted value is the loan.
+        
+        Args:
+            loan_amounts (array-like): Loan amounts
+            years (array-like): Loan terms in years (rounded to whole months)
+        
+        Returns:
+            numpy.ndarray: Monthly payments (unrounded)
+        """
+        loan_amounts, years = np.broadcast_arrays(as_float_array(loan_amounts), as_float_array(years))
+        num_payments = np.maximum(np.round(years * 12), 1).astype(np.int64)
+        annuity = np.cumsum(self.monthly_discount_factors(int(num_payments.max(initial=1))))
+        return loan_amounts / (annuity[num_payments] - 1)
+    
+    def years_to_goal(self, target_amounts, monthly_contributions, max_years=1000):
+        """
+        Calculate the time for end-of-month contributions to reach a target.
+        
+        Balances are built month by month at the curve's forward rates. Inside
+        the crossing month the rate is constant, so the fractional month is
+        solved in closed form; on a flat monthly-compounded curve this gives
+        the same result as the flat-rate savings goal formula.
+        
+        Args:
+            target_amounts (array-like): Target savings amounts
+            monthly_contributions (array-like): Monthly savings contributions
+            max_years (int): Longest horizon searched
+        
+        Returns:
+            numpy.ndarray: Years to reach each target (NaN if not reached)
+        """
+        target_amounts, monthly_contributions = np.broadcast_arrays(
+            as_float_array(target_amounts), as_float_array(monthly_contributions))
+        discount = self.monthly_discount_factors(int(max_years * 12))
+        # Balance after month m per unit contribution: sum_{k<=m} P_k / P_m
+        balance = np.concatenate(([0.0], np.cumsum(discount[1:]) / discount[1:]))
+        target = target_amounts / monthly_contributions
+        
+        # First month whose balance reaches the target
+        month = np.searchsorted(np.maximum.accumulate(balance), target, side='left')
+        reached = month < balance.size
+        month = np.clip(month, 1, balance.size - 1)
+        start = balance[month - 1]
+        growth = discount[month - 1] / discount[month]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            annuity = 1 / (growth - 1)
+            fraction = np.where(growth == 1, target - start,
+                                np.log((target + annuity) / (start + annuity)) / np.log(growth))
+        return np.where(reached, (month - 1 + fraction) / 12, np.nan)
+
+
+def require_flat_rates(rates):
+    """
+    Reject a curve passed where only flat annual rates are supported.
+    
+    Args:
+        rates: Rate argument to check
+    
+    Raises:
+        ValueError: If rates is a YieldCurve
+    """
+    if isinstance(rates, YieldCurve):
+        raise ValueError("Only flat annual rates are supported here, not a YieldCurve")
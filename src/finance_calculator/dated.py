@@ -0,0 +1,116 @@
+"""
+Dated cash flows for the Personal Finance Calculator.
+Values irregularly dated cash-flow streams (XNPV) and solves their internal
+rate of return (XIRR) over ragged rows, discounting by ACT/365 year fractions.
+"""
+
+import numpy as np
+
+from finance_calculator.irr import as_ragged, npv_ragged, ragged_positions
+from finance_calculator.rootfinding import RootResult, newton_bisect
+
+
+DAYS_PER_YEAR = 365
+
+
+def as_dated_ragged(cash_flows, dates, offsets=None):
+    """
+    Normalize dated cash flows to the ragged layout with year fractions.
+    
+    Each flow is timed in years from the first date of its row, counting
+    actual days over 365 as spreadsheet XNPV/XIRR do. In the matrix layout
+    padding is NaN in the values and NaT in the dates.
+    
+    Args:
+        cash_flows (array-like): 2D matrix or flat ragged values (see as_ragged)
+        dates (array-like): numpy.datetime64 dates with the same layout
+        offsets (array-like): Ragged row offsets (optional)
+    
+    Returns:
+        tuple: (values, offsets, times in years) flat arrays
+    
+    Raises:
+        ValueError: If the layout is inconsistent or a date precedes the
+            first date of its row
+    """
+    values, offsets = as_ragged(cash_flows, offsets)
+    dates = np.asarray(dates)
+    if not np.issubdtype(dates.dtype, np.datetime64):
+        raise ValueError("Dates must be numpy.datetime64 values")
+    dates = dates.astype('datetime64[D]').ravel()
+    if dates.size != values.size:
+        raise ValueError("Dates must match the cash flows")
+    
+    missing = np.isnat(dates)
+    values = np.where(missing, 0.0, values)
+    days = dates.astype(np.int64)
+    owner, _ = ragged_positions(offsets)
+    first = days[offsets[:-1][owner]]
+    starts = offsets[:-1][np.diff(offsets) > 0]
+    if np.any(missing[starts]) or np.any((days < first) & ~missing):
+        raise ValueError("Every row must start at its earliest date")
+    
+    times = np.where(missing, 0, days - first) / DAYS_PER_YEAR
+    return values, offsets, times
+
+
+def xnpv(annual_rates, cash_flows, dates, offsets=None):
+    """
+    Calculate the net present value of irregularly dated cash-flow streams.
+    
+    Args:
+        annual_rates (array-like): Annual effective discount rate per row (as percentage)
+        cash_flows (array-like): 2D matrix or flat ragged values (see as_ragged)
+        dates (array-like): numpy.datetime64 date of every cash flow
+        offsets (array-like): Ragged row offsets (optional)
+    
+    Returns:
+        numpy.ndarray: Net present value at each row's first date
+    
+    Raises:
+        ValueError: If a rate is not above -100% or the layout is invalid
+    """
+    values, offsets, times = as_dated_ragged(cash_flows, dates, offsets)
+    annual_rates = np.asarray(annual_rates, dtype=np.float64)
+    if np.any(annual_rates <= -100):
+        raise ValueError("Discount rates must be greater than -100%")
+    
+    rows = np.arange(offsets.size - 1)
+    npv, _ = npv_ragged(np.broadcast_to(annual_rates / 100, rows.shape), values, offsets, rows,
+                        times=times)
+    return npv
+
+
+def xirr(cash_flows, dates, offsets=None, lower=-99, upper=1000, tol=1e-12, max_iter=100):
+    """
+    Calculate the internal rate of return of irregularly dated streams.
+    
+    Every row is solved together with the safeguarded Newton method,
+    discounting each flow by its own year fraction.
+    
+    Args:
+        cash_flows (array-like): 2D matrix or flat ragged values (see as_ragged)
+        dates (array-like): numpy.datetime64 date of every cash flow
+        offsets (array-like): Ragged row offsets (optional)
+        lower (float): Lowest annual rate searched (as percentage)
+        upper (float): Highest annual rate searched (as percentage)
+        tol (float): Relative tolerance
+        max_iter (int): Maximum iterations per row
+    
+    Returns:
+        RootResult: Annual effective IRR (as percentage), iteration counts and
+        convergence flags; rows without a sign change in the NPV are not converged
+    
+    Raises:
+        ValueError: If the layout is invalid
+    """
+    values, offsets, times = as_dated_ragged(cash_flows, dates, offsets)
+    num_rows = offsets.size - 1
+    positions = ragged_positions(offsets)
+    
+    def residual(annual_rate, rows):
+        return npv_ragged(annual_rate, values, offsets, rows, positions, times)
+    
+    result = newton_bisect(residual, np.full(num_rows, lower / 100), np.full(num_rows, upper / 100),
+                           initial=0.1, tol=tol, max_iter=max_iter)
+    return RootResult(result.root * 100, result.iterations, result.converged)
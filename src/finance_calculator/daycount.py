@@ -0,0 +1,239 @@
+"""
+Day counts and business-day calendars for the Personal Finance Calculator.
+Turns numpy.datetime64 dates into year fractions (Actual/360, Actual/365,
+30/360) and rolls them onto business days through precomputed lookup tables.
+"""
+
+import numpy as np
+
+from finance_calculator.batch import as_float_array
+
+
+DAY_COUNT_CONVENTIONS = ('act/360', 'act/365', '30/360')
+
+ROLL_CONVENTIONS = ('following', 'modified_following', 'preceding', 'modified_preceding')
+
+
+def as_dates(dates):
+    """
+    Convert dates to a numpy.datetime64[D] array.
+    
+    Args:
+        dates (array-like): numpy.datetime64 values, datetime.date objects or
+            ISO date strings
+    
+    Returns:
+        numpy.ndarray: Dates at day resolution
+    
+    Raises:
+        ValueError: If the values are not dates
+    """
+    dates = np.asarray(dates)
+    if dates.size == 0:
+        return dates.astype('datetime64[D]')
+    if dates.dtype.kind not in 'MUSO':
+        raise ValueError("Dates must be numpy.datetime64 values, date objects or ISO date strings")
+    return dates.astype('datetime64[D]')
+
+
+def _date_parts(dates):
+    """Split day-resolution dates into year, month (1-12) and day of month."""
+    months = dates.astype('datetime64[M]')
+    years = months.astype('datetime64[Y]')
+    return (years.astype(np.int64) + 1970, (months - years).astype(np.int64) + 1,
+            (dates - months).astype(np.int64) + 1)
+
+
+def day_count(start, end, convention='act/365'):
+    """
+    Count the days between two dates under a day-count convention.
+    
+    30/360 is the US bond basis: a start on the 31st counts as the 30th,
+    and so does an end on the 31st when the start is the 30th or 31st.
+    
+    Args:
+        start (array-like): Start dates
+        end (array-like): End dates
+        convention (str): 'act/360', 'act/365' or '30/360'
+    
+    Returns:
+        numpy.ndarray: Day counts (negative when end is before start)
+    
+    Raises:
+        ValueError: If the convention is unknown
+    """
+    if convention not in DAY_COUNT_CONVENTIONS:
+        raise ValueError(f"Unknown day-count convention: {convention}")
+    start, end = np.broadcast_arrays(as_dates(start), as_dates(end))
+    if convention != '30/360':
+        return (end - start).astype(np.int64)
+    
+    start_year, start_month, start_day = _date_parts(start)
+    end_year, end_month, end_day = _date_parts(end)
+    start_day = np.minimum(start_day, 30)
+    end_day = np.where(start_day == 30, np.minimum(end_day, 30), end_day)
+    return 360 * (end_year - start_year) + 30 * (end_month - start_month) + end_day - start_day
+
+
+def year_fraction(start, end, convention='act/365'):
+    """
+    Calculate the accrual period between two dates in years.
+    
+    Args:
+        start (array-like): Start dates
+        end (array-like): End dates
+        convention (str): 'act/360', 'act/365' or '30/360'
+    
+    Returns:
+        numpy.ndarray: Year fractions
+    
+    Raises:
+        ValueError: If the convention is unknown
+    """
+    days_per_year = 365 if convention == 'act/365' else 360
+    return day_count(start, end, convention) / days_per_year
+
+
+def accrued_simple_interest(principal, rate, start, end, convention='act/365'):
+    """
+    Calculate simple interest accrued between two dates.
+    
+    The dated counterpart of calculate_simple_interest: the time in years
+    is the year fraction of the accrual period under the convention.
+    
+    Args:
+        principal (array-like): Principal amounts
+        rate (array-like): Annual interest rates (as percentage)
+        start (array-like): Accrual start dates
+        end (array-like): Accrual end dates
+        convention (str): 'act/360', 'act/365' or '30/360'
+    
+    Returns:
+        numpy.ndarray: Accrued interest (unrounded)
+    
+    Raises:
+        ValueError: If a value is negative, an accrual period ends before it
+            starts or the convention is unknown
+    """
+    principal, rate = as_float_array(principal), as_float_array(rate)
+    time = year_fraction(start, end, convention)
+    if np.any(principal < 0) or np.any(rate < 0) or np.any(time < 0):
+        raise ValueError("Values must be non-negative")
+    return principal * rate * time / 100
+
+
+class BusinessCalendar:
+    """
+    Business days over a range of years, with holidays stored as bitsets.
+    
+    Each year is one row of packed bits (bit d set when day d of the year is
+    a business day). Rolling a date uses tables built once from the bits:
+    the nearest business day on or after, and on or before, every day of
+    the range, so adjusting any number of dates is a single gather.
+    """
+    
+    def __init__(self, holidays=(), weekend=(5, 6), first_year=1970, last_year=2100):
+        """
+        Create a business-day calendar.
+        
+        Args:
+            holidays (array-like): Non-business dates besides weekends
+            weekend (tuple): Weekend days of the week (Monday is 0)
+            first_year (int): First year covered
+            last_year (int): Last year covered
+        
+        Raises:
+            ValueError: If the year range or weekend days are invalid
+        """
+        if last_year < first_year or not set(weekend) <= set(range(7)) or len(set(weekend)) == 7:
+            raise ValueError("Invalid calendar range or weekend")
+        
+        self.first_year = first_year
+        self.last_year = last_year
+        self._origin = np.datetime64(f'{first_year:04d}-01-01', 'D')
+        end = np.datetime64(f'{last_year + 1:04d}-01-01', 'D')
+        num_days = int((end - self._origin).astype(np.int64))
+        
+        # 1970-01-01 was a Thursday
+        day = np.arange(num_days)
+        weekday = (day + self._origin.astype(np.int64) + 3) % 7
+        business = ~np.isin(weekday, weekend)
+        holidays = as_dates(holidays).ravel()
+        holidays = holidays[(holidays >= self._origin) & (holidays < end)]
+        business[(holidays - self._origin).astype(np.int64)] = False
+        
+        year_starts = ((np.arange(first_year, last_year + 2) - 1970).astype('datetime64[Y]')
+                       .astype('datetime64[D]') - self._origin).astype(np.int64)
+        self._year_starts = year_starts[:-1]
+        year = np.repeat(np.arange(year_starts.size - 1), np.diff(year_starts))
+        by_year = np.zeros((year_starts.size - 1, 366), dtype=bool)
+        by_year[year, day - self._year_starts[year]] = business
+        self.bitsets = np.packbits(by_year, axis=1)
+        self._year_of_day = year
+        self._month_of_day = (self._origin + day).astype('datetime64[M]').astype(np.int64)
+        
+        # Nearest business day on or after / on or before each day (-1 or
+        # num_days where the range has none)
+        self._following = np.minimum.accumulate(np.where(business, day, num_days)[::-1])[::-1]
+        self._preceding = np.maximum.accumulate(np.where(business, day, -1))
+        self._num_days = num_days
+    
+    def _day_index(self, dates):
+        """Offsets of dates from the start of the calendar, checking the range."""
+        index = (as_dates(dates) - self._origin).astype(np.int64)
+        if np.any(index < 0) or np.any(index >= self._num_days):
+            raise ValueError(f"Dates must fall within {self.first_year}-{self.last_year}")
+        return index
+    
+    def is_business_day(self, dates):
+        """
+        Check whether dates are business days.
+        
+        Args:
+            dates (array-like): Dates to check
+        
+        Returns:
+            numpy.ndarray: Boolean flags
+        
+        Raises:
+            ValueError: If a date is outside the calendar range
+        """
+        index = self._day_index(dates)
+        year = self._year_of_day[index]
+        day_of_year = index - self._year_starts[year]
+        return (self.bitsets[year, day_of_year >> 3] >> (7 - (day_of_year & 7))) & 1 == 1
+    
+    def adjust(self, dates, roll='following'):
+        """
+        Roll dates that fall on non-business days.
+        
+        Modified rolls go the other way when the plain roll would leave the
+        calendar month.
+        
+        Args:
+            dates (array-like): Dates to adjust
+            roll (str): 'following', 'modified_following', 'preceding' or
+                'modified_preceding'
+        
+        Returns:
+            numpy.ndarray: Adjusted numpy.datetime64[D] dates
+        
+        Raises:
+            ValueError: If the roll is unknown or a date, or its adjusted
+                date, is outside the calendar range
+        """
+        if roll not in ROLL_CONVENTIONS:
+            raise ValueError(f"Unknown business-day roll: {roll}")
+        index = self._day_index(dates)
+        forward, backward = self._following[index], self._preceding[index]
+        if roll.endswith('following'):
+            adjusted, other = forward, backward
+        else:
+            adjusted, other = backward, forward
+        if roll.startswith('modified'):
+            outside = (adjusted < 0) | (adjusted >= self._num_days)
+            month = self._month_of_day[np.clip(adjusted, 0, self._num_days - 1)]
+            adjusted = np.where(outside | (month != self._month_of_day[index]), other, adjusted)
+        if np.any(adjusted < 0) or np.any(adjusted >= self._num_days):
+            raise ValueError("No business day within the calendar range to roll to")
+        return self._origin + adjusted
@@ -0,0 +1,193 @@
+"""
+Multi-debt payoff planning for the Personal Finance Calculator.
+Simulates snowball and avalanche payoff orders by jumping from one payoff
+event to the next instead of stepping through every month.
+"""
+
+import heapq
+import math
+from collections import namedtuple
+
+import numpy as np
+
+
+Debt = namedtuple('Debt', ['balance', 'annual_rate', 'minimum_payment'])
+Debt.__doc__ = """
+One debt in a payoff plan.
+
+Attributes:
+    balance (float): Current balance
+    annual_rate (float): Annual interest rate (as percentage)
+    minimum_payment (float): Required monthly payment
+"""
+
+DebtPlan = namedtuple('DebtPlan', ['order', 'payoff_months', 'interest', 'months', 'total_interest'])
+DebtPlan.__doc__ = """
+Result of a multi-debt payoff plan.
+
+Attributes:
+    order (tuple): Debt indices in the order they are targeted
+    payoff_months (tuple): Month in which each debt is paid off (math.inf if never)
+    interest (tuple): Interest paid on each debt
+    months (float): Months until every debt is paid off
+    total_interest (float): Interest paid across all debts
+"""
+
+PlanSummary = namedtuple('PlanSummary', ['months', 'total_interest'])
+PlanSummary.__doc__ = """
+Per-household results of a batch of payoff plans.
+
+Attributes:
+    months (numpy.ndarray): Months until each household is debt free
+    total_interest (numpy.ndarray): Total interest per household
+"""
+
+STRATEGIES = {
+    # Smallest balance first, highest rate breaking ties
+    'snowball': lambda debt: (debt.balance, -debt.annual_rate),
+    # Highest rate first, smallest balance breaking ties
+    'avalanche': lambda debt: (-debt.annual_rate, debt.balance),
+}
+
+
+def _months_to_payoff(balance, monthly_rate, payment):
+    """Number of level payments needed to clear a balance (math.inf if never)."""
+    if balance <= 0:
+        return 0
+    if monthly_rate == 0:
+        return math.ceil(balance / payment - 1e-9)
+    if payment <= balance * monthly_rate:
+        return math.inf
+    return math.ceil(-math.log1p(-monthly_rate * balance / payment) / math.log1p(monthly_rate) - 1e-9)
+
+
+def _balance_after(balance, monthly_rate, payment, months):
+    """Balance after a number of level payments."""
+    if monthly_rate == 0:
+        return balance - payment * months
+    log_growth = months * math.log1p(monthly_rate)
+    return balance * math.exp(log_growth) - payment * math.expm1(log_growth) / monthly_rate
+
+
+def plan_payoff(debts, monthly_budget, strategy='avalanche'):
+    """
+    Simulate paying off several debts with a fixed monthly budget.
+    
+    Every debt receives its minimum payment and the rest of the budget goes
+    to the first unpaid debt in strategy order. When a debt is paid off its
+    whole payment rolls over to the current target from the next month on.
+    Between payoff events every payment is level, so balances move in
+    closed form and a heap of scheduled payoff months drives the
+    simulation; the cost grows with the number of debts, not of months.
+    
+    Args:
+        debts (list): Debts as Debt tuples or (balance, annual_rate,
+            minimum_payment) sequences
+        monthly_budget (float): Total paid towards all debts each month
+        strategy (str): 'avalanche' or 'snowball'
+    
+    Returns:
+        DebtPlan: Targeting order, payoff month and interest per debt, and totals
+    
+    Raises:
+        ValueError: If the strategy is unknown, a debt is invalid or the
+            budget does not cover the minimum payments
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    debts = [Debt(*debt) for debt in debts]
+    for debt in debts:
+        if debt.balance < 0 or debt.annual_rate < 0 or debt.minimum_payment <= 0:
+            raise ValueError("Invalid debt parameters")
+    if monthly_budget < sum(debt.minimum_payment for debt in debts if debt.balance > 0):
+        raise ValueError("Monthly budget must cover the minimum payments")
+    
+    num_debts = len(debts)
+    order = sorted(range(num_debts), key=lambda index: STRATEGIES[strategy](debts[index]))
+    rates = [debt.annual_rate / 100 / 12 for debt in debts]
+    balance = [float(debt.balance) for debt in debts]
+    payment = [float(debt.minimum_payment) for debt in debts]
+    since = [0] * num_debts
+    due = [0] * num_debts
+    interest = [0.0] * num_debts
+    paid = [debt.balance <= 0 for debt in debts]
+    
+    target = 0
+    while target < num_debts and paid[order[target]]:
+        target += 1
+    if target < num_debts:
+        payment[order[target]] += monthly_budget - sum(payment[index] for index in range(num_debts)
+                                                      if not paid[index])
+    
+    heap = []
+    for index in range(num_debts):
+        if not paid[index]:
+            due[index] = _months_to_payoff(balance[index], rates[index], payment[index])
+            heap.append((due[index], index))
+    heapq.heapify(heap)
+    
+    pending = 0.0
+    while heap:
+        month, index = heapq.heappop(heap)
+        if month != due[index] or paid[index]:
+            continue  # Superseded by a rescheduled event
+        if month == math.inf:
+            break
+        
+        # Settle the debt: level payments, then a final partial payment
+        rate = rates[index]
+        remaining = _balance_after(balance[index], rate, payment[index], month - since[index] - 1)
+        interest[index] += payment[index] * (month - since[index] - 1) + remaining * (1 + rate) \
+            - balance[index]
+        paid[index] = True
+        pending += payment[index]
+        
+        while target < num_debts and paid[order[target]]:
+            target += 1
+        if target == num_debts:
+            break
+        focus = order[target]
+        if due[focus] == month:
+            continue  # The target also pays off this month and passes everything on
+        
+        # Bring the target up to date and give it the freed payments
+        elapsed = month - since[focus]
+        updated = _balance_after(balance[focus], rates[focus], payment[focus], elapsed)
+        interest[focus] += payment[focus] * elapsed - (balance[focus] - updated)
+        balance[focus] = updated
+        since[focus] = month
+        payment[focus] += pending
+        pending = 0.0
+        due[focus] = month + _months_to_payoff(updated, rates[focus], payment[focus])
+        heapq.heappush(heap, (due[focus], focus))
+    
+    payoff_months = tuple(due[index] if paid[index] else math.inf for index in range(num_debts))
+    interest = tuple(interest[index] if paid[index] else math.inf for index in range(num_debts))
+    return DebtPlan(tuple(order), payoff_months, interest, max(payoff_months, default=0),
+                    sum(interest))
+
+
+def batch_plan_payoff(households, monthly_budgets, strategy='avalanche'):
+    """
+    Evaluate a payoff strategy for many households.
+    
+    Args:
+        households (iterable): One list of debts per household (see plan_payoff)
+        monthly_budgets (array-like): Monthly budget per household
+        strategy (str): 'avalanche' or 'snowball'
+    
+    Returns:
+        PlanSummary: Months to debt free and total interest per household
+    
+    Raises:
+        ValueError: If any household plan is invalid
+    """
+    households = list(households)
+    monthly_budgets = np.broadcast_to(np.asarray(monthly_budgets, dtype=np.float64), (len(households),))
+    months = np.empty(len(households))
+    total_interest = np.empty(len(households))
+    for index, (debts, budget) in enumerate(zip(households, monthly_budgets)):
+        plan = plan_payoff(debts, float(budget), strategy)
+        months[index] = plan.months
+        total_interest[index] = plan.total_interest
+    return PlanSummary(months, total_interest)
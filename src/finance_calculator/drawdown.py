@@ -0,0 +1,188 @@
+"""
+Retirement drawdown simulation for the Personal Finance Calculator.
+Block-bootstraps historical monthly returns from a local CSV file to test
+whether withdrawal plans survive, for many plans and paths at once.
+"""
+
+import csv
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+
+
+DrawdownResult = namedtuple('DrawdownResult', ['success_probability', 'terminal_balances', 'depletion_month'])
+DrawdownResult.__doc__ = """
+Result of a drawdown simulation, with (plans x paths) arrays.
+
+Attributes:
+    success_probability (numpy.ndarray): Share of paths where each plan makes
+        every withdrawal
+    terminal_balances (numpy.ndarray): Balance left at the horizon (0 if depleted)
+    depletion_month (numpy.ndarray): First month whose withdrawal cannot be
+        made in full (0 if the plan survives)
+"""
+
+
+def _parse_returns_csv(path, column):
+    """Read one column of a returns CSV, skipping a header row if present."""
+    with open(path, newline='') as handle:
+        rows = [row for row in csv.reader(handle) if row]
+    if not rows:
+        raise ValueError(f"No returns found in {path}")
+    
+    header = rows[0]
+    try:
+        [float(value) for value in header]
+        header = None
+    except ValueError:
+        rows = rows[1:]
+    if isinstance(column, str):
+        if header is None or column not in header:
+            raise ValueError(f"Column not found in {path}: {column}")
+        column = header.index(column)
+    try:
+        return np.array([float(row[column]) for row in rows])
+    except (IndexError, ValueError):
+        raise ValueError(f"Invalid returns data in {path}")
+
+
+def load_returns(path, column=-1, cache_path=None):
+    """
+    Load monthly returns from a CSV file as a memory-mapped array.
+    
+    The CSV is parsed once and cached next to it as one .npy file per
+    column, which is rebuilt whenever the CSV is newer. Later loads
+    memory-map the cache, so long histories are neither re-parsed nor
+    copied into each process.
+    
+    Args:
+        path (str): CSV file of monthly returns (as percentage)
+        column (int or str): Column index or header name of the returns
+        cache_path (str): Where to keep the parsed array; must differ per
+            column (defaults to the CSV path with the column and a .npy suffix,
+            which is also added to a given path that lacks it, as numpy.save does)
+    
+    Returns:
+        numpy.memmap: Read-only monthly returns (as percentage)
+    
+    Raises:
+        ValueError: If the file has no valid returns
+    """
+    if cache_path is None:
+        suffix = re.sub(r'[^\w-]', '_', str(column))
+        cache_path = f'{os.path.splitext(path)[0]}.{suffix}.npy'
+    elif not os.fspath(cache_path).endswith('.npy'):
+        cache_path = f'{os.fspath(cache_path)}.npy'
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        returns = _parse_returns_csv(path, column)
+        if np.any(returns <= -100):
+            raise ValueError(f"Returns must be greater than -100% in {path}")
+        np.save(cache_path, returns)
+    return np.load(cache_path, mmap_mode='r')
+
+
+def block_table(num_history, block_size):
+    """
+    Precompute the history indices of every circular block.
+    
+    Args:
+        num_history (int): Number of historical months
+        block_size (int): Months per block
+    
+    Returns:
+        numpy.ndarray: (num_history x block_size) indices; row s is the block
+        starting at month s, wrapping around the end of the history
+    """
+    return (np.arange(num_history)[:, None] + np.arange(block_size)) % num_history
+
+
+def bootstrap_log_growth(returns, num_paths, months, block_size=12, rng=None):
+    """
+    Resample monthly log growth paths with a circular block bootstrap.
+    
+    Blocks keep the autocorrelation of the history within each block. Every
+    overlapping block is materialized once as a row of log growth values,
+    so resampling is a single gather of whole rows.
+    
+    Args:
+        returns (array-like): Historical monthly returns (as percentage)
+        num_paths (int): Number of paths
+        months (int): Months per path
+        block_size (int): Months per resampled block
+        rng (numpy.random.Generator): Random generator
+    
+    Returns:
+        numpy.ndarray: (num_paths x months) monthly log growth
+    """
+    rng = rng or np.random.default_rng()
+    log_growth = np.log1p(np.asarray(returns, dtype=np.float64) / 100)
+    blocks = log_growth[block_table(log_growth.size, block_size)]
+    num_blocks = -(-months // block_size)
+    starts = rng.integers(0, log_growth.size, size=(num_paths, num_blocks))
+    return blocks[starts].reshape(num_paths, num_blocks * block_size)[:, :months]
+
+
+def simulate_drawdown(returns, opening_balances, monthly_withdrawals, months, inflation=0,
+                      num_paths=10000, block_size=12, seed=None):
+    """
+    Simulate withdrawal sustainability for many plans over bootstrapped paths.
+    
+    Withdrawals are taken at the start of each month and rise by inflation
+    percent every 12 months. Every plan is evaluated on the same paths.
+    With G_m the path's growth through month m, the balance after month m
+    is G_m (opening - S_m) where S_m = sum_{k <= m} w_k / G_{k-1}. S is
+    computed once per path for a unit withdrawal, so each plan only needs a
+    binary search for the first month its opening balance falls short.
+    
+    Args:
+        returns (array-like): Historical monthly returns (as percentage), e.g.
+            from load_returns
+        opening_balances (array-like): Starting balance per plan
+        monthly_withdrawals (array-like): First-year monthly withdrawal per plan
+        months (int): Horizon in months
+        inflation (float): Annual withdrawal increase (as percentage)
+        num_paths (int): Number of bootstrapped paths
+        block_size (int): Months per bootstrap block
+        seed (int): Seed for reproducible results
+    
+    Returns:
+        DrawdownResult: Success probability per plan and (plans x paths)
+        terminal balances and depletion months
+    
+    Raises:
+        ValueError: If any plan or simulation parameter is invalid
+    """
+    opening_balances, monthly_withdrawals = (
+        np.ravel(values) for values in broadcast_inputs(opening_balances, monthly_withdrawals)
+    )
+    if np.any(opening_balances < 0) or np.any(monthly_withdrawals <= 0) or months <= 0 \
+            or inflation <= -100 or num_paths <= 0 or block_size <= 0 or len(returns) == 0:
+        raise ValueError("Invalid drawdown parameters")
+    
+    log_growth = bootstrap_log_growth(returns, num_paths, months, block_size, np.random.default_rng(seed))
+    cumulative = np.cumsum(log_growth, axis=1)
+    # Unit withdrawals discounted by the growth before each one: w_k / G_{k-1}
+    indexation = (1 + inflation / 100) ** (np.arange(months) // 12)
+    discount = np.exp(-(cumulative - log_growth))
+    shortfall = np.cumsum(indexation * discount, axis=1)
+    
+    # Month m's withdrawal fails once S_m exceeds opening / w; S rises with m
+    ratio = (opening_balances / monthly_withdrawals)[:, None]
+    paths = np.arange(num_paths)
+    lower = np.zeros((ratio.size, num_paths), dtype=np.int64)
+    upper = np.full((ratio.size, num_paths), months, dtype=np.int64)
+    while np.any(lower < upper):
+        middle = (lower + upper) // 2
+        short = shortfall[paths, np.minimum(middle, months - 1)] > ratio
+        upper = np.where(short, middle, upper)
+        lower = np.where(short, lower, middle + 1)
+    
+    survived = upper == months
+    remaining = opening_balances[:, None] - monthly_withdrawals[:, None] * shortfall[:, -1]
+    terminal = np.where(survived, np.exp(cumulative[:, -1]) * remaining, 0.0)
+    depletion_month = np.where(survived, 0, upper + 1)
+    return DrawdownResult(survived.mean(axis=1), terminal, depletion_month)
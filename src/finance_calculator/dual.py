@@ -0,0 +1,254 @@
+"""
+Forward-mode automatic differentiation for the Personal Finance Calculator.
+Vectorized dual numbers carry exact first derivatives through the
+calculator formulas, so values and sensitivities come out of one pass.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import (
+    ERROR_INVALID_AMOUNT, ERROR_INVALID_CONTRIBUTION, ERROR_INVALID_RATE, ERROR_INVALID_TERM, ERROR_NONE,
+    as_float_array, broadcast_inputs, error_flags
+)
+
+
+Sensitivities = namedtuple('Sensitivities', ['values', 'derivatives', 'errors'])
+Sensitivities.__doc__ = """
+Values of a formula together with its first derivatives.
+
+Attributes:
+    values (numpy.ndarray): Formula values (unrounded; NaN where invalid)
+    derivatives (dict): Input name -> derivative array of the same shape
+        (NaN where invalid)
+    errors (numpy.ndarray): Per-row error codes as in BatchResult
+"""
+
+
+class Dual:
+    """
+    Array of values with gradients with respect to k seeded inputs.
+    
+    The gradient has the value's shape plus one trailing axis of length k.
+    """
+    
+    __slots__ = ('value', 'gradient')
+    
+    def __init__(self, value, gradient):
+        self.value = as_float_array(value)
+        self.gradient = np.asarray(gradient, dtype=np.float64)
+    
+    @classmethod
+    def seed(cls, values, wrt):
+        """
+        Lift named inputs to duals, seeding only the ones being differentiated.
+        
+        Args:
+            values (dict): Input name -> array-like (broadcast together)
+            wrt (tuple): Names of the inputs that get a gradient slot
+        
+        Returns:
+            dict: Input name -> Dual; inputs not in wrt have zero gradients
+        """
+        arrays = broadcast_inputs(*values.values())
+        size = len(wrt)
+        unit = np.eye(size)
+        return {
+            name: cls(array, np.broadcast_to(
+                unit[wrt.index(name)] if name in wrt else np.zeros(size), array.shape + (size,)
+            ))
+            for name, array in zip(values, arrays)
+        }
+    
+    def _lift(self, other):
+        """Wrap a constant as a Dual with a zero gradient."""
+        if isinstance(other, Dual):
+            return other
+        other = as_float_array(other)
+        return Dual(other, np.zeros(other.shape + self.gradient.shape[-1:]))
+    
+    def __add__(self, other):
+        other = self._lift(other)
+        return Dual(self.value + other.value, self.gradient + other.gradient)
+    
+    __radd__ = __add__
+    
+    def __neg__(self):
+        return Dual(-self.value, -self.gradient)
+    
+    def __sub__(self, other):
+        return self + (-self._lift(other))
+    
+    def __rsub__(self, other):
+        return self._lift(other) - self
+    
+    def __mul__(self, other):
+        other = self._lift(other)
+        return Dual(
+            self.value * other.value,
+            self.gradient * other.value[..., None] + other.gradient * self.value[..., None],
+        )
+    
+    __rmul__ = __mul__
+    
+    def __truediv__(self, other):
+        other = self._lift(other)
+        value = self.value / other.value
+        return Dual(value, (self.gradient - other.gradient * value[..., None]) / other.value[..., None])
+    
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+    
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            return exp(exponent * log(self))
+        exponent = as_float_array(exponent)
+        value = self.value ** exponent
+        return Dual(value, self.gradient * (exponent * self.value ** (exponent - 1))[..., None])
+    
+    def derivative(self, index):
+        """Get the derivative with respect to the index-th seeded input."""
+        return self.gradient[..., index]
+
+
+def _chain(x, value, slope):
+    """Apply the chain rule for an elementwise function."""
+    return Dual(value, x.gradient * slope[..., None])
+
+
+def exp(x):
+    """Elementwise e^x for duals."""
+    value = np.exp(x.value)
+    return _chain(x, value, value)
+
+
+def expm1(x):
+    """Elementwise e^x - 1 for duals."""
+    return _chain(x, np.expm1(x.value), np.exp(x.value))
+
+
+def log(x):
+    """Elementwise natural log for duals."""
+    return _chain(x, np.log(x.value), 1 / x.value)
+
+
+def log1p(x):
+    """Elementwise log(1 + x) for duals."""
+    return _chain(x, np.log1p(x.value), 1 / (1 + x.value))
+
+
+def where(condition, if_true, if_false):
+    """Elementwise selection between two duals."""
+    condition = np.asarray(condition)
+    return Dual(
+        np.where(condition, if_true.value, if_false.value),
+        np.where(condition[..., None], if_true.gradient, if_false.gradient),
+    )
+
+
+def _differentiate(formula, validate, inputs, wrt):
+    """Seed the chosen inputs, evaluate the formula and collect derivatives of valid rows."""
+    wrt = tuple(wrt)
+    unknown = set(wrt) - set(inputs)
+    if unknown or not wrt:
+        raise ValueError(f"Cannot differentiate with respect to: {', '.join(sorted(unknown)) or 'nothing'}")
+    
+    seeded = Dual.seed(inputs, wrt)
+    errors = validate(**{name: dual.value for name, dual in seeded.items()})
+    valid = errors == ERROR_NONE
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        result = formula(**seeded)
+    return Sensitivities(
+        np.where(valid, result.value, np.nan),
+        {name: np.where(valid, result.derivative(index), np.nan) for index, name in enumerate(wrt)},
+        errors,
+    )
+
+
+def _payment_errors(loan_amount, annual_rate, years):
+    """Error codes of BatchCalculator.calculate_monthly_payment."""
+    return error_flags(
+        (loan_amount <= 0, ERROR_INVALID_AMOUNT),
+        (annual_rate < 0, ERROR_INVALID_RATE),
+        (years <= 0, ERROR_INVALID_TERM),
+    )
+
+
+def _savings_goal_errors(target_amount, monthly_contribution, annual_rate):
+    """Error codes of BatchCalculator.calculate_savings_goal."""
+    return error_flags(
+        (target_amount <= 0, ERROR_INVALID_AMOUNT),
+        (monthly_contribution <= 0, ERROR_INVALID_CONTRIBUTION),
+        (annual_rate < 0, ERROR_INVALID_RATE),
+    )
+
+
+def _monthly_payment(loan_amount, annual_rate, years):
+    """Unrounded calculate_monthly_payment on duals."""
+    monthly_rate = annual_rate / 1200
+    num_payments = years * 12
+    log_growth = num_payments * log1p(monthly_rate)
+    amortized = loan_amount * monthly_rate * exp(log_growth) / expm1(log_growth)
+    # At zero rate use the first-order expansion L/n (1 + (n + 1) r / 2)
+    flat = loan_amount / num_payments * (1 + (num_payments + 1) * monthly_rate / 2)
+    return where(annual_rate.value == 0, flat, amortized)
+
+
+def _savings_goal(target_amount, monthly_contribution, annual_rate):
+    """Unrounded calculate_savings_goal on duals."""
+    monthly_rate = annual_rate / 1200
+    ratio = target_amount / monthly_contribution
+    months = log1p(ratio * monthly_rate) / log1p(monthly_rate)
+    # At zero rate use the first-order expansion T/c (1 + r (1 - T/c) / 2)
+    flat = ratio * (1 + monthly_rate * (1 - ratio) / 2)
+    return where(annual_rate.value == 0, flat, months) / 12
+
+
+def monthly_payment_sensitivities(loan_amount, annual_rate, years, wrt=('annual_rate',)):
+    """
+    Calculate monthly payments and their exact derivatives in one pass.
+    
+    Args:
+        loan_amount (array-like): Loan amounts
+        annual_rate (array-like): Annual interest rates (as percentage)
+        years (array-like): Loan terms in years
+        wrt (tuple): Inputs to differentiate with respect to
+            ('loan_amount', 'annual_rate', 'years')
+    
+    Returns:
+        Sensitivities: Unrounded payments, d payment / d input per name and
+        error codes; invalid loans are NaN as in calculate_monthly_payment
+    
+    Raises:
+        ValueError: If an unknown input name is requested
+    """
+    inputs = {'loan_amount': loan_amount, 'annual_rate': annual_rate, 'years': years}
+    return _differentiate(_monthly_payment, _payment_errors, inputs, wrt)
+
+
+def savings_goal_sensitivities(target_amount, monthly_contribution, annual_rate,
+                               wrt=('monthly_contribution',)):
+    """
+    Calculate years to a savings goal and their exact derivatives in one pass.
+    
+    Args:
+        target_amount (array-like): Target savings amounts
+        monthly_contribution (array-like): Monthly savings contributions
+        annual_rate (array-like): Annual interest rates (as percentage)
+        wrt (tuple): Inputs to differentiate with respect to
+            ('target_amount', 'monthly_contribution', 'annual_rate')
+    
+    Returns:
+        Sensitivities: Unrounded years to goal, d years / d input per name
+        and error codes; invalid plans are NaN as in calculate_savings_goal
+    
+    Raises:
+        ValueError: If an unknown input name is requested
+    """
+    inputs = {
+        'target_amount': target_amount,
+        'monthly_contribution': monthly_contribution,
+        'annual_rate': annual_rate,
+    }
+    return _differentiate(_savings_goal, _savings_goal_errors, inputs, wrt)
@@ -0,0 +1,463 @@
+"""
+Integer-cent calculation engine for the Personal Finance Calculator.
+Does all money arithmetic in integer minor units with explicit rounding,
+so results are exact and identical on every platform.
+"""
+
+from decimal import (
+    Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+)
+from fractions import Fraction
+import operator
+
+import numpy as np
+
+from finance_calculator.amortization import ScheduleRow, number_of_payments
+
+
+ROUNDING_MODES = (
+    ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+)
+
+
+def divide_rounded(numerator, denominator, rounding=ROUND_HALF_UP):
+    """
+    Divide two integers and round the exact quotient to an integer.
+    
+    Args:
+        numerator (int): Dividend
+        denominator (int): Positive divisor
+        rounding (str): One of the decimal module rounding modes
+    
+    Returns:
+        int: Rounded quotient
+    
+    Raises:
+        ValueError: If the denominator is not positive or the mode is unknown
+    """
+    if denominator <= 0:
+        raise ValueError("Denominator must be positive")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder == 0 or rounding == ROUND_FLOOR:
+        return quotient
+    
+    negative = numerator < 0
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    if rounding == ROUND_DOWN:
+        return quotient + 1 if negative else quotient
+    if rounding == ROUND_UP:
+        return quotient if negative else quotient + 1
+    
+    # Half modes: compare the remainder against half of the denominator
+    twice = 2 * remainder
+    if twice < denominator:
+        return quotient
+    if twice > denominator:
+        return quotient + 1
+    if rounding == ROUND_HALF_EVEN:
+        return quotient if quotient % 2 == 0 else quotient + 1
+    if rounding == ROUND_HALF_UP:
+        return quotient if negative else quotient + 1
+    return quotient + 1 if negative else quotient
+
+
+def divide_rounded_array(numerator, denominator, rounding=ROUND_HALF_UP, dtype=np.int64):
+    """
+    Vectorized divide_rounded for integer arrays.
+    
+    Args:
+        numerator (array-like): Integer dividends
+        denominator (array-like): Positive integer divisors
+        rounding (str): One of the decimal module rounding modes
+        dtype: numpy.int64, or object to work on Python ints of any size
+    
+    Returns:
+        numpy.ndarray: Rounded quotients of the given dtype
+    
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    
+    numerator = np.asarray(numerator, dtype=dtype)
+    denominator = np.asarray(denominator, dtype=dtype)
+    quotient = numerator // denominator
+    remainder = numerator - quotient * denominator
+    inexact = remainder != 0
+    negative = numerator < 0
+    
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + inexact
+    if rounding == ROUND_DOWN:
+        return quotient + (inexact & negative)
+    if rounding == ROUND_UP:
+        return quotient + (inexact & ~negative)
+    
+    twice = 2 * remainder
+    above = twice > denominator
+    tie = twice == denominator
+    if rounding == ROUND_HALF_EVEN:
+        return quotient + (above | (tie & (quotient % 2 == 1)))
+    if rounding == ROUND_HALF_UP:
+        return quotient + (above | (tie & ~negative))
+    return quotient + (above | (tie & negative))
+
+
+def exact_value(value):
+    """
+    Convert a rate or time to an exact fraction.
+    
+    Floats are converted through their shortest decimal representation, so
+    4.5 becomes 9/2 rather than the nearest binary fraction.
+    
+    Args:
+        value: int, float, str, Decimal or Fraction
+    
+    Returns:
+        Fraction: Exact value
+    """
+    if isinstance(value, (int, Fraction)):
+        return Fraction(value)
+    return Fraction(str(value))
+
+
+def to_cents(amount, rounding=ROUND_HALF_UP):
+    """
+    Convert an amount in currency units to integer cents.
+    
+    Args:
+        amount: Amount as int, float, str or Decimal
+        rounding (str): Rounding mode for sub-cent amounts
+    
+    Returns:
+        int: Amount in cents
+    """
+    cents = exact_value(amount) * 100
+    return divide_rounded(cents.numerator, cents.denominator, rounding)
+
+
+def from_cents(cents):
+    """
+    Convert integer cents to an exact Decimal amount in currency units.
+    
+    Args:
+        cents (int): Amount in cents
+    
+    Returns:
+        Decimal: Amount with two decimal places
+    """
+    return Decimal(cents).scaleb(-2)
+
+
+def _whole_cents(amount):
+    """Convert an integral amount (int or numpy integer) to a Python int of cents."""
+    try:
+        return operator.index(amount)
+    except TypeError:
+        raise ValueError("Amounts must be whole numbers of cents") from None
+
+
+def _power_bounds(a, b, n, bits):
+    """
+    Bound (1 + a/b)^n by exponentiation by squaring in fixed point.
+    
+    Every product is rounded down for the lower bound and up for the upper
+    bound, so the true power always lies between them.
+    
+    Returns:
+        tuple: (low, high) integers with low <= 2^bits (1 + a/b)^n <= high
+    """
+    one = 1 << bits
+    base_low = ((b + a) << bits) // b
+    base_high = -(-((b + a) << bits) // b)
+    low = high = one
+    while n:
+        if n & 1:
+            low = low * base_low >> bits
+            high = -(-(high * base_high) >> bits)
+        n >>= 1
+        if n:
+            base_low = base_low * base_low >> bits
+            base_high = -(-(base_high * base_high) >> bits)
+    return low, high
+
+
+class CentsCalculator:
+    """
+    Fixed-point counterpart of FinanceCalculator.
+    
+    Money inputs and outputs are integer cents; rates and times are taken
+    as exact fractions. Intermediate values stay exact and only the final
+    result of each operation is rounded, using the configured rounding mode.
+    """
+    
+    def __init__(self, rounding=ROUND_HALF_UP):
+        """
+        Create a fixed-point calculator.
+        
+        Args:
+            rounding (str): Rounding mode from the decimal module
+        
+        Raises:
+            ValueError: If the rounding mode is unknown
+        """
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding mode: {rounding}")
+        self.rounding = rounding
+    
+    def _round(self, value):
+        """Round an exact fraction to whole cents."""
+        return divide_rounded(value.numerator, value.denominator, self.rounding)
+    
+    def calculate_simple_interest(self, principal, rate, time):
+        """
+        Calculate simple interest in cents.
+        
+        Args:
+            principal (int): Principal in cents
+            rate: Interest rate (as percentage)
+            time: Time period in years
+        
+        Returns:
+            int: Simple interest in cents
+        """
+        rate, time = exact_value(rate), exact_value(time)
+        if principal < 0 or rate < 0 or time < 0:
+            raise ValueError("Values must be non-negative")
+        
+        return self._round(principal * rate * time / 100)
+    
+    def calculate_compound_interest(self, principal, rate, time, compound_frequency=1):
+        """
+        Calculate the final amount after compound interest in cents.
+        
+        Args:
+            principal (int): Principal in cents
+            rate: Annual interest rate (as percentage)
+            time: Time period in years
+            compound_frequency (int): How many times interest compounds per year
+        
+        Returns:
+            int: Final amount in cents
+        
+        Raises:
+            ValueError: If inputs are invalid, the principal is not whole cents,
+                the frequency is not a whole number or the time does not give
+                whole compounding periods
+        """
+        principal = _whole_cents(principal)
+        rate, time, compound_frequency = exact_value(rate), exact_value(time), exact_value(compound_frequency)
+        if principal < 0 or rate < 0 or time < 0 or compound_frequency <= 0:
+            raise ValueError("Invalid input values")
+        if compound_frequency.denominator != 1:
+            raise ValueError("Compounding frequency must be a whole number")
+        
+        periods = compound_frequency * time
+        if periods.denominator != 1:
+            raise ValueError("Time must cover a whole number of compounding periods")
+        
+        period_rate = rate / 100 / compound_frequency
+        a, b = period_rate.numerator, period_rate.denominator
+        n = periods.numerator
+        
+        # Bracket (1 + a/b)^n between fixed-point powers rounded down and up;
+        # once both ends round to the same cent that cent is exact. The exact
+        # (b + a)^n / b^n is only needed if no affordable precision settles it
+        exact_bits = n * (b + a).bit_length()
+        bits = 2 * (principal.bit_length() + n.bit_length()) + 64
+        while bits < exact_bits:
+            low, high = _power_bounds(a, b, n, bits)
+            amount = divide_rounded(principal * low, 1 << bits, self.rounding)
+            if amount == divide_rounded(principal * high, 1 << bits, self.rounding):
+                return amount
+            bits *= 2
+        return divide_rounded(principal * (b + a) ** n, b ** n, self.rounding)
+    
+    def calculate_monthly_payment(self, loan_amount, annual_rate, years):
+        """
+        Calculate the monthly loan payment in cents.
+        
+        Args:
+            loan_amount (int): Loan amount in cents
+            annual_rate: Annual interest rate (as percentage)
+            years: Loan term in years
+        
+        Returns:
+            int: Monthly payment in cents
+        """
+        annual_rate = exact_value(annual_rate)
+        if loan_amount <= 0 or annual_rate < 0 or years <= 0:
+            raise ValueError("Invalid loan parameters")
+        num_payments = number_of_payments(years)
+        
+        # P = L r g / (g - 1) with r = a/b and g = (a + b)^n / b^n
+        factor = self._payment_factor(annual_rate / 1200, num_payments)
+        return divide_rounded(loan_amount * factor.numerator, factor.denominator, self.rounding)
+    
+    def calculate_savings_goal(self, target_amount, monthly_contribution, annual_rate, max_years=1000):
+        """
+        Calculate how many whole months it takes to reach a savings goal.
+        
+        Interest is credited monthly and rounded to the cent before the
+        month's contribution is added. The rounded interest only changes
+        when the balance crosses a cent boundary of balance * rate, so each
+        run of months earning the same interest is taken in one step; the
+        cost grows with the number of distinct interest amounts, not months.
+        
+        Args:
+            target_amount (int): Target savings in cents
+            monthly_contribution (int): Monthly contribution in cents
+            annual_rate: Annual interest rate (as percentage)
+            max_years (int): Longest horizon searched
+        
+        Returns:
+            int: Months until the balance reaches the target
+        
+        Raises:
+            ValueError: If inputs are invalid or the goal is not reached
+                within max_years
+        """
+        target_amount, monthly_contribution = _whole_cents(target_amount), _whole_cents(monthly_contribution)
+        annual_rate = exact_value(annual_rate)
+        if target_amount <= 0 or monthly_contribution <= 0 or annual_rate < 0:
+            raise ValueError("Invalid savings parameters")
+        
+        monthly_rate = annual_rate / 1200
+        a, b = monthly_rate.numerator, monthly_rate.denominator
+        max_months = round(max_years * 12)
+        
+        balance, months = 0, 0
+        while balance < target_amount:
+            if months >= max_months:
+                raise ValueError(f"Savings goal is not reached within {max_years} years")
+            interest = divide_rounded(balance * a, b, self.rounding)
+            step = interest + monthly_contribution
+            
+            # Within a run the balance grows by step each month; interest is
+            # monotone in the balance, so the months still earning this
+            # interest are a prefix of those left before the target
+            low, high = 1, min(-(-(target_amount - balance) // step), max_months - months)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if divide_rounded((balance + (middle - 1) * step) * a, b, self.rounding) == interest:
+                    low = middle
+                else:
+                    high = middle - 1
+            balance += low * step
+            months += low
+        return months
+    
+    def iter_amortization_schedule(self, loan_amount, annual_rate, years):
+        """
+        Lazily generate an amortization schedule in integer cents.
+        
+        Each period's interest is rounded to the cent; the final period pays
+        whatever is left so principal sums exactly to the loan amount.
+        
+        Args:
+            loan_amount (int): Loan amount in cents
+            annual_rate: Annual interest rate (as percentage)
+            years: Loan term in years
+        
+        Yields:
+            ScheduleRow: One row per monthly payment, amounts in cents
+        """
+        payment = self.calculate_monthly_payment(loan_amount, annual_rate, years)
+        num_payments = number_of_payments(years)
+        monthly_rate = exact_value(annual_rate) / 1200
+        a, b = monthly_rate.numerator, monthly_rate.denominator
+        
+        balance = loan_amount
+        for period in range(1, num_payments + 1):
+            interest = divide_rounded(balance * a, b, self.rounding)
+            if period == num_payments or payment - interest >= balance:
+                principal = balance
+                balance = 0
+                yield ScheduleRow(period, principal + interest, interest, principal, balance)
+                return
+            principal = payment - interest
+            balance -= principal
+            yield ScheduleRow(period, payment, interest, principal, balance)
+    
+    def iter_bulk_schedule(self, loan_amounts, annual_rates, years):
+        """
+        Generate the cent-exact schedules of many loans in lockstep.
+        
+        Produces the same rows as iter_amortization_schedule for every loan,
+        but each period is a handful of int64 array operations across the
+        whole portfolio. Loans that have been paid off report zero rows.
+        
+        Args:
+            loan_amounts (array-like): Loan amounts in cents
+            annual_rates (array-like): Annual interest rates (as percentage)
+            years (array-like): Loan terms in years
+        
+        Yields:
+            ScheduleRow: One row per period whose amount fields are int64 arrays
+        
+        Raises:
+            ValueError: If any loan's parameters are invalid
+        """
+        loan_amounts = [int(amount) for amount in loan_amounts]
+        annual_rates = [exact_value(rate) for rate in annual_rates]
+        years = list(years)
+        for amount, rate, term in zip(loan_amounts, annual_rates, years):
+            if amount <= 0 or rate < 0 or term <= 0:
+                raise ValueError("Invalid loan parameters")
+        annual_rates = [rate / 1200 for rate in annual_rates]
+        terms = [number_of_payments(term) for term in years]
+        
+        # Payment is linear in the loan amount, so keep one exact factor per
+        # distinct (rate, term) pair and scale it for every loan
+        factors = {}
+        payments = []
+        for amount, monthly_rate, num_payments in zip(loan_amounts, annual_rates, terms):
+            key = (monthly_rate, num_payments)
+            if key not in factors:
+                factors[key] = self._payment_factor(monthly_rate, num_payments)
+            factor = factors[key]
+            payments.append(divide_rounded(amount * factor.numerator, factor.denominator, self.rounding))
+        
+        # Balances never exceed the loan amounts, so one bound decides whether
+        # balance * rate numerator always fits in int64; rates with many
+        # decimal digits fall back to Python ints for the interest step
+        numerators = [rate.numerator for rate in annual_rates]
+        denominators = [rate.denominator for rate in annual_rates]
+        wide = max(loan_amounts, default=0) * max(numerators, default=0) >= 2 ** 62 \
+            or max(denominators, default=1) >= 2 ** 62
+        interest_dtype = object if wide else np.int64
+        
+        payment = np.array(payments, dtype=np.int64)
+        balance = np.array(loan_amounts, dtype=np.int64)
+        rate_numerator = np.array(numerators, dtype=interest_dtype)
+        rate_denominator = np.array(denominators, dtype=interest_dtype)
+        num_payments = np.array(terms, dtype=np.int64)
+        
+        for period in range(1, int(num_payments.max(initial=0)) + 1):
+            interest = divide_rounded_array(balance.astype(interest_dtype) * rate_numerator, rate_denominator,
+                                            self.rounding, interest_dtype).astype(np.int64)
+            final = (period >= num_payments) | (payment - interest >= balance)
+            principal = np.where(final, balance, payment - interest)
+            balance = balance - principal
+            yield ScheduleRow(period, principal + interest, interest, principal, balance)
+    
+    @staticmethod
+    def _payment_factor(monthly_rate, num_payments):
+        """Exact payment per cent of loan for a monthly rate and term."""
+        if monthly_rate < 0:
+            raise ValueError("Invalid loan parameters")
+        if monthly_rate == 0:
+            return Fraction(1, num_payments)
+        
+        a, b = monthly_rate.numerator, monthly_rate.denominator
+        growth = (a + b) ** num_payments
+        return Fraction(a * growth, b * (growth - b ** num_payments))
@@ -0,0 +1,88 @@
+"""
+Loan sensitivity grids for the Personal Finance Calculator.
+Evaluates monthly payments for every (rate, term, amount) combination in a
+single broadcasted computation.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import (
+    ERROR_INVALID_AMOUNT, ERROR_INVALID_RATE, ERROR_INVALID_TERM, ERROR_NONE,
+    as_float_array, error_flags
+)
+from finance_calculator.curve import require_flat_rates
+
+
+PaymentGrid = namedtuple('PaymentGrid', [
+    'rates', 'terms', 'amounts', 'monthly_payment', 'total_payment', 'total_interest', 'errors'
+])
+PaymentGrid.__doc__ = """
+Payment cube indexed as [rate, term, amount].
+
+Attributes:
+    rates (numpy.ndarray): Annual interest rate axis (as percentage)
+    terms (numpy.ndarray): Loan term axis in years
+    amounts (numpy.ndarray): Loan amount axis
+    monthly_payment (numpy.ndarray): Monthly payment per cell
+    total_payment (numpy.ndarray): Total paid over the term per cell
+    total_interest (numpy.ndarray): Total interest per cell
+    errors (numpy.ndarray): Per-cell error codes (see batch module)
+"""
+
+
+def payment_grid(rates, terms, amounts):
+    """
+    Calculate the payment cube for every rate, term and amount combination.
+    
+    The growth factor only depends on rate and term, so it is computed once
+    on the rate x term plane and broadcast along the amount axis. Cell
+    values match calculate_monthly_payment exactly, including the zero-rate
+    special case.
+    
+    Args:
+        rates (array-like): Annual interest rates (as percentage); a
+            YieldCurve is not supported, since the rates form a grid axis
+        terms (array-like): Loan terms in years
+        amounts (array-like): Loan amounts
+    
+    Returns:
+        PaymentGrid: Axes, payment/total/interest cubes and error codes
+    
+    Raises:
+        ValueError: If rates is a YieldCurve
+    """
+    require_flat_rates(rates)
+    rates = np.atleast_1d(as_float_array(rates)).ravel()
+    terms = np.atleast_1d(as_float_array(terms)).ravel()
+    amounts = np.atleast_1d(as_float_array(amounts)).ravel()
+    
+    rate = rates[:, None, None]
+    term = terms[None, :, None]
+    amount = amounts[None, None, :]
+    errors = error_flags(
+        (amount <= 0, ERROR_INVALID_AMOUNT),
+        (rate < 0, ERROR_INVALID_RATE),
+        (term <= 0, ERROR_INVALID_TERM),
+    )
+    errors = np.broadcast_to(errors, (rates.size, terms.size, amounts.size))
+    
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        monthly_rate = rate / 100 / 12
+        num_payments = term * 12
+        growth = (1 + monthly_rate) ** num_payments
+        numerator = monthly_rate * growth
+        denominator = growth - 1
+        
+        payment = np.where(
+            rate == 0,
+            amount / num_payments,
+            np.round(amount * numerator / denominator, 2),
+        )
+        total_payment = payment * term * 12
+    
+    valid = errors == ERROR_NONE
+    payment = np.where(valid, payment, np.nan)
+    total_payment = np.where(valid, total_payment, np.nan)
+    return PaymentGrid(rates, terms, amounts, payment, total_payment, total_payment - amount, errors)
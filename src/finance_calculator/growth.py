@@ -0,0 +1,88 @@
+"""
+Growth-factor cache for the Personal Finance Calculator.
+Memoizes (1 + rate) ** periods, which every compounding formula needs and
+which real traffic recomputes for a small set of recurring rate/term pairs.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'enabled'])
+
+
+class GrowthFactorCache:
+    """Bounded LRU cache of (1 + rate) ** periods with hit/miss statistics."""
+    
+    def __init__(self, maxsize=1024, enabled=True):
+        """
+        Create a growth-factor cache.
+        
+        Args:
+            maxsize (int): Maximum number of (rate, periods) pairs kept
+            enabled (bool): Whether lookups are cached at all
+        
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive")
+        
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._factors = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def growth_factor(self, rate, periods):
+        """
+        Get (1 + rate) ** periods, computing it only on a cache miss.
+        
+        Args:
+            rate (float): Rate per period (as decimal, e.g. 0.005)
+            periods (float): Number of compounding periods
+        
+        Returns:
+            float: The growth factor
+        """
+        if not self.enabled:
+            return (1 + rate) ** periods
+        
+        key = (rate, periods)
+        with self._lock:
+            factor = self._factors.get(key)
+            if factor is not None:
+                self._factors.move_to_end(key)
+                self.hits += 1
+                return factor
+            self.misses += 1
+        
+        factor = (1 + rate) ** periods
+        
+        with self._lock:
+            self._factors[key] = factor
+            if len(self._factors) > self.maxsize:
+                self._factors.popitem(last=False)
+        return factor
+    
+    def info(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            CacheInfo: Hits, misses, maximum size, current size and enabled flag
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._factors), self.enabled)
+    
+    def clear(self):
+        """Remove all cached factors and reset the statistics."""
+        with self._lock:
+            self._factors.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by every FinanceCalculator that is not given its own cache
+default_growth_cache = GrowthFactorCache()
@@ -0,0 +1,201 @@
+"""
+Batch internal rate of return and APR for the Personal Finance Calculator.
+Solves the IRR of many cash-flow streams at once, given either as a 2D
+matrix or as ragged rows (a flat value array plus row offsets).
+"""
+
+import numpy as np
+
+from finance_calculator.batch import BatchCalculator, broadcast_inputs
+from finance_calculator.curve import YieldCurve
+from finance_calculator.rootfinding import RootResult, newton_bisect
+
+
+def as_ragged(cash_flows, offsets=None):
+    """
+    Normalize cash flows to the ragged (values, offsets) layout.
+    
+    Args:
+        cash_flows (array-like): 2D matrix (one row per stream, NaN padding
+            allowed) or a flat array when offsets are given
+        offsets (array-like): Row start positions into the flat array, with
+            a final entry equal to its length
+    
+    Returns:
+        tuple: (values, offsets) as float64 and int64 arrays
+    
+    Raises:
+        ValueError: If the layout is inconsistent
+    """
+    values = np.asarray(cash_flows, dtype=np.float64)
+    if offsets is None:
+        if values.ndim != 2:
+            raise ValueError("Cash flows must be a 2D matrix when no offsets are given")
+        rows, columns = values.shape
+        return np.nan_to_num(values, nan=0.0).ravel(), np.arange(rows + 1, dtype=np.int64) * columns
+    
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if values.ndim != 1 or offsets.ndim != 1 or offsets.size == 0 or offsets[0] != 0 \
+            or offsets[-1] != values.size or np.any(np.diff(offsets) < 0):
+        raise ValueError("Offsets must start at 0, be non-decreasing and end at the number of values")
+    return values, offsets
+
+
+def ragged_positions(offsets):
+    """
+    Find the row and the position within its row of every flat element.
+    
+    Args:
+        offsets (numpy.ndarray): Ragged row offsets
+    
+    Returns:
+        tuple: (owner row per element, position within the row per element)
+    """
+    lengths = np.diff(offsets)
+    owner = np.repeat(np.arange(lengths.size), lengths)
+    return owner, np.arange(offsets[-1]) - offsets[:-1][owner]
+
+
+def gather_rows(offsets, rows, positions=None):
+    """
+    Find the flat elements belonging to a subset of ragged rows.
+    
+    Args:
+        offsets (numpy.ndarray): Ragged row offsets
+        rows (numpy.ndarray): Sorted, unique row indices to gather
+        positions (tuple): Precomputed ragged_positions(offsets) (optional)
+    
+    Returns:
+        tuple: (element indices, position of each element within its row,
+        index into rows of each element's row)
+    """
+    owner, position = positions if positions is not None else ragged_positions(offsets)
+    num_rows = offsets.size - 1
+    if rows.size == num_rows:
+        return np.arange(owner.size), position, owner
+    
+    selected = np.zeros(num_rows, dtype=bool)
+    selected[rows] = True
+    elements = np.flatnonzero(selected[owner])
+    local = np.zeros(num_rows, dtype=np.int64)
+    local[rows] = np.arange(rows.size)
+    return elements, position[elements], local[owner[elements]]
+
+
+def npv_ragged(period_rate, values, offsets, rows=None, positions=None, times=None):
+    """
+    Calculate the net present value of ragged cash-flow rows.
+    
+    By default the first value of each row is at time 0 and is not
+    discounted, and each later value is one period after the previous one.
+    
+    Args:
+        period_rate (array-like): Discount rate per period for each selected row
+        values (numpy.ndarray): Flat cash-flow values
+        offsets (numpy.ndarray): Ragged row offsets
+        rows (numpy.ndarray): Sorted rows to value (defaults to all)
+        positions (tuple): Precomputed ragged_positions(offsets) (optional)
+        times (numpy.ndarray): Flat per-element times in periods, for
+            irregularly spaced cash flows (optional)
+    
+    Returns:
+        tuple: (npv, d npv / d rate) arrays, one entry per selected row
+    """
+    if rows is None:
+        rows = np.arange(offsets.size - 1)
+    elements, position, owner = gather_rows(offsets, rows, positions)
+    times = position if times is None else times[elements]
+    period_rate = np.broadcast_to(np.asarray(period_rate, dtype=np.float64), rows.shape)
+    
+    discounted = values[elements] * np.exp(-times * np.log1p(period_rate)[owner])
+    npv = np.bincount(owner, weights=discounted, minlength=rows.size)
+    derivative = np.bincount(owner, weights=times * discounted, minlength=rows.size) / -(1 + period_rate)
+    return npv, derivative
+
+
+def batch_irr(cash_flows, offsets=None, lower=-0.9, upper=1.0, tol=1e-12, max_iter=100):
+    """
+    Calculate the internal rate of return of many cash-flow streams.
+    
+    All rows are iterated together with a safeguarded Newton method; each
+    iteration only discounts the rows that have not yet converged.
+    
+    Args:
+        cash_flows (array-like): 2D matrix or flat ragged values (see as_ragged)
+        offsets (array-like): Ragged row offsets (optional)
+        lower (float): Lowest per-period rate searched
+        upper (float): Highest per-period rate searched
+        tol (float): Relative tolerance
+        max_iter (int): Maximum iterations per row
+    
+    Returns:
+        RootResult: Per-period IRR (as decimal), iteration counts and
+        convergence flags; rows without a sign change in the NPV are not converged
+    """
+    values, offsets = as_ragged(cash_flows, offsets)
+    num_rows = offsets.size - 1
+    positions = ragged_positions(offsets)
+    
+    def residual(period_rate, rows):
+        return npv_ragged(period_rate, values, offsets, rows, positions)
+    
+    return newton_bisect(residual, np.full(num_rows, lower), np.full(num_rows, upper),
+                         initial=0.01, tol=tol, max_iter=max_iter)
+
+
+def loan_cash_flows(loan_amounts, annual_rates, years, fees=0):
+    """
+    Build borrower cash flows for many monthly loans.
+    
+    Each row starts with the amount actually received (loan minus upfront
+    fees) followed by one negative payment per month, using the payments
+    from calculate_monthly_payment.
+    
+    Args:
+        loan_amounts (array-like): Loan amounts
+        annual_rates (array-like or YieldCurve): Annual interest rates (as
+            percentage), or one curve to discount every loan's payments off
+        years (array-like): Loan terms in years
+        fees (array-like): Upfront fees deducted from the amount received
+    
+    Returns:
+        tuple: (values, offsets) ragged cash flows
+    
+    Raises:
+        ValueError: If any loan is invalid
+    """
+    curve = annual_rates if isinstance(annual_rates, YieldCurve) else None
+    loan_amounts, annual_rates, years, fees = broadcast_inputs(
+        loan_amounts, 0 if curve is not None else annual_rates, years, fees)
+    loan_amounts, annual_rates, years, fees = (np.ravel(a) for a in (loan_amounts, annual_rates, years, fees))
+    payments, errors = BatchCalculator().calculate_monthly_payment(
+        loan_amounts, curve if curve is not None else annual_rates, years)
+    if np.any(errors):
+        raise ValueError("Invalid loan parameters")
+    
+    num_payments = np.round(years * 12).astype(np.int64)
+    offsets = np.concatenate(([0], np.cumsum(num_payments + 1)))
+    values = np.repeat(-payments, num_payments + 1)
+    values[offsets[:-1]] = loan_amounts - fees
+    return values, offsets
+
+
+def batch_apr(loan_amounts, annual_rates, years, fees=0, tol=1e-12, max_iter=100):
+    """
+    Calculate the APR of many monthly loans including upfront fees.
+    
+    Args:
+        loan_amounts (array-like): Loan amounts
+        annual_rates (array-like or YieldCurve): Nominal annual interest rates
+            (as percentage), or one curve to discount every loan's payments off
+        years (array-like): Loan terms in years
+        fees (array-like): Upfront fees
+        tol (float): Relative tolerance
+        max_iter (int): Maximum iterations per loan
+    
+    Returns:
+        RootResult: APR (as annual percentage), iteration counts and convergence flags
+    """
+    values, offsets = loan_cash_flows(loan_amounts, annual_rates, years, fees)
+    result = batch_irr(values, offsets, tol=tol, max_iter=max_iter)
+    return RootResult(result.root * 12 * 100, result.iterations, result.converged)
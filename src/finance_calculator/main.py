@@ -12,6 +12,7 @@ if __name__ == "__main__":
 
 from finance_calculator.calculator import FinanceCalculator
 from finance_calculator.validator import InputValidator
+from finance_calculator.grid import payment_grid
 
 
 class FinanceApp:
@@ -56,6 +57,46 @@ class FinanceApp:
                 'error': str(e)
             }
     
+    def calculate_payment_grid(self, rates, terms, amounts):
+        """
+        Calculate a payment matrix over rate, term and amount axes with input validation.
+        
+        Each axis value is validated once; the whole cube is then computed in
+        a single broadcasted call instead of one calculate_loan_payment per cell.
+        
+        Args:
+            rates: Annual interest rates (will be validated)
+            terms: Loan terms in years (will be validated)
+            amounts: Loan amounts (will be validated)
+            
+        Returns:
+            dict: Result containing payment cubes indexed [rate, term, amount] or error information
+        """
+        try:
+            validated_rates = [self.validator.validate_non_negative_number(rate, "Interest rate")
+                               for rate in rates]
+            validated_terms = [self.validator.validate_integer(term, "Loan term") for term in terms]
+            validated_amounts = [self.validator.validate_positive_number(amount, "Loan amount")
+                                 for amount in amounts]
+            
+            grid = payment_grid(validated_rates, validated_terms, validated_amounts)
+            
+            return {
+                'success': True,
+                'rates': grid.rates,
+                'terms': grid.terms,
+                'amounts': grid.amounts,
+                'monthly_payment': grid.monthly_payment,
+                'total_payment': grid.total_payment,
+                'total_interest': grid.total_interest
+            }
+            
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     def calculate_savings_time(self, target_amount, monthly_contribution, annual_rate):
         """
         Calculate time to reach savings goal with input validation.
@@ -0,0 +1,438 @@
+"""
+Monte Carlo savings projections for the Personal Finance Calculator.
+Simulates monthly contributions under volatile lognormal returns in
+fixed-size chunks, optionally fanned out across processes.
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+from finance_calculator.compounding import compound_growth
+from finance_calculator.sobol import MAX_SOBOL_DIMENSION, normal_quantile, random_shift, sobol_points
+
+
+SimulationSummary = namedtuple('SimulationSummary', [
+    'percentiles', 'values', 'mean', 'success_probability', 'num_paths'
+])
+SimulationSummary.__doc__ = """
+Summary of a Monte Carlo savings projection.
+
+Attributes:
+    percentiles (tuple): Percentile levels that were requested
+    values (numpy.ndarray): Terminal balance at each requested percentile
+    mean (float): Mean terminal balance
+    success_probability (float): Share of paths ending at or above the
+        target (NaN without a target)
+    num_paths (int): Number of simulated paths
+"""
+
+Estimate = namedtuple('Estimate', ['value', 'standard_error', 'num_paths', 'converged'])
+Estimate.__doc__ = """
+Simulation estimate with its standard error.
+
+Attributes:
+    value (float): Estimated probability of reaching the target, or mean
+        terminal balance without a target
+    standard_error (float): Standard error of the estimate
+    num_paths (int): Number of simulated paths
+    converged (bool): Whether the target standard error was reached
+"""
+
+SAMPLING_METHODS = ('monte_carlo', 'antithetic', 'sobol')
+
+
+def monthly_log_return_parameters(annual_return, volatility):
+    """
+    Calculate the drift and volatility of monthly log returns.
+    
+    The drift is chosen so the expected monthly growth is 1 + r/12, which
+    makes the mean path match the fixed-rate calculator.
+    
+    Args:
+        annual_return (float): Expected annual return (as percentage)
+        volatility (float): Annual volatility (as percentage)
+    
+    Returns:
+        tuple: (drift, sigma) of the monthly log return
+    """
+    sigma = volatility / 100 / np.sqrt(12)
+    return np.log1p(annual_return / 100 / 12) - sigma ** 2 / 2, sigma
+
+
+def _terminal_balances(cumulative, monthly_contribution, opening_balance):
+    """
+    Turn cumulative log growth L_m (paths x months) into terminal balances.
+    
+    The balance after n months is e^(L_n) (opening + c sum_m e^(-L_m)) for
+    end-of-month contributions. The input array is overwritten.
+    """
+    final = cumulative[:, -1].copy()
+    np.negative(cumulative, out=cumulative)
+    np.exp(cumulative, out=cumulative)
+    return np.exp(final) * (opening_balance + monthly_contribution * cumulative.sum(axis=1)), final
+
+
+def _chunk_terminal_values(task):
+    """Simulate one chunk of paths and return their terminal balances."""
+    seed_sequence, size, months, monthly_contribution, drift, sigma, opening_balance = task
+    rng = np.random.default_rng(seed_sequence)
+    
+    cumulative = rng.standard_normal((size, months))
+    cumulative *= sigma
+    cumulative += drift
+    np.cumsum(cumulative, axis=1, out=cumulative)
+    return _terminal_balances(cumulative, monthly_contribution, opening_balance)[0]
+
+
+def simulate_terminal_balances(monthly_contribution, annual_return, volatility, months,
+                               opening_balance=0, num_paths=100000, chunk_size=10000,
+                               seed=None, workers=1):
+    """
+    Simulate terminal savings balances under volatile returns.
+    
+    Paths are generated chunk by chunk, so memory stays bounded by
+    chunk_size x months regardless of num_paths. Every chunk draws from its
+    own stream spawned from one SeedSequence, so results depend only on the
+    seed and chunk size, not on the number of workers.
+    
+    Args:
+        monthly_contribution (float): Contribution at the end of each month
+        annual_return (float): Expected annual return (as percentage)
+        volatility (float): Annual volatility (as percentage)
+        months (int): Projection horizon in months
+        opening_balance (float): Starting balance
+        num_paths (int): Number of paths to simulate
+        chunk_size (int): Paths simulated together
+        seed (int): Seed for reproducible results
+        workers (int): Worker processes (1 runs in this process)
+    
+    Returns:
+        numpy.ndarray: Terminal balance of every path
+    
+    Raises:
+        ValueError: If any simulation parameter is invalid
+    """
+    if monthly_contribution < 0 or annual_return <= -1200 or volatility < 0 or months <= 0 \
+            or opening_balance < 0:
+        raise ValueError("Invalid simulation parameters")
+    if num_paths <= 0 or chunk_size <= 0 or workers <= 0:
+        raise ValueError("Path, chunk and worker counts must be positive")
+    
+    drift, sigma = monthly_log_return_parameters(annual_return, volatility)
+    sizes = [chunk_size] * (num_paths // chunk_size)
+    if num_paths % chunk_size:
+        sizes.append(num_paths % chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (stream, size, int(months), monthly_contribution, drift, sigma, opening_balance)
+        for stream, size in zip(streams, sizes)
+    ]
+    
+    if workers == 1:
+        return np.concatenate([_chunk_terminal_values(task) for task in tasks])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(_chunk_terminal_values, tasks)))
+
+
+def summarize_terminal_balances(values, target_amount=None, percentiles=(5, 25, 50, 75, 95)):
+    """
+    Summarize simulated terminal balances.
+    
+    Args:
+        values (numpy.ndarray): Terminal balances
+        target_amount (float): Savings goal (optional)
+        percentiles (tuple): Percentile levels to report
+    
+    Returns:
+        SimulationSummary: Percentiles, mean and probability of reaching the target
+    """
+    success = np.nan if target_amount is None else float(np.mean(values >= target_amount))
+    return SimulationSummary(tuple(percentiles), np.percentile(values, percentiles),
+                             float(values.mean()), success, values.size)
+
+
+def simulate_savings_goal(target_amount, monthly_contribution, annual_return, volatility, months,
+                          opening_balance=0, num_paths=100000, chunk_size=10000, seed=None,
+                          workers=1, percentiles=(5, 25, 50, 75, 95)):
+    """
+    Estimate the probability of reaching a savings goal under volatility.
+    
+    Args:
+        target_amount (float): Savings goal
+        monthly_contribution (float): Contribution at the end of each month
+        annual_return (float): Expected annual return (as percentage)
+        volatility (float): Annual volatility (as percentage)
+        months (int): Projection horizon in months
+        opening_balance (float): Starting balance
+        num_paths (int): Number of paths to simulate
+        chunk_size (int): Paths simulated together
+        seed (int): Seed for reproducible results
+        workers (int): Worker processes
+        percentiles (tuple): Percentile levels to report
+    
+    Returns:
+        SimulationSummary: Terminal balance percentiles, mean and success probability
+    
+    Raises:
+        ValueError: If any simulation parameter is invalid
+    """
+    if target_amount <= 0:
+        raise ValueError("Target amount must be positive")
+    values = simulate_terminal_balances(monthly_contribution, annual_return, volatility, months,
+                                        opening_balance, num_paths, chunk_size, seed, workers)
+    return summarize_terminal_balances(values, target_amount, percentiles)
+
+
+@lru_cache(maxsize=32)
+def _bridge_schedule(steps):
+    """Brownian bridge construction order: (index, left, right, weights, scale)."""
+    schedule = []
+    intervals = deque([(0, steps)])
+    while intervals:
+        left, right = intervals.popleft()
+        if right - left < 2:
+            continue
+        middle = (left + right) // 2
+        width = right - left
+        schedule.append((middle, left, right, (right - middle) / width, (middle - left) / width,
+                         np.sqrt((middle - left) * (right - middle) / width)))
+        intervals.extend(((left, middle), (middle, right)))
+    return tuple(schedule)
+
+
+def brownian_bridge(normals):
+    """
+    Build Brownian paths from standard normals by successive bisection.
+    
+    The first column fixes the endpoint, the next the midpoint and so on,
+    so the leading columns carry most of the path's variance. That is where
+    quasi-random points help most.
+    
+    Args:
+        normals (numpy.ndarray): (paths x steps) standard normals
+    
+    Returns:
+        numpy.ndarray: (paths x steps) values W_1..W_n with unit-variance steps
+    """
+    paths, steps = normals.shape
+    normals = np.ascontiguousarray(normals.T)
+    path = np.empty((steps + 1, paths))
+    path[0] = 0.0
+    path[steps] = np.sqrt(steps) * normals[0]
+    for column, (index, left, right, left_weight, right_weight, scale) in \
+            enumerate(_bridge_schedule(steps), 1):
+        path[index] = left_weight * path[left] + right_weight * path[right] + scale * normals[column]
+    return path[1:].T
+
+
+def _chunk_moments(task):
+    """Simulate one chunk and return sample moments of (estimand, control)."""
+    (method, seed_sequence, size, months, monthly_contribution, drift, sigma,
+     opening_balance, target_amount) = task
+    rng = np.random.default_rng(seed_sequence)
+    
+    if method == 'sobol':
+        # Randomly shifted Sobol points drive the coarsest bridge levels and
+        # pseudo-random normals fill in the remaining months
+        dimensions = min(months, MAX_SOBOL_DIMENSION)
+        normals = np.empty((size, months))
+        uniforms = sobol_points(size, dimensions, shift=random_shift(rng, dimensions))
+        normals[:, :dimensions] = normal_quantile(uniforms + 2.0 ** -33)
+        normals[:, dimensions:] = rng.standard_normal((size, months - dimensions))
+        cumulative = brownian_bridge(normals)
+    else:
+        if method == 'antithetic':
+            half = rng.standard_normal((size // 2, months))
+            normals = np.concatenate((half, -half))
+        else:
+            normals = rng.standard_normal((size, months))
+        cumulative = np.cumsum(normals, axis=1)
+    cumulative *= sigma
+    cumulative += drift * np.arange(1, months + 1)
+    
+    terminal, log_growth = _terminal_balances(cumulative, monthly_contribution, opening_balance)
+    estimand = terminal if target_amount is None else (terminal >= target_amount).astype(np.float64)
+    control = np.exp(log_growth)
+    num_paths = estimand.size
+    
+    # Independent samples: paths, antithetic pair averages or one randomized
+    # quasi-random replicate per chunk
+    if method == 'antithetic':
+        estimand = (estimand[:size // 2] + estimand[size // 2:]) / 2
+        control = (control[:size // 2] + control[size // 2:]) / 2
+    elif method == 'sobol':
+        estimand, control = estimand.mean(keepdims=True), control.mean(keepdims=True)
+    moments = np.array([estimand.size, estimand.sum(), (estimand ** 2).sum(), control.sum(),
+                        (control ** 2).sum(), (estimand * control).sum()])
+    return moments, num_paths
+
+
+def _estimate(moments, control_mean):
+    """Estimate and standard error from accumulated sample moments."""
+    count, total, squares, control_total, control_squares, cross = moments
+    if count < 2:
+        return np.nan, np.inf
+    mean = total / count
+    variance = (squares - count * mean ** 2) / (count - 1)
+    if control_mean is not None:
+        mean_control = control_total / count
+        control_variance = (control_squares - count * mean_control ** 2) / (count - 1)
+        covariance = (cross - count * mean * mean_control) / (count - 1)
+        if control_variance > 0:
+            beta = covariance / control_variance
+            mean -= beta * (mean_control - control_mean)
+            variance -= covariance ** 2 / control_variance
+    return mean, np.sqrt(max(variance, 0.0) / count)
+
+
+def estimate_goal_probability(target_amount, monthly_contribution, annual_return, volatility, months,
+                              opening_balance=0, method='monte_carlo', control_variate=False,
+                              target_error=None, max_paths=1000000, chunk_size=4096, seed=None,
+                              workers=1):
+    """
+    Estimate the probability of reaching a savings goal with variance reduction.
+    
+    Supports antithetic variates, randomized Sobol sampling over a Brownian
+    bridge and a control variate: the growth factor e^(L_n), whose
+    expectation is the closed-form compound growth (1 + r/12)^n used by
+    calculate_compound_interest. Chunks are simulated until the standard
+    error falls below target_error or max_paths is reached. Chunks are
+    evaluated in order, so the stopping point does not depend on workers.
+    
+    Args:
+        target_amount (float): Savings goal, or None to estimate the mean
+            terminal balance instead
+        monthly_contribution (float): Contribution at the end of each month
+        annual_return (float): Expected annual return (as percentage)
+        volatility (float): Annual volatility (as percentage)
+        months (int): Projection horizon in months
+        opening_balance (float): Starting balance
+        method (str): 'monte_carlo', 'antithetic' or 'sobol'
+        control_variate (bool): Adjust with the compound growth control variate
+        target_error (float): Stop once the standard error is at most this
+        max_paths (int): Upper bound on simulated paths
+        chunk_size (int): Paths per chunk (a power of two suits 'sobol'; each
+            Sobol chunk is one randomized replicate)
+        seed (int): Seed for reproducible results
+        workers (int): Worker processes
+    
+    Returns:
+        Estimate: Value, standard error, paths used and convergence flag
+    
+    Raises:
+        ValueError: If the method or any simulation parameter is invalid
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method: {method}")
+    if monthly_contribution < 0 or annual_return <= -1200 or volatility < 0 or months <= 0 \
+            or opening_balance < 0 or (target_amount is not None and target_amount <= 0):
+        raise ValueError("Invalid simulation parameters")
+    if max_paths <= 0 or chunk_size < 2 or workers <= 0:
+        raise ValueError("Path, chunk and worker counts must be positive")
+    
+    drift, sigma = monthly_log_return_parameters(annual_return, volatility)
+    control_mean = float(compound_growth(annual_return, months / 12, 12)) if control_variate else None
+    num_chunks = max(-(-max_paths // chunk_size), 2 if method == 'sobol' else 1)
+    streams = np.random.SeedSequence(seed).spawn(num_chunks)
+    tasks = [
+        (method, stream, chunk_size, int(months), monthly_contribution, drift, sigma,
+         opening_balance, target_amount)
+        for stream in streams
+    ]
+    
+    moments = np.zeros(6)
+    num_paths = 0
+    value, standard_error = np.nan, np.inf
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for start in range(0, num_chunks, workers):
+            batch = tasks[start:start + workers]
+            results = executor.map(_chunk_moments, batch) if executor else map(_chunk_moments, batch)
+            for chunk_moments, chunk_paths in results:
+                moments += chunk_moments
+                num_paths += chunk_paths
+                value, standard_error = _estimate(moments, control_mean)
+                if target_error is not None and standard_error <= target_error:
+                    return Estimate(value, standard_error, num_paths, True)
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+    return Estimate(value, standard_error, num_paths, target_error is None)
+
+
+ContributionResult = namedtuple('ContributionResult', ['contribution', 'success_probability'])
+ContributionResult.__doc__ = """
+Monthly contributions needed to reach savings goals with a given probability.
+
+Attributes:
+    contribution (numpy.ndarray): Smallest monthly contribution per client
+    success_probability (numpy.ndarray): Share of the simulated paths on
+        which that contribution reaches the target
+"""
+
+
+def required_contribution(target_amounts, annual_returns, volatility, months, probability=90,
+                          opening_balance=0, num_paths=10000, seed=None):
+    """
+    Find the monthly contribution that reaches each target with a given probability.
+    
+    One fixed set of random draws is shared by every client (common random
+    numbers). On a fixed path the terminal balance is linear in the
+    contribution, opening G + c A, so each path has a threshold
+    contribution (target - opening G) / A and the answer is the
+    probability-quantile of the thresholds: exactly the value a bisection
+    over the same paths converges to, without repeated simulation. Clients
+    with the same return assumptions and horizon share their paths.
+    
+    Args:
+        target_amounts (array-like): Savings goal per client
+        annual_returns (array-like): Expected annual return per client (as percentage)
+        volatility (array-like): Annual volatility per client (as percentage)
+        months (array-like): Horizon in months per client
+        probability (float): Required chance of success (as percentage)
+        opening_balance (array-like): Starting balance per client
+        num_paths (int): Number of simulated paths
+        seed (int): Seed for reproducible results
+    
+    Returns:
+        ContributionResult: Contribution and achieved success probability per client
+    
+    Raises:
+        ValueError: If any client or simulation parameter is invalid
+    """
+    target_amounts, annual_returns, volatility, months, opening_balance = (
+        np.ravel(values) for values in broadcast_inputs(
+            target_amounts, annual_returns, volatility, months, opening_balance)
+    )
+    if np.any(target_amounts <= 0) or np.any(annual_returns <= -1200) or np.any(volatility < 0) \
+            or np.any(months <= 0) or np.any(months != np.round(months)) or np.any(opening_balance < 0):
+        raise ValueError("Invalid savings goal parameters")
+    if not 0 < probability <= 100 or num_paths <= 0:
+        raise ValueError("Probability must be in (0, 100] and path count positive")
+    
+    normals = np.random.default_rng(seed).standard_normal((num_paths, int(months.max())))
+    rank = int(np.ceil(probability / 100 * num_paths)) - 1
+    contribution = np.empty(target_amounts.size)
+    success = np.empty(target_amounts.size)
+    
+    groups, group_of = np.unique(np.column_stack((annual_returns, volatility, months)), axis=0,
+                                 return_inverse=True)
+    for group, (annual_return, sigma_annual, horizon) in enumerate(groups):
+        clients = np.flatnonzero(group_of.ravel() == group)
+        horizon = int(horizon)
+        drift, sigma = monthly_log_return_parameters(annual_return, sigma_annual)
+        cumulative = np.cumsum(normals[:, :horizon], axis=1)
+        cumulative *= sigma
+        cumulative += drift * np.arange(1, horizon + 1)
+        annuity, log_growth = _terminal_balances(cumulative, 1.0, 0.0)
+        
+        thresholds = (target_amounts[clients, None] - opening_balance[clients, None] * np.exp(log_growth)) \
+            / annuity
+        needed = np.maximum(np.partition(thresholds, rank, axis=1)[:, rank], 0.0)
+        contribution[clients] = needed
+        success[clients] = np.mean(thresholds <= needed[:, None], axis=1)
+    return ContributionResult(contribution, success)
@@ -0,0 +1,132 @@
+"""
+Prepayment simulation for the Personal Finance Calculator.
+Runs whole portfolios of monthly loans in lockstep with recurring and
+one-off extra principal payments, retiring loans as they pay off.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.amortization import ScheduleRow, interest_paid_through
+from finance_calculator.batch import BatchCalculator, broadcast_inputs
+from finance_calculator.curve import YieldCurve
+
+
+PrepaymentResult = namedtuple('PrepaymentResult', [
+    'payoff_period', 'interest_paid', 'interest_saved', 'schedule'
+])
+PrepaymentResult.__doc__ = """
+Result of a prepayment simulation.
+
+Attributes:
+    payoff_period (numpy.ndarray): Period in which each loan is paid off
+    interest_paid (numpy.ndarray): Total interest paid with prepayments
+    interest_saved (numpy.ndarray): Interest saved versus the original schedule
+    schedule (ScheduleRow): Adjusted schedule as (loans x periods) matrices, or
+        None unless requested. Periods after payoff are zero.
+"""
+
+
+def simulate_prepayments(loan_amounts, annual_rates, years, extra_monthly=0,
+                         lump_sums=None, record_schedule=False):
+    """
+    Simulate extra principal payments across a portfolio of loans.
+    
+    Every loan keeps its scheduled payment from calculate_monthly_payment
+    and adds its recurring extra payment plus any one-off payments due
+    that period. With a curve every loan accrues at the curve's forward
+    rate for each month. All loans advance one period at a time together; loans
+    that have paid off are dropped from the active set, so the work per
+    period shrinks as the portfolio retires.
+    
+    Args:
+        loan_amounts (array-like): Loan amounts
+        annual_rates (array-like or YieldCurve): Annual interest rates (as
+            percentage), or one curve to discount every loan's payments off
+        years (array-like): Loan terms in years
+        extra_monthly (array-like): Recurring extra principal per period
+        lump_sums (tuple): Optional (loan_index, period, amount) arrays of
+            one-off extra payments; periods run from 1 to the loan's term
+        record_schedule (bool): Also return the adjusted schedule matrices
+    
+    Returns:
+        PrepaymentResult: Payoff periods, interest paid and saved, and the
+        optional adjusted schedule
+    
+    Raises:
+        ValueError: If any loan or extra payment is invalid
+    """
+    curve = annual_rates if isinstance(annual_rates, YieldCurve) else None
+    rates = curve if curve is not None else annual_rates
+    loan_amounts, annual_rates, years, extra_monthly = (
+        np.ravel(values) for values in broadcast_inputs(
+            loan_amounts, 0 if curve is not None else annual_rates, years, extra_monthly)
+    )
+    payments, errors = BatchCalculator().calculate_monthly_payment(loan_amounts, rates, years)
+    if np.any(errors) or np.any(extra_monthly < 0):
+        raise ValueError("Invalid loan parameters")
+    
+    num_loans = loan_amounts.size
+    num_payments = np.round(years * 12).astype(np.int64)
+    max_periods = int(num_payments.max(initial=0))
+    monthly_rates = annual_rates / 100 / 12
+    if curve is not None:
+        discount = curve.monthly_discount_factors(max_periods)
+        period_rates = discount[:-1] / discount[1:] - 1
+    
+    if lump_sums is not None:
+        lump_loans, lump_periods, lump_amounts = (np.ravel(values) for values in lump_sums)
+        lump_loans = lump_loans.astype(np.int64)
+        lump_periods = lump_periods.astype(np.int64)
+        lump_amounts = lump_amounts.astype(np.float64)
+        if np.any(lump_amounts < 0) or np.any((lump_loans < 0) | (lump_loans >= num_loans)) \
+                or np.any((lump_periods < 1) | (lump_periods > num_payments[lump_loans])):
+            raise ValueError("Invalid lump-sum payments")
+        order = np.argsort(lump_periods, kind='stable')
+        lump_loans, lump_periods, lump_amounts = lump_loans[order], lump_periods[order], lump_amounts[order]
+    else:
+        lump_loans = lump_periods = np.zeros(0, dtype=np.int64)
+        lump_amounts = np.zeros(0)
+    
+    balances = loan_amounts.copy()
+    interest_paid = np.zeros(num_loans)
+    payoff_period = np.zeros(num_loans, dtype=np.int64)
+    lump_due = np.zeros(num_loans)
+    if record_schedule:
+        columns = {name: np.zeros((num_loans, max_periods)) for name in ScheduleRow._fields[1:]}
+    
+    active = np.arange(num_loans)
+    for period in range(1, max_periods + 1):
+        if active.size == 0:
+            break
+        
+        # One-off payments due this period
+        start, stop = np.searchsorted(lump_periods, [period, period + 1])
+        np.add.at(lump_due, lump_loans[start:stop], lump_amounts[start:stop])
+        
+        balance = balances[active]
+        interest = balance * (period_rates[period - 1] if curve is not None else monthly_rates[active])
+        available = payments[active] + extra_monthly[active] + lump_due[active]
+        lump_due[lump_loans[start:stop]] = 0.0
+        
+        finished = (balance + interest <= available) | (period >= num_payments[active])
+        principal = np.where(finished, balance, available - interest)
+        balance = np.where(finished, 0.0, balance - principal)
+        
+        balances[active] = balance
+        interest_paid[active] += interest
+        payoff_period[active[finished]] = period
+        if record_schedule:
+            columns['payment'][active, period - 1] = principal + interest
+            columns['interest'][active, period - 1] = interest
+            columns['principal'][active, period - 1] = principal
+            columns['balance'][active, period - 1] = balance
+        
+        active = active[~finished]
+    
+    baseline = interest_paid_through(loan_amounts, rates, years, num_payments).values
+    schedule = None
+    if record_schedule:
+        schedule = ScheduleRow(np.arange(1, max_periods + 1), **columns)
+    return PrepaymentResult(payoff_period, interest_paid, baseline - interest_paid, schedule)
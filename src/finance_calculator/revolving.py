@@ -0,0 +1,107 @@
+"""
+Revolving credit payoff for the Personal Finance Calculator.
+Simulates minimum-payment (or fixed-payment) payoff of credit card
+balances for many accounts at once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+
+
+PayoffResult = namedtuple('PayoffResult', ['months', 'total_interest', 'total_paid', 'paid_off'])
+PayoffResult.__doc__ = """
+Result of a revolving balance payoff simulation.
+
+Attributes:
+    months (numpy.ndarray): Months until the balance is cleared (max_months if never)
+    total_interest (numpy.ndarray): Total interest charged
+    total_paid (numpy.ndarray): Total amount paid
+    paid_off (numpy.ndarray): Whether the balance was cleared within max_months
+"""
+
+
+def simulate_revolving_payoff(balances, aprs, minimum_percent=2, minimum_floor=25,
+                              fixed_payment=0, max_months=1200):
+    """
+    Calculate months to payoff and total interest for revolving balances.
+    
+    Each month interest is charged on the balance (rounded to the cent) and
+    the payment is the larger of the minimum payment and the fixed payment,
+    where the minimum is minimum_percent of the statement balance but at
+    least minimum_floor. The payment never exceeds the statement balance.
+    Finished accounts are compacted out of the working arrays whenever a
+    quarter of them have paid off, so the work shrinks with the portfolio.
+    
+    Args:
+        balances (array-like): Starting balances
+        aprs (array-like): Annual percentage rates (as percentage)
+        minimum_percent (array-like): Minimum payment as a percentage of the
+            statement balance
+        minimum_floor (array-like): Smallest minimum payment
+        fixed_payment (array-like): Fixed monthly payment (0 for minimum only)
+        max_months (int): Months simulated before giving up
+    
+    Returns:
+        PayoffResult: Months to payoff, total interest, total paid and
+        payoff flags per account
+    
+    Raises:
+        ValueError: If any input is invalid
+    """
+    balances, aprs, minimum_percent, minimum_floor, fixed_payment = (
+        np.ravel(values) for values in broadcast_inputs(
+            balances, aprs, minimum_percent, minimum_floor, fixed_payment)
+    )
+    if np.any(balances < 0) or np.any(aprs < 0) or np.any(minimum_percent <= 0) \
+            or np.any(minimum_percent > 100) or np.any(minimum_floor < 0) or np.any(fixed_payment < 0):
+        raise ValueError("Invalid payoff parameters")
+    if max_months <= 0:
+        raise ValueError("Maximum months must be positive")
+    
+    num_accounts = balances.size
+    months = np.zeros(num_accounts, dtype=np.int64)
+    total_interest = np.zeros(num_accounts)
+    total_paid = np.zeros(num_accounts)
+    paid_off = np.ones(num_accounts, dtype=bool)
+    
+    # Working arrays for the accounts that still carry a balance. A zero
+    # balance stays at zero (no interest, zero payment), so finished accounts
+    # can ride along until enough of them have accumulated to compact.
+    active = np.flatnonzero(balances > 0)
+    working = [active, balances[active], aprs[active] / 100 / 12, minimum_percent[active] / 100,
+               minimum_floor[active], fixed_payment[active], np.zeros(active.size),
+               np.zeros(active.size), np.zeros(active.size, dtype=np.int64)]
+    
+    def flush(rows):
+        """Store the results of the given working rows."""
+        done, _, _, _, _, _, interest_paid, paid, elapsed = (values[rows] for values in working)
+        months[done] = elapsed
+        total_interest[done] = interest_paid
+        total_paid[done] = paid
+    
+    for _ in range(max_months):
+        active, balance, monthly_rate, percent, floor, fixed, interest_paid, paid, elapsed = working
+        open_accounts = balance > 0
+        num_open = np.count_nonzero(open_accounts)
+        if num_open == 0:
+            break
+        if num_open < 0.75 * active.size:
+            flush(~open_accounts)
+            working = [values[open_accounts] for values in working]
+            active, balance, monthly_rate, percent, floor, fixed, interest_paid, paid, elapsed = working
+            open_accounts = np.ones(active.size, dtype=bool)
+        
+        interest = np.round(balance * monthly_rate, 2)
+        statement = balance + interest
+        payment = np.minimum(np.maximum(np.maximum(statement * percent, floor), fixed), statement)
+        working[1] = statement - payment
+        interest_paid += interest
+        paid += payment
+        elapsed += open_accounts
+    
+    flush(slice(None))
+    paid_off[working[0]] = working[1] <= 0
+    return PayoffResult(months, total_interest, total_paid, paid_off)
@@ -0,0 +1,100 @@
+"""
+Vectorized root finding for the Personal Finance Calculator.
+Solves many independent equations at once with a safeguarded Newton method
+(Newton steps that fall back to bisection inside a sign-change bracket).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+RootResult = namedtuple('RootResult', ['root', 'iterations', 'converged'])
+RootResult.__doc__ = """
+Result of a vectorized root solve.
+
+Attributes:
+    root (numpy.ndarray): Per-row roots (NaN where the solve failed)
+    iterations (numpy.ndarray): Per-row iteration counts
+    converged (numpy.ndarray): Per-row convergence flags
+"""
+
+
+def newton_bisect(func, lower, upper, initial=None, tol=1e-12, max_iter=100):
+    """
+    Find one root per row of func inside [lower, upper].
+    
+    Rows are iterated together and dropped from the active set as soon as
+    they converge, so each iteration only evaluates unfinished rows. A
+    Newton step is used whenever it stays inside the current bracket;
+    otherwise the row bisects.
+    
+    Args:
+        func: Callable func(x, rows) returning (f, df) for the given row indices
+        lower (array-like): Per-row lower bracket
+        upper (array-like): Per-row upper bracket
+        initial (array-like): Per-row starting points (defaults to the bracket midpoint)
+        tol (float): Relative step tolerance
+        max_iter (int): Maximum iterations per row
+    
+    Returns:
+        RootResult: Flattened per-row roots, iteration counts and convergence
+        flags. Rows whose bracket has no sign change are reported as not converged.
+    """
+    lower, upper = np.broadcast_arrays(np.asarray(lower, dtype=np.float64),
+                                       np.asarray(upper, dtype=np.float64))
+    lower = lower.ravel().copy()
+    upper = upper.ravel().copy()
+    size = lower.size
+    rows = np.arange(size)
+    
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        f_lower, _ = func(lower, rows)
+        f_upper, _ = func(upper, rows)
+    
+    root = np.full(size, np.nan)
+    iterations = np.zeros(size, dtype=np.int64)
+    converged = np.zeros(size, dtype=bool)
+    
+    # Bracket ends that are already roots
+    for edge, f_edge in ((lower, f_lower), (upper, f_upper)):
+        hit = (f_edge == 0) & ~converged
+        root[hit] = edge[hit]
+        converged[hit] = True
+    
+    bracketed = np.sign(f_lower) * np.sign(f_upper) < 0
+    if initial is None:
+        x = 0.5 * (lower + upper)
+    else:
+        x = np.clip(np.broadcast_to(np.asarray(initial, dtype=np.float64), lower.shape).ravel(), lower, upper)
+    
+    active = np.flatnonzero(bracketed & ~converged)
+    lo, hi, f_lo = lower[active], upper[active], f_lower[active]
+    x = x[active]
+    
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        iterations[active] += 1
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            f, df = func(x, active)
+            same_side = np.sign(f) == np.sign(f_lo)
+            lo = np.where(same_side, x, lo)
+            f_lo = np.where(same_side, f, f_lo)
+            hi = np.where(same_side, hi, x)
+            
+            newton = x - f / df
+            use_newton = np.isfinite(newton) & (newton >= lo) & (newton <= hi)
+            x_new = np.where(use_newton, newton, 0.5 * (lo + hi))
+        
+        done = (f == 0) | (np.abs(x_new - x) <= tol * np.maximum(1.0, np.abs(x))) | \
+            (hi - lo <= tol * np.maximum(1.0, np.abs(x)))
+        finished = active[done]
+        root[finished] = np.where(f[done] == 0, x[done], x_new[done])
+        converged[finished] = True
+        
+        keep = ~done
+        active, x, lo, hi, f_lo = active[keep], x_new[keep], lo[keep], hi[keep], f_lo[keep]
+    
+    return RootResult(root, iterations, converged)
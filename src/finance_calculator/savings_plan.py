@@ -0,0 +1,215 @@
+"""
+Savings plans for the Personal Finance Calculator.
+Handles opening balances and time-varying monthly contributions (step-ups
+and pauses) for many plans at once using prefix sums.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import as_float_array, broadcast_inputs
+from finance_calculator.curve import require_flat_rates
+from finance_calculator.tvm import annuity_factor
+
+
+GoalResult = namedtuple('GoalResult', ['months', 'balance', 'reached'])
+GoalResult.__doc__ = """
+Result of a batch savings goal solve.
+
+Attributes:
+    months (numpy.ndarray): First month whose ending balance meets the target
+        (the horizon if it is never met)
+    balance (numpy.ndarray): Balance at the end of that month
+    reached (numpy.ndarray): Whether the target is met within the horizon
+"""
+
+
+def contribution_schedule(monthly_contribution, months, step_up=0, step_every=12, pauses=None):
+    """
+    Build a (plans x months) matrix of monthly contributions.
+    
+    Args:
+        monthly_contribution (array-like): Starting contribution per plan
+        months (int): Number of months in the schedule
+        step_up (array-like): Percentage increase applied every step_every months
+        step_every (int): Months between step-ups
+        pauses (tuple): Optional (plan_index, start_month, stop_month) arrays;
+            no contribution is made in months start_month..stop_month - 1
+            (months count from 1)
+    
+    Returns:
+        numpy.ndarray: Contribution for each plan and month
+    
+    Raises:
+        ValueError: If the schedule parameters are invalid
+    """
+    monthly_contribution, step_up = np.broadcast_arrays(
+        np.atleast_1d(as_float_array(monthly_contribution)), as_float_array(step_up))
+    monthly_contribution, step_up = monthly_contribution.ravel(), step_up.ravel()
+    if months <= 0 or step_every <= 0 or np.any(monthly_contribution < 0) or np.any(step_up <= -100):
+        raise ValueError("Invalid contribution schedule")
+    
+    steps = np.arange(months) // step_every
+    schedule = monthly_contribution[:, None] * (1 + step_up[:, None] / 100) ** steps
+    if pauses is not None:
+        plan, start, stop = (np.ravel(values).astype(np.int64) for values in pauses)
+        if np.any((plan < 0) | (plan >= schedule.shape[0])) or np.any(start < 1) or np.any(stop < start):
+            raise ValueError("Invalid contribution pauses")
+        # Mark pause boundaries and accumulate to get overlapping pause counts
+        depth = np.zeros((schedule.shape[0], months + 1), dtype=np.int64)
+        np.add.at(depth, (plan, np.minimum(start - 1, months)), 1)
+        np.add.at(depth, (plan, np.minimum(stop - 1, months)), -1)
+        schedule[np.cumsum(depth, axis=1)[:, :months] > 0] = 0.0
+    return schedule
+
+
+def discounted_contributions(annual_rates, contributions):
+    """
+    Calculate prefix sums of contributions discounted to month 0.
+    
+    With end-of-month contributions c_k and growth g = 1 + r/12, the balance
+    after month m is g^m (opening + D_m) where D_m = sum_{k <= m} c_k g^-k.
+    
+    Args:
+        annual_rates (array-like): Annual interest rate per plan (as percentage)
+        contributions (numpy.ndarray): (plans x months) contribution matrix
+    
+    Returns:
+        tuple: (D as a (plans x months) matrix, log growth per month per plan)
+    """
+    months = np.arange(1, contributions.shape[1] + 1)
+    log_growth = np.log1p(np.ravel(annual_rates) / 100 / 12)[:, None]
+    return np.cumsum(contributions * np.exp(-months * log_growth), axis=1), log_growth
+
+
+def months_to_goal(target_amounts, annual_rates, contributions, opening_balance=0):
+    """
+    Find the month in which each savings plan reaches its target.
+    
+    The discounted contributions are accumulated once per plan; since
+    balances never decrease for non-negative rates and contributions, the
+    crossing month is then found by a vectorized binary search in
+    O(log months) per plan instead of stepping through every month.
+    
+    Args:
+        target_amounts (array-like): Target amount per plan
+        annual_rates (array-like): Annual interest rate per plan (as
+            percentage); a YieldCurve is not supported
+        contributions (array-like): (plans x months) contribution matrix, or
+            one row shared by every plan (see contribution_schedule)
+        opening_balance (array-like): Starting balance per plan
+    
+    Returns:
+        GoalResult: Crossing month, balance and reached flag per plan
+    
+    Raises:
+        ValueError: If any plan is invalid or a YieldCurve is given
+    """
+    require_flat_rates(annual_rates)
+    contributions = np.atleast_2d(as_float_array(contributions))
+    target_amounts, annual_rates, opening_balance = (
+        np.ravel(values) for values in broadcast_inputs(target_amounts, annual_rates, opening_balance)
+    )
+    num_plans = max(target_amounts.size, contributions.shape[0])
+    target_amounts, annual_rates, opening_balance = (
+        np.broadcast_to(values, (num_plans,)) for values in (target_amounts, annual_rates, opening_balance)
+    )
+    contributions = np.broadcast_to(contributions, (num_plans, contributions.shape[1]))
+    if np.any(target_amounts <= 0) or np.any(annual_rates < 0) or np.any(opening_balance < 0) \
+            or np.any(contributions < 0):
+        raise ValueError("Invalid savings plan parameters")
+    
+    discounted, log_growth = discounted_contributions(annual_rates, contributions)
+    log_growth = log_growth[:, 0]
+    plans = np.arange(num_plans)
+    
+    def funded(month):
+        """Opening balance plus discounted contributions through each plan's month."""
+        return opening_balance + np.where(month > 0, discounted[plans, np.maximum(month - 1, 0)], 0.0)
+    
+    def reached_by(month):
+        """Whether the balance after each plan's month meets its target."""
+        return funded(month) >= target_amounts * np.exp(-month * log_growth)
+    
+    # Smallest month in [0, horizon] whose balance meets the target
+    lower = np.zeros(num_plans, dtype=np.int64)
+    upper = np.full(num_plans, discounted.shape[1], dtype=np.int64)
+    reached = reached_by(upper)
+    while np.any(lower < upper):
+        middle = (lower + upper) // 2
+        met = reached_by(middle)
+        upper = np.where(met, middle, upper)
+        lower = np.where(met, lower, middle + 1)
+    
+    balance = np.exp(upper * log_growth) * funded(upper)
+    return GoalResult(upper, balance, reached)
+
+
+def project_balances(monthly_contribution, annual_rates, months, escalation=0, when='end',
+                     opening_balance=0, escalate_every=12, paths=False):
+    """
+    Project savings balances forward from a contribution stream.
+    
+    Contributions grow by escalation percent every escalate_every months.
+    Terminal values use the closed form: each block of level contributions
+    is an annuity, and the escalating blocks form a geometric series with
+    ratio (1 + e) / (1 + r/12)^p, so no per-month work is needed. Paths are
+    built from discounted prefix sums over the contribution schedule.
+    
+    Args:
+        monthly_contribution (array-like): Starting monthly contribution per plan
+        annual_rates (array-like): Annual interest rates (as percentage); a
+            YieldCurve is not supported
+        months (array-like): Projection horizon in months (a single horizon
+            when paths are requested)
+        escalation (array-like): Contribution increase per step (as percentage)
+        when (str): 'end' or 'begin' for contribution timing
+        opening_balance (array-like): Starting balance per plan
+        escalate_every (int): Months between contribution increases
+        paths (bool): Return every month's balance instead of the terminal value
+    
+    Returns:
+        numpy.ndarray: Terminal balances per plan, or a (plans x months)
+        matrix of balances at the end of each month when paths is True
+    
+    Raises:
+        ValueError: If any plan is invalid, timing is unknown or a YieldCurve
+            is given
+    """
+    require_flat_rates(annual_rates)
+    if when not in ('end', 'begin'):
+        raise ValueError("Contribution timing must be 'end' or 'begin'")
+    monthly_contribution, annual_rates, months, escalation, opening_balance = broadcast_inputs(
+        monthly_contribution, annual_rates, months, escalation, opening_balance)
+    if np.any(monthly_contribution < 0) or np.any(annual_rates < 0) or np.any(months < 0) \
+            or np.any(months != np.round(months)) or np.any(escalation <= -100) \
+            or np.any(opening_balance < 0) or escalate_every <= 0:
+        raise ValueError("Invalid projection parameters")
+    
+    monthly_rate = annual_rates / 100 / 12
+    # Beginning-of-month contributions earn one extra month of interest
+    timing = 1 + monthly_rate if when == 'begin' else np.ones_like(monthly_rate)
+    
+    if paths:
+        horizon = np.unique(months)
+        if horizon.size != 1:
+            raise ValueError("Balance paths need a single horizon")
+        contributions = contribution_schedule(np.ravel(monthly_contribution), int(horizon[0]),
+                                              step_up=np.ravel(escalation), step_every=escalate_every)
+        contributions = contributions * np.ravel(timing)[:, None]
+        discounted, log_growth = discounted_contributions(np.ravel(annual_rates), contributions)
+        growth = np.exp(np.arange(1, contributions.shape[1] + 1) * log_growth)
+        return growth * (np.ravel(opening_balance)[:, None] + discounted)
+    
+    blocks, rest = np.divmod(months, escalate_every)
+    log_growth = np.log1p(monthly_rate)
+    log_ratio = np.log1p(escalation / 100) - escalate_every * log_growth
+    with np.errstate(divide='ignore', invalid='ignore'):
+        series = np.where(log_ratio == 0, blocks, np.expm1(blocks * log_ratio) / np.expm1(log_ratio))
+    full_blocks = annuity_factor(monthly_rate, escalate_every) * \
+        np.exp((months - escalate_every) * log_growth) * series
+    last_block = (1 + escalation / 100) ** blocks * annuity_factor(monthly_rate, rest)
+    contributed = monthly_contribution * timing * np.where(blocks > 0, full_blocks, 0.0)
+    return opening_balance * np.exp(months * log_growth) + contributed + \
+        monthly_contribution * timing * last_block
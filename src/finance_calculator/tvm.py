@@ -0,0 +1,166 @@
+"""
+Time-value-of-money solver for the Personal Finance Calculator.
+Solves the standard annuity equation for any one of present value, future
+value, payment, rate or number of periods, vectorized over arrays.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from finance_calculator.batch import broadcast_inputs
+from finance_calculator.rootfinding import newton_bisect
+
+
+TVM_VARIABLES = ('pv', 'fv', 'pmt', 'rate', 'nper')
+
+TVMResult = namedtuple('TVMResult', ['values', 'iterations', 'converged'])
+TVMResult.__doc__ = """
+Result of a vectorized TVM solve.
+
+Attributes:
+    values (numpy.ndarray): Solved values (NaN where no solution was found)
+    iterations (numpy.ndarray): Per-row iteration counts (0 for closed-form solves)
+    converged (numpy.ndarray): Per-row success flags
+"""
+
+
+def annuity_factor(period_rate, nper):
+    """
+    Calculate ((1 + i)^n - 1) / i, with its limit n at i = 0.
+    
+    Args:
+        period_rate (array-like): Rate per period (as decimal)
+        nper (array-like): Number of periods
+    
+    Returns:
+        numpy.ndarray: Annuity factors
+    """
+    period_rate, nper = broadcast_inputs(period_rate, nper)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.expm1(nper * np.log1p(period_rate)) / period_rate
+    return np.where(period_rate == 0, nper, factor)
+
+
+def tvm_balance(period_rate, nper, pmt, pv, fv, when=0):
+    """
+    Evaluate pv (1+i)^n + pmt (1 + i w) ((1+i)^n - 1) / i + fv.
+    
+    The equation is zero when the cash flows balance. Money paid out is
+    negative and money received is positive, so a loan has a positive pv
+    and a negative pmt.
+    
+    Args:
+        period_rate (array-like): Rate per period (as decimal)
+        nper (array-like): Number of periods
+        pmt (array-like): Payment per period
+        pv (array-like): Present value
+        fv (array-like): Future value
+        when (array-like): 0 for end-of-period payments, 1 for beginning
+    
+    Returns:
+        numpy.ndarray: Residual of the TVM equation
+    """
+    growth = np.exp(nper * np.log1p(period_rate))
+    return pv * growth + pmt * (1 + period_rate * when) * annuity_factor(period_rate, nper) + fv
+
+
+def _rate_residual(nper, pmt, pv, fv, when):
+    """Build f(i), f'(i) of the TVM equation for the rate solve."""
+    def residual(period_rate, rows):
+        n, payment, present, future, timing = nper[rows], pmt[rows], pv[rows], fv[rows], when[rows]
+        growth = np.exp(n * np.log1p(period_rate))
+        factor = annuity_factor(period_rate, n)
+        # d/di of ((1+i)^n - 1) / i, with limit n (n - 1) / 2 at i = 0
+        d_factor = np.where(
+            period_rate == 0,
+            n * (n - 1) / 2,
+            (n * growth / (1 + period_rate) - factor) / np.where(period_rate == 0, 1, period_rate),
+        )
+        f = present * growth + payment * (1 + period_rate * timing) * factor + future
+        df = present * n * growth / (1 + period_rate) + \
+            payment * (timing * factor + (1 + period_rate * timing) * d_factor)
+        return f, df
+    return residual
+
+
+def solve_tvm(pv=None, fv=None, pmt=None, rate=None, nper=None, when='end',
+              periods_per_year=12, tol=1e-12, max_iter=100):
+    """
+    Solve the time-value-of-money equation for the one missing variable.
+    
+    Rates follow the calculator's convention of annual percentages, so the
+    per-period rate is rate / 100 / periods_per_year. PV, FV and PMT follow
+    the usual sign convention (see tvm_balance). Every argument may be an
+    array; arrays are broadcast against each other.
+    
+    Args:
+        pv (array-like): Present value
+        fv (array-like): Future value
+        pmt (array-like): Payment per period
+        rate (array-like): Annual interest rate (as percentage)
+        nper (array-like): Number of periods
+        when (str): 'end' or 'begin' for payment timing
+        periods_per_year (int): Compounding/payment periods per year
+        tol (float): Relative tolerance for the rate solve
+        max_iter (int): Maximum Newton/bisection iterations for the rate solve
+    
+    Returns:
+        TVMResult: Solved values, iteration counts and convergence flags
+    
+    Raises:
+        ValueError: If not exactly one variable is missing or timing is unknown
+    """
+    given = {'pv': pv, 'fv': fv, 'pmt': pmt, 'rate': rate, 'nper': nper}
+    missing = [name for name in TVM_VARIABLES if given[name] is None]
+    if len(missing) != 1:
+        raise ValueError("Exactly one of pv, fv, pmt, rate and nper must be None")
+    if when not in ('end', 'begin'):
+        raise ValueError("Payment timing must be 'end' or 'begin'")
+    if periods_per_year <= 0:
+        raise ValueError("Periods per year must be positive")
+    
+    unknown = missing[0]
+    known = [name for name in TVM_VARIABLES if name != unknown]
+    arrays = dict(zip(known, broadcast_inputs(*[given[name] for name in known])))
+    shape = arrays[known[0]].shape
+    timing = 1.0 if when == 'begin' else 0.0
+    
+    if unknown == 'rate':
+        flat = {name: np.ascontiguousarray(values).ravel() for name, values in arrays.items()}
+        size = flat['nper'].size
+        result = newton_bisect(
+            _rate_residual(flat['nper'], flat['pmt'], flat['pv'], flat['fv'], np.full(size, timing)),
+            lower=np.full(size, -0.99), upper=np.full(size, 1.0), initial=0.01,
+            tol=tol, max_iter=max_iter,
+        )
+        return TVMResult(
+            (result.root * 100 * periods_per_year).reshape(shape),
+            result.iterations.reshape(shape),
+            result.converged.reshape(shape),
+        )
+    
+    period_rate = arrays['rate'] / 100 / periods_per_year
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if unknown == 'nper':
+            payment, present, future = arrays['pmt'], arrays['pv'], arrays['fv']
+            # (1+i)^n (pv + s) = s - fv with s = pmt (1 + i w) / i
+            scaled = payment * (1 + period_rate * timing) / np.where(period_rate == 0, 1, period_rate)
+            values = np.where(
+                period_rate == 0,
+                -(present + future) / payment,
+                np.log((scaled - future) / (present + scaled)) / np.log1p(period_rate),
+            )
+        else:
+            periods = arrays['nper']
+            growth = np.exp(periods * np.log1p(period_rate))
+            annuity = (1 + period_rate * timing) * annuity_factor(period_rate, periods)
+            if unknown == 'fv':
+                values = -(arrays['pv'] * growth + arrays['pmt'] * annuity)
+            elif unknown == 'pv':
+                values = -(arrays['fv'] + arrays['pmt'] * annuity) / growth
+            else:
+                values = -(arrays['fv'] + arrays['pv'] * growth) / annuity
+    
+    converged = np.isfinite(values)
+    return TVMResult(np.where(converged, values, np.nan), np.zeros(shape, dtype=np.int64), converged)
@@ -148,6 +148,27 @@ class TestFinanceAppIntegration(unittest.TestCase):
         result = self.app.calculate_interest("2000", "3.5", "2", compound=True, frequency=0)
         self.assertFalse(result['success'])
         self.assertIn('error', result)
+    
+    def test_payment_grid_integration(self):
+        """Test that the payment grid agrees with per-cell loan calculations."""
+        result = self.app.calculate_payment_grid(["0", "4.5"], ["4", "30"], ["15000", "200000"])
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['monthly_payment'].shape, (2, 2, 2))
+        
+        # Every cell should match the single-loan workflow
+        for i, rate in enumerate(["0", "4.5"]):
+            for j, term in enumerate(["4", "30"]):
+                for k, amount in enumerate(["15000", "200000"]):
+                    single = self.app.calculate_loan_payment(amount, rate, term)
+                    self.assertEqual(result['monthly_payment'][i, j, k], single['monthly_payment'])
+                    self.assertEqual(result['total_payment'][i, j, k], single['total_payment'])
+                    self.assertEqual(result['total_interest'][i, j, k], single['total_interest'])
+        
+        # Invalid axis values are reported like the single-loan workflow
+        result = self.app.calculate_payment_grid(["4.5"], ["0"], ["15000"])
+        self.assertFalse(result['success'])
+        self.assertIn('error', result)
 
 
 class TestComponentIntegration(unittest.TestCase):
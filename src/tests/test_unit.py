@@ -7,8 +7,49 @@ Each test verifies a single function's behavior with various inputs.
 
 import unittest
 import math
+import array
+import os
+import tempfile
+from decimal import localcontext, Decimal, ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN, ROUND_UP, ROUND_HALF_DOWN
+
+import numpy as np
+
 from finance_calculator.calculator import FinanceCalculator
 from finance_calculator.validator import InputValidator
+from finance_calculator.growth import GrowthFactorCache
+from finance_calculator.amortization import (
+    iter_amortization_schedule, iter_portfolio_schedules, balance_after_payment, interest_paid_through,
+    AmortizationSchedule
+)
+from finance_calculator.fixed_point import (
+    CentsCalculator, divide_rounded, divide_rounded_array, exact_value, to_cents, from_cents
+)
+from finance_calculator.tvm import solve_tvm, tvm_balance
+from finance_calculator.irr import batch_irr, batch_apr, npv_ragged, as_ragged
+from finance_calculator.compounding import compound_growth, compound_interest_earned
+from finance_calculator.grid import payment_grid
+from finance_calculator.dual import (
+    Dual, exp, log, monthly_payment_sensitivities, savings_goal_sensitivities
+)
+from finance_calculator.prepayment import simulate_prepayments
+from finance_calculator.arm import arm_schedule
+from finance_calculator.revolving import simulate_revolving_payoff
+from finance_calculator.debt_planner import Debt, plan_payoff, batch_plan_payoff
+from finance_calculator.savings_plan import contribution_schedule, months_to_goal, project_balances
+from finance_calculator.monte_carlo import (
+    simulate_terminal_balances, simulate_savings_goal, estimate_goal_probability, brownian_bridge,
+    required_contribution
+)
+from finance_calculator.sobol import MAX_SOBOL_DIMENSION, sobol_points, normal_quantile
+from finance_calculator.drawdown import load_returns, bootstrap_log_growth, simulate_drawdown
+from finance_calculator.bonds import accrued_interest, bond_metrics, bond_price, bond_yield
+from finance_calculator.dated import xnpv, xirr
+from finance_calculator.daycount import BusinessCalendar, accrued_simple_interest, day_count, year_fraction
+from finance_calculator.curve import YieldCurve
+from finance_calculator.batch import (
+    BatchCalculator, ERROR_NONE, ERROR_INVALID_AMOUNT, ERROR_INVALID_RATE,
+    ERROR_INVALID_TERM, ERROR_INVALID_FREQUENCY, ERROR_INVALID_CONTRIBUTION, ERROR_INVALID_PERIOD
+)
 
 
 class TestFinanceCalculator(unittest.TestCase):
@@ -226,6 +267,1402 @@ class TestInputValidator(unittest.TestCase):
             self.validator.validate_savings_inputs("5000", "200", "-1")
 
 
+class TestBatchCalculator(unittest.TestCase):
+    """Unit tests for the vectorized BatchCalculator."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = FinanceCalculator()
+        self.batch = BatchCalculator()
+    
+    def test_batch_matches_scalar_methods(self):
+        """Test that every batch method agrees with its scalar counterpart."""
+        amounts = [1000, 15000, 250000.5]
+        rates = [0, 4.5, 7.25]
+        terms = [1, 4, 30]
+        
+        payments = self.batch.calculate_monthly_payment(amounts, rates, terms)
+        simple = self.batch.calculate_simple_interest(amounts, rates, terms)
+        compound = self.batch.calculate_compound_interest(amounts, rates, terms, 12)
+        savings = self.batch.calculate_savings_goal(amounts, 200, rates)
+        
+        for i in range(3):
+            self.assertAlmostEqual(payments.values[i],
+                                   self.calculator.calculate_monthly_payment(amounts[i], rates[i], terms[i]))
+            self.assertAlmostEqual(simple.values[i],
+                                   self.calculator.calculate_simple_interest(amounts[i], rates[i], terms[i]))
+            self.assertAlmostEqual(compound.values[i],
+                                   self.calculator.calculate_compound_interest(amounts[i], rates[i], terms[i], 12))
+            self.assertAlmostEqual(savings.values[i],
+                                   self.calculator.calculate_savings_goal(amounts[i], 200, rates[i]))
+        self.assertTrue(np.all(payments.errors == ERROR_NONE))
+    
+    def test_batch_error_codes(self):
+        """Test that invalid rows are flagged instead of raising."""
+        result = self.batch.calculate_monthly_payment([10000, 0, 10000, -1], [6, 6, -1, -1], [5, 5, 5, 0])
+        
+        self.assertEqual(result.errors[0], ERROR_NONE)
+        self.assertEqual(result.errors[1], ERROR_INVALID_AMOUNT)
+        self.assertEqual(result.errors[2], ERROR_INVALID_RATE)
+        self.assertEqual(result.errors[3], ERROR_INVALID_AMOUNT | ERROR_INVALID_RATE | ERROR_INVALID_TERM)
+        self.assertFalse(np.isnan(result.values[0]))
+        self.assertTrue(np.all(np.isnan(result.values[1:])))
+        
+        result = self.batch.calculate_compound_interest(1000, 5, 2, [1, 0])
+        self.assertEqual(result.errors[1], ERROR_INVALID_FREQUENCY)
+        
+        result = self.batch.calculate_savings_goal(5000, [200, 0], 3)
+        self.assertEqual(result.errors[1], ERROR_INVALID_CONTRIBUTION)
+    
+    def test_batch_accepts_buffers_and_broadcasts(self):
+        """Test buffer-protocol inputs and scalar broadcasting."""
+        amounts = array.array('d', [1000.0, 2000.0])
+        result = self.batch.calculate_simple_interest(amounts, 5, 2)
+        
+        np.testing.assert_allclose(result.values, [100.0, 200.0])
+        self.assertEqual(result.values.shape, (2,))
+
+
+class TestAmortizationSchedule(unittest.TestCase):
+    """Unit tests for the streaming amortization schedule generator."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = FinanceCalculator()
+    
+    def test_schedule_pays_off_loan(self):
+        """Test that the schedule amortizes the full loan amount."""
+        rows = list(iter_amortization_schedule(10000, 6, 5))
+        payment = self.calculator.calculate_monthly_payment(10000, 6, 5)
+        
+        self.assertEqual(len(rows), 60)
+        self.assertEqual(rows[0].period, 1)
+        self.assertEqual(rows[0].payment, payment)
+        self.assertAlmostEqual(rows[0].interest, 50.0)
+        self.assertEqual(rows[-1].balance, 0.0)
+        self.assertAlmostEqual(sum(row.principal for row in rows), 10000, places=6)
+        self.assertAlmostEqual(rows[-1].payment, payment, delta=1.0)
+    
+    def test_schedule_is_lazy(self):
+        """Test that rows are produced on demand."""
+        schedule = iter_amortization_schedule(500000, 5, 40)
+        first = next(schedule)
+        self.assertEqual(first.period, 1)
+    
+    def test_zero_rate_and_invalid_schedule(self):
+        """Test zero-interest schedules and invalid inputs."""
+        rows = list(iter_amortization_schedule(1200, 0, 1))
+        self.assertTrue(all(row.interest == 0 for row in rows))
+        self.assertEqual(rows[-1].balance, 0.0)
+        
+        with self.assertRaises(ValueError):
+            list(iter_amortization_schedule(0, 5, 1))
+        
+        with self.assertRaises(ValueError):
+            list(iter_amortization_schedule(1000, 5, 1.01))
+    
+    def test_portfolio_schedules(self):
+        """Test streaming the schedules of several loans."""
+        rows = list(iter_portfolio_schedules([(1000, 5, 1), (2000, 3, 2)]))
+        self.assertEqual(len(rows), 36)
+        self.assertEqual(rows[12][0], 1)
+        self.assertEqual(rows[12][1].period, 1)
+
+
+class TestClosedFormSchedule(unittest.TestCase):
+    """Unit tests for closed-form amortization point queries."""
+    
+    def test_point_queries_match_schedule(self):
+        """Test balances and cumulative interest against the generated schedule."""
+        rows = list(iter_amortization_schedule(200000, 4.5, 30))
+        periods = np.array([1, 120, 359, 360])
+        
+        balances = balance_after_payment(200000, 4.5, 30, periods)
+        interest = interest_paid_through(200000, 4.5, 30, periods)
+        
+        cumulative = np.cumsum([row.interest for row in rows])
+        np.testing.assert_allclose(balances.values, [rows[k - 1].balance for k in periods], atol=1e-6)
+        np.testing.assert_allclose(interest.values, cumulative[periods - 1], atol=1e-6)
+        self.assertEqual(balances.values[-1], 0.0)
+    
+    def test_vectorized_over_loans_and_periods(self):
+        """Test (loan, period) pairs including zero-rate loans and invalid periods."""
+        result = balance_after_payment([1200, 10000, 10000], [0, 6, 6], [1, 5, 5], [6, 0, 61])
+        
+        self.assertAlmostEqual(result.values[0], 600.0)
+        self.assertAlmostEqual(result.values[1], 10000.0)
+        self.assertTrue(np.isnan(result.values[2]))
+        self.assertEqual(result.errors[2], ERROR_INVALID_PERIOD)
+        self.assertEqual(interest_paid_through(1200, 0, 1, 12).values, 0.0)
+
+
+class TestAmortizationScheduleView(unittest.TestCase):
+    """Unit tests for the lazy AmortizationSchedule sequence."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = FinanceCalculator()
+        self.schedule = self.calculator.amortization_schedule(200000, 4.5, 30)
+        self.rows = list(iter_amortization_schedule(200000, 4.5, 30))
+    
+    def test_length_and_indexing(self):
+        """Test len() and random access against the generated schedule."""
+        self.assertEqual(len(self.schedule), 360)
+        
+        for index in (0, 179, -1):
+            row, expected = self.schedule[index], self.rows[index]
+            self.assertEqual(row.period, expected.period)
+            for name in ('payment', 'interest', 'principal', 'balance'):
+                self.assertAlmostEqual(getattr(row, name), getattr(expected, name), places=6)
+        
+        with self.assertRaises(IndexError):
+            self.schedule[360]
+    
+    def test_slicing_and_columns(self):
+        """Test that slices are lazy views and columns are computed on demand."""
+        page = self.schedule[120:132]
+        
+        self.assertIsInstance(page, AmortizationSchedule)
+        self.assertEqual(len(page), 12)
+        self.assertEqual(page[0].period, 121)
+        np.testing.assert_allclose(page.column('balance'),
+                                   [row.balance for row in self.rows[120:132]], atol=1e-6)
+        np.testing.assert_allclose(self.schedule.column('interest').sum(),
+                                   sum(row.interest for row in self.rows), atol=1e-6)
+        
+        with self.assertRaises(ValueError):
+            page.column('fees')
+    
+    def test_iteration_matches_generator(self):
+        """Test that iterating the view reproduces the full schedule."""
+        for row, expected in zip(self.schedule, self.rows):
+            self.assertAlmostEqual(row.balance, expected.balance, places=6)
+
+
+class TestGrowthFactorCache(unittest.TestCase):
+    """Unit tests for the shared growth-factor LRU cache."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.cache = GrowthFactorCache(maxsize=2)
+        self.calculator = FinanceCalculator(growth_cache=self.cache)
+    
+    def test_hits_and_misses(self):
+        """Test that repeated rate/term pairs are served from the cache."""
+        first = self.calculator.calculate_monthly_payment(10000, 6, 5)
+        second = self.calculator.calculate_monthly_payment(20000, 6, 5)
+        
+        self.assertAlmostEqual(second, first * 2, places=2)
+        info = self.cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+    
+    def test_lru_eviction_and_clear(self):
+        """Test that the least recently used factor is evicted."""
+        self.cache.growth_factor(0.01, 10)
+        self.cache.growth_factor(0.02, 10)
+        self.cache.growth_factor(0.01, 10)
+        self.cache.growth_factor(0.03, 10)
+        self.cache.growth_factor(0.02, 10)
+        
+        self.assertEqual(self.cache.info().misses, 4)
+        self.assertEqual(self.cache.info().currsize, 2)
+        
+        self.cache.clear()
+        self.assertEqual(self.cache.info(), (0, 0, 2, 0, True))
+    
+    def test_disabled_cache(self):
+        """Test that a disabled cache computes the same values without storing them."""
+        self.cache.enabled = False
+        result = self.calculator.calculate_compound_interest(1000, 6, 1, 12)
+        
+        self.assertAlmostEqual(result, 1000 * (1 + 0.06 / 12) ** 12, places=2)
+        self.assertEqual(self.cache.info().currsize, 0)
+    
+    def test_default_cache_is_shared(self):
+        """Test that calculators share the default cache."""
+        self.assertIs(FinanceCalculator().growth_cache, FinanceCalculator().growth_cache)
+        
+        with self.assertRaises(ValueError):
+            GrowthFactorCache(maxsize=0)
+
+
+class TestCentsCalculator(unittest.TestCase):
+    """Unit tests for the integer-cent fixed-point engine."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.cents = CentsCalculator()
+        self.calculator = FinanceCalculator()
+    
+    def test_divide_rounded_modes(self):
+        """Test every rounding mode on ties and negative values."""
+        self.assertEqual(divide_rounded(5, 2, ROUND_HALF_UP), 3)
+        self.assertEqual(divide_rounded(5, 2, ROUND_HALF_EVEN), 2)
+        self.assertEqual(divide_rounded(7, 2, ROUND_HALF_EVEN), 4)
+        self.assertEqual(divide_rounded(-5, 2, ROUND_HALF_UP), -3)
+        self.assertEqual(divide_rounded(-5, 2, ROUND_DOWN), -2)
+        self.assertEqual(divide_rounded(5, 3, ROUND_UP), 2)
+        self.assertEqual(divide_rounded(5, 3, ROUND_HALF_DOWN), 2)
+        
+        numerators = np.array([5, -5, 7, 4, -7])
+        for mode in ('ROUND_HALF_UP', 'ROUND_HALF_EVEN', 'ROUND_DOWN', 'ROUND_UP', 'ROUND_HALF_DOWN'):
+            expected = [divide_rounded(int(n), 2, mode) for n in numerators]
+            self.assertEqual(list(divide_rounded_array(numerators, 2, mode)), expected)
+        
+        with self.assertRaises(ValueError):
+            divide_rounded(1, 0)
+    
+    def test_matches_float_calculator(self):
+        """Test that cent results agree with the float calculator to the cent."""
+        self.assertEqual(self.cents.calculate_monthly_payment(to_cents(200000), 4.5, 30),
+                         to_cents(self.calculator.calculate_monthly_payment(200000, 4.5, 30)))
+        self.assertEqual(self.cents.calculate_compound_interest(100000, 6, 1, 12),
+                         to_cents(self.calculator.calculate_compound_interest(1000, 6, 1, 12)))
+        self.assertEqual(self.cents.calculate_simple_interest(100000, 5, 2), 10000)
+        self.assertEqual(self.cents.calculate_monthly_payment(1200000, 0, 2), 50000)
+        self.assertEqual(from_cents(101337), Decimal('1013.37'))
+    
+    def test_compound_interest_high_frequency(self):
+        """Test that frequent compounding stays exact without huge integer powers."""
+        for principal, rate, years, frequency in ((12345678, 0.07 * 100, 30, 52), (3, 50, 1, 1),
+                                                  (99999, 4.5, 2, 365)):
+            period_rate = exact_value(rate) / 100 / frequency
+            a, b, n = period_rate.numerator, period_rate.denominator, frequency * years
+            expected = divide_rounded(principal * (b + a) ** n, b ** n, ROUND_HALF_UP)
+            self.assertEqual(self.cents.calculate_compound_interest(principal, rate, years, frequency), expected)
+        self.assertEqual(CentsCalculator(ROUND_HALF_EVEN).calculate_compound_interest(3, 50, 1, 1), 4)
+        
+        for years, frequency in ((1, 525600), (30, 8760)):
+            amount = self.cents.calculate_compound_interest(100000, 5, years, frequency)
+            self.assertAlmostEqual(amount, 100000 * math.exp(frequency * years * math.log1p(0.05 / frequency)),
+                                   delta=1)
+    
+    def test_compound_interest_numeric_types(self):
+        """Test float frequencies, numpy integer principals and non-integral inputs."""
+        expected = self.cents.calculate_compound_interest(100000, 6, 1, 12)
+        self.assertEqual(self.cents.calculate_compound_interest(100000, 6, 1, 12.0), expected)
+        self.assertEqual(self.cents.calculate_compound_interest(np.int64(100000), 6, 1, np.int64(12)), expected)
+        
+        for principal, frequency in ((100000.5, 12), (np.float64(100000), 12), (100000, 12.5)):
+            with self.assertRaises(ValueError):
+                self.cents.calculate_compound_interest(principal, 6, 1, frequency)
+    
+    def test_schedule_reconciles_exactly(self):
+        """Test that the cent schedule pays off the loan exactly."""
+        rows = list(self.cents.iter_amortization_schedule(20000000, 4.5, 30))
+        
+        self.assertEqual(len(rows), 360)
+        self.assertEqual(sum(row.principal for row in rows), 20000000)
+        self.assertEqual(rows[-1].balance, 0)
+        self.assertTrue(all(isinstance(row.interest, int) for row in rows))
+    
+    def test_bulk_schedule_matches_scalar(self):
+        """Test that the lockstep portfolio schedule reproduces each loan's schedule."""
+        loans = [(20000000, 4.5, 30), (1000000, 6.125, 5), (120000, 0, 1)]
+        bulk = list(self.cents.iter_bulk_schedule(*zip(*loans)))
+        
+        for index, loan in enumerate(loans):
+            for row, bulk_row in zip(self.cents.iter_amortization_schedule(*loan), bulk):
+                self.assertEqual(row.interest, bulk_row.interest[index])
+                self.assertEqual(row.balance, bulk_row.balance[index])
+        self.assertTrue(np.all(bulk[-1].balance == 0))
+    
+    def test_bulk_schedule_long_rate_digits(self):
+        """Test rates whose exact fractions overflow int64 products."""
+        loans = [(10000000, 0.07 * 100, 30), (25000000, 1 / 3, 15), (500000, 4.5, 1)]
+        bulk = list(self.cents.iter_bulk_schedule(*zip(*loans)))
+        
+        self.assertEqual(bulk[0].interest[0], 58333)
+        for index, loan in enumerate(loans):
+            rows = list(self.cents.iter_amortization_schedule(*loan))
+            self.assertEqual([row.interest for row in rows], [int(row.interest[index]) for row in bulk[:len(rows)]])
+            self.assertEqual([row.balance for row in rows], [int(row.balance[index]) for row in bulk[:len(rows)]])
+        self.assertEqual(bulk[0].interest.dtype, np.int64)
+    
+    def test_savings_goal_and_invalid_inputs(self):
+        """Test whole-month savings goals and input validation."""
+        self.assertEqual(self.cents.calculate_savings_goal(240000, 10000, 0), 24)
+        self.assertEqual(self.cents.calculate_savings_goal(500000, 20000, 3), 25)
+        
+        for mode, target, contribution, rate in ((ROUND_HALF_UP, 987654321, 12345, 4.5),
+                                                 (ROUND_DOWN, 500000, 100, 0.0001), (ROUND_HALF_EVEN, 77, 3, 50)):
+            monthly_rate = exact_value(rate) / 1200
+            balance, months = 0, 0
+            while balance < target:
+                balance += divide_rounded(balance * monthly_rate.numerator, monthly_rate.denominator, mode)
+                balance += contribution
+                months += 1
+            self.assertEqual(CentsCalculator(mode).calculate_savings_goal(target, contribution, rate), months)
+        self.assertEqual(self.cents.calculate_savings_goal(10 ** 9, 1, 0.0001, max_years=10 ** 8), 54143869)
+        
+        with self.assertRaises(ValueError):
+            self.cents.calculate_savings_goal(10 ** 9, 1, 0.0001)
+        
+        with self.assertRaises(ValueError):
+            self.cents.calculate_compound_interest(100000, 5, 0.5, 1)
+        
+        with self.assertRaises(ValueError):
+            self.cents.calculate_monthly_payment(0, 5, 1)
+        
+        with self.assertRaises(ValueError):
+            CentsCalculator(rounding='nearest')
+        
+        for loans in ([(100000, 5, 1), (100000, 5, 0)], [(100000, 5, -1)], [(0, 5, 1)], [(100000, -1, 1)]):
+            with self.assertRaises(ValueError):
+                next(self.cents.iter_bulk_schedule(*zip(*loans)))
+
+
+class TestTVMSolver(unittest.TestCase):
+    """Unit tests for the vectorized time-value-of-money solver."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = FinanceCalculator()
+    
+    def test_closed_form_unknowns(self):
+        """Test solving for payment, present value, future value and periods."""
+        payment = self.calculator.calculate_monthly_payment(200000, 4.5, 30)
+        
+        result = solve_tvm(pv=200000, fv=0, rate=4.5, nper=360)
+        self.assertAlmostEqual(-float(result.values), payment, places=2)
+        self.assertTrue(result.converged)
+        
+        nper = solve_tvm(pv=200000, fv=0, rate=4.5, pmt=-payment).values
+        self.assertAlmostEqual(float(nper), 360, places=2)
+        
+        pv = solve_tvm(fv=0, pmt=-100, rate=0, nper=12).values
+        self.assertAlmostEqual(float(pv), 1200)
+        
+        fv = solve_tvm(pv=0, pmt=-100, rate=6, nper=12, when='begin').values
+        expected = 100 * ((1 + 0.005) ** 12 - 1) / 0.005 * (1 + 0.005)
+        self.assertAlmostEqual(float(fv), expected, places=6)
+    
+    def test_vectorized_rate_solve(self):
+        """Test that the rate solve converges row by row and reports failures."""
+        payments = [-self.calculator.calculate_monthly_payment(200000, 4.5, 30), -200, -100, 10]
+        result = solve_tvm(pv=[200000, 10000, 1000, 100], fv=[0, 0, 0, 100],
+                           pmt=payments, nper=[360, 60, 10, 5])
+        
+        self.assertAlmostEqual(result.values[0], 4.5, places=3)
+        self.assertAlmostEqual(result.values[2], 0.0, places=8)
+        self.assertTrue(np.all(result.converged[:3]))
+        self.assertTrue(np.all(result.iterations[:3] > 0))
+        self.assertFalse(result.converged[3])
+        self.assertTrue(np.isnan(result.values[3]))
+        
+        residual = tvm_balance(result.values[1] / 1200, 60, -200, 10000, 0)
+        self.assertAlmostEqual(float(residual), 0.0, places=6)
+    
+    def test_invalid_requests(self):
+        """Test that the solver requires exactly one unknown."""
+        with self.assertRaises(ValueError):
+            solve_tvm(pv=1000, fv=0, pmt=-100, rate=5, nper=12)
+        
+        with self.assertRaises(ValueError):
+            solve_tvm(pv=1000, rate=5, nper=12)
+        
+        with self.assertRaises(ValueError):
+            solve_tvm(pv=1000, fv=0, rate=5, nper=12, when='middle')
+
+
+class TestBatchIRR(unittest.TestCase):
+    """Unit tests for the batch IRR and APR solver."""
+    
+    def test_irr_matrix_and_ragged_layouts(self):
+        """Test that 2D and ragged layouts give the same IRR."""
+        matrix = np.array([[-100, 60, 60, np.nan], [-100, 30, 40, 50]])
+        ragged = batch_irr([-100, 60, 60, -100, 30, 40, 50], offsets=[0, 3, 7])
+        dense = batch_irr(matrix)
+        
+        np.testing.assert_allclose(dense.root, ragged.root)
+        self.assertTrue(np.all(dense.converged))
+        npv, _ = npv_ragged(dense.root, *as_ragged(matrix))
+        np.testing.assert_allclose(npv, 0, atol=1e-9)
+        # Two equal payments of 60 against 100: (1 + r)^2 - 0.6 (1 + r) - 0.6 = 0
+        self.assertAlmostEqual(dense.root[0], (0.6 + math.sqrt(0.36 + 2.4)) / 2 - 1, places=10)
+    
+    def test_apr_matches_nominal_rate_without_fees(self):
+        """Test that APR equals the note rate without fees and rises with fees."""
+        result = batch_apr([200000, 10000], [4.5, 6], [30, 5], fees=[0, 300])
+        
+        self.assertAlmostEqual(result.root[0], 4.5, places=3)
+        self.assertGreater(result.root[1], 6)
+        self.assertTrue(np.all(result.converged))
+        self.assertTrue(np.all(result.iterations > 0))
+    
+    def test_rows_without_sign_change(self):
+        """Test that rows with no IRR are reported as not converged."""
+        result = batch_irr([[100, 10, 10], [-100, 110, 0]])
+        
+        self.assertFalse(result.converged[0])
+        self.assertTrue(np.isnan(result.root[0]))
+        self.assertAlmostEqual(result.root[1], 0.1)
+        
+        with self.assertRaises(ValueError):
+            batch_irr([1, 2, 3], offsets=[0, 2])
+
+
+class TestStableCompounding(unittest.TestCase):
+    """Unit tests for log-space and continuous compounding."""
+    
+    def test_high_frequency_keeps_precision(self):
+        """Test per-millisecond compounding against a high-precision reference."""
+        frequency = 365 * 24 * 3600 * 1000
+        with localcontext() as context:
+            context.prec = 60
+            exact = (1 + Decimal(5) / 100 / frequency) ** (frequency * 30)
+        
+        self.assertAlmostEqual(float(compound_growth(5, 30, frequency)), float(exact), places=12)
+        self.assertLess(float(compound_growth(5, 30, frequency)), math.exp(1.5))
+    
+    def test_continuous_compounding(self):
+        """Test the continuous mode in the batch and scalar calculators."""
+        np.testing.assert_allclose(compound_growth(5, [1, 30], np.inf), np.exp([0.05, 1.5]))
+        np.testing.assert_allclose(compound_growth(5, 30, 12, continuous=True), math.exp(1.5))
+        
+        batch = BatchCalculator().calculate_compound_interest(1000, 5, 10, continuous=True)
+        scalar = FinanceCalculator().calculate_compound_interest(1000, 5, 10, continuous=True)
+        self.assertEqual(batch.values, scalar)
+        self.assertEqual(scalar, round(1000 * math.exp(0.5), 2))
+        
+        infinite = FinanceCalculator().calculate_compound_interest(1000, 5, 10, math.inf)
+        self.assertEqual(infinite, scalar)
+        self.assertEqual(BatchCalculator().calculate_compound_interest(1000, 5, 10, np.inf).values, infinite)
+    
+    def test_interest_earned_for_tiny_rates(self):
+        """Test that expm1 keeps the interest on tiny rates accurate."""
+        earned = compound_interest_earned(1, 1e-6, 1, 365)
+        self.assertAlmostEqual(float(earned) / 1e-8, 1.0, places=7)
+
+
+class TestPaymentGrid(unittest.TestCase):
+    """Unit tests for the broadcasted payment grid."""
+    
+    def test_grid_matches_scalar_payments(self):
+        """Test every cell against calculate_monthly_payment."""
+        calculator = FinanceCalculator()
+        grid = payment_grid([0, 3.5, 6.25], [1, 15, 30], [10000, 250000])
+        
+        self.assertEqual(grid.monthly_payment.shape, (3, 3, 2))
+        for i, rate in enumerate(grid.rates):
+            for j, term in enumerate(grid.terms):
+                for k, amount in enumerate(grid.amounts):
+                    expected = calculator.calculate_monthly_payment(amount, rate, term)
+                    self.assertEqual(grid.monthly_payment[i, j, k], expected)
+                    self.assertAlmostEqual(grid.total_interest[i, j, k], expected * term * 12 - amount)
+        self.assertTrue(np.all(grid.errors == ERROR_NONE))
+    
+    def test_grid_flags_invalid_axis_values(self):
+        """Test that invalid axis values only invalidate their own slices."""
+        grid = payment_grid([5, -1], [10], [1000, 0])
+        
+        self.assertFalse(np.isnan(grid.monthly_payment[0, 0, 0]))
+        self.assertTrue(np.all(np.isnan(grid.monthly_payment[1])))
+        self.assertEqual(grid.errors[0, 0, 1], ERROR_INVALID_AMOUNT)
+        self.assertEqual(grid.errors[1, 0, 1], ERROR_INVALID_RATE | ERROR_INVALID_AMOUNT)
+
+
+class TestDualSensitivities(unittest.TestCase):
+    """Unit tests for forward-mode payment and savings sensitivities."""
+    
+    @staticmethod
+    def _payment(loan_amount, annual_rate, years):
+        """Unrounded reference payment formula."""
+        if annual_rate == 0:
+            return loan_amount / (years * 12)
+        monthly_rate = annual_rate / 1200
+        growth = (1 + monthly_rate) ** (years * 12)
+        return loan_amount * monthly_rate * growth / (growth - 1)
+    
+    def test_dual_arithmetic(self):
+        """Test derivatives of basic operations against known results."""
+        x = Dual.seed({'x': [1.0, 2.0]}, ('x',))['x']
+        result = (x * x + 3) / x - x ** 2 + exp(log(x))
+        
+        np.testing.assert_allclose(result.value, [1 + 3 - 1 + 1, 2 + 1.5 - 4 + 2])
+        np.testing.assert_allclose(result.derivative(0), [1 - 3 - 2 + 1, 1 - 0.75 - 4 + 1])
+    
+    def test_payment_sensitivities(self):
+        """Test dPayment/dRate against central differences, including zero rates."""
+        result = monthly_payment_sensitivities([200000, 12000], [4.5, 0], [30, 2],
+                                               wrt=('annual_rate', 'loan_amount'))
+        step = 1e-5
+        
+        self.assertAlmostEqual(result.values[0], self._payment(200000, 4.5, 30), places=8)
+        numeric = (self._payment(200000, 4.5 + step, 30) - self._payment(200000, 4.5 - step, 30)) / (2 * step)
+        self.assertAlmostEqual(result.derivatives['annual_rate'][0], numeric, places=4)
+        numeric = (self._payment(12000, 1e-3, 2) - self._payment(12000, -1e-3, 2)) / 2e-3
+        self.assertAlmostEqual(result.derivatives['annual_rate'][1], numeric, places=4)
+        self.assertAlmostEqual(result.derivatives['loan_amount'][1], 1 / 24)
+    
+    def test_savings_goal_sensitivities(self):
+        """Test dYears/dContribution against the closed form."""
+        result = savings_goal_sensitivities([5000, 2400], [200, 100], [3, 0])
+        calculator = FinanceCalculator()
+        
+        self.assertAlmostEqual(result.values[0], calculator.calculate_savings_goal(5000, 200, 3), places=2)
+        self.assertAlmostEqual(result.derivatives['monthly_contribution'][1], -2400 / (12 * 100 ** 2))
+        
+        step = 1e-4
+        years = [savings_goal_sensitivities(5000, c, 3).values for c in (200 - step, 200 + step)]
+        self.assertAlmostEqual(result.derivatives['monthly_contribution'][0],
+                               float(years[1] - years[0]) / (2 * step), places=6)
+        
+        with self.assertRaises(ValueError):
+            savings_goal_sensitivities(5000, 200, 3, wrt=('fees',))
+    
+    def test_invalid_rows(self):
+        """Test that invalid rows get NaN values and derivatives with batch error codes."""
+        result = monthly_payment_sensitivities([200000, -1000, 1000, 1000], [4.5, -5, -5, 4.5], [30, -2, 2, 0],
+                                               wrt=('annual_rate', 'years'))
+        expected = BatchCalculator().calculate_monthly_payment([200000, -1000, 1000, 1000], [4.5, -5, -5, 4.5],
+                                                               [30, -2, 2, 0])
+        np.testing.assert_array_equal(result.errors, expected.errors)
+        self.assertEqual(result.errors[1], ERROR_INVALID_AMOUNT | ERROR_INVALID_RATE | ERROR_INVALID_TERM)
+        self.assertTrue(np.all(np.isnan(result.values[1:])))
+        for derivative in result.derivatives.values():
+            self.assertTrue(np.isfinite(derivative[0]))
+            self.assertTrue(np.all(np.isnan(derivative[1:])))
+        
+        result = savings_goal_sensitivities([5000, 5000, -1], [200, 0, 200], [3, 3, 3])
+        np.testing.assert_array_equal(result.errors,
+                                      [ERROR_NONE, ERROR_INVALID_CONTRIBUTION, ERROR_INVALID_AMOUNT])
+        self.assertTrue(np.all(np.isnan(result.derivatives['monthly_contribution'][1:])))
+
+
+class TestPrepaymentSimulator(unittest.TestCase):
+    """Unit tests for the portfolio prepayment simulator."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = FinanceCalculator()
+    
+    def test_no_extra_matches_schedule(self):
+        """Test that without prepayments the original schedule is reproduced."""
+        result = simulate_prepayments([200000, 10000], [4.5, 0], [30, 1], record_schedule=True)
+        rows = list(iter_amortization_schedule(200000, 4.5, 30))
+        
+        np.testing.assert_array_equal(result.payoff_period, [360, 12])
+        self.assertAlmostEqual(result.interest_paid[0], sum(row.interest for row in rows), places=6)
+        np.testing.assert_allclose(result.interest_saved, 0, atol=1e-6)
+        np.testing.assert_allclose(result.schedule.balance[0], [row.balance for row in rows], atol=1e-6)
+    
+    def test_extra_payments_shorten_loan(self):
+        """Test recurring extra payments against a per-loan scalar loop."""
+        result = simulate_prepayments([200000, 200000], [4.5, 4.5], [30, 30], extra_monthly=[0, 200])
+        
+        payment = self.calculator.calculate_monthly_payment(200000, 4.5, 30)
+        balance, interest_paid, period = 200000.0, 0.0, 0
+        while balance > 0:
+            period += 1
+            interest = balance * 4.5 / 1200
+            interest_paid += interest
+            balance -= min(payment + 200 - interest, balance)
+        
+        self.assertEqual(result.payoff_period[1], period)
+        self.assertAlmostEqual(result.interest_paid[1], interest_paid, places=6)
+        self.assertGreater(result.interest_saved[1], 50000)
+    
+    def test_lump_sums(self):
+        """Test one-off payments, including one that clears the loan."""
+        result = simulate_prepayments([10000, 10000], [0, 6], [1, 1],
+                                      lump_sums=([0, 1, 1], [3, 2, 2], [5000, 9000, 2000]),
+                                      record_schedule=True)
+        
+        self.assertEqual(result.schedule.payment[0, 2], 10000 / 12 + 5000)
+        self.assertEqual(result.payoff_period[0], 6)
+        self.assertEqual(result.payoff_period[1], 2)
+        self.assertEqual(result.schedule.balance[1, 1], 0)
+        np.testing.assert_array_equal(result.schedule.payment[1, 2:], 0)
+    
+    def test_invalid_inputs(self):
+        """Test that invalid loans and payments raise errors."""
+        with self.assertRaises(ValueError):
+            simulate_prepayments([-1], [5], [10])
+        with self.assertRaises(ValueError):
+            simulate_prepayments([1000], [5], [10], extra_monthly=-5)
+        with self.assertRaises(ValueError):
+            simulate_prepayments([1000], [5], [10], lump_sums=([1], [1], [100]))
+        for period in (0, -1, 121):
+            with self.assertRaises(ValueError):
+                simulate_prepayments([1000, 1000], [5, 5], [10, 20], lump_sums=([0], [period], [100]))
+        self.assertEqual(simulate_prepayments([1000, 1000], [5, 5], [10, 20],
+                                              lump_sums=([1], [240], [100])).payoff_period[1], 240)
+
+
+class TestARMSchedule(unittest.TestCase):
+    """Unit tests for the segment-wise adjustable-rate mortgage engine."""
+    
+    def test_constant_rate_matches_fixed(self):
+        """Test that an ARM that never moves pays the fixed-rate payment."""
+        calculator = FinanceCalculator()
+        result = arm_schedule(200000, 4.5, 30, [4.5])
+        payment = calculator.calculate_monthly_payment(200000, 4.5, 30)
+        
+        # Re-amortizing the rounded payment's residual moves it by at most a cent
+        self.assertEqual(result.payments[0, 0], payment)
+        np.testing.assert_allclose(result.payments[0], payment, atol=0.01 + 1e-9)
+        self.assertEqual(result.months[0].sum(), 360)
+        self.assertAlmostEqual(result.balances[0, -1], 0, delta=1.0)
+    
+    def test_caps_and_floor(self):
+        """Test initial, periodic and lifetime caps and the rate floor."""
+        result = arm_schedule([300000, 300000], [3, 3], 30, [[6, 7, 8], [1, 1, 1]],
+                              initial_cap=2, periodic_cap=1, lifetime_cap=5, floor=2)
+        
+        np.testing.assert_array_equal(result.rates[0, :6], [3, 5, 6, 7, 8, 8])
+        np.testing.assert_array_equal(result.rates[1, :3], [3, 2, 2])
+        np.testing.assert_array_equal(result.months[0, :3], [60, 12, 12])
+    
+    def test_matches_monthly_iteration(self):
+        """Test closed-form segments against a month-by-month loop."""
+        result = arm_schedule(250000, 3.5, 30, [5.0, 6.5, 4.0], fixed_months=84, reset_months=12,
+                              periodic_cap=2)
+        rates = np.repeat(result.rates[0], result.months[0])
+        payments = np.repeat(result.payments[0], result.months[0])
+        
+        balance, paid = 250000.0, 0.0
+        for rate, payment in zip(rates, payments):
+            balance = balance * (1 + rate / 1200) - payment
+            paid += payment
+        
+        self.assertAlmostEqual(result.balances[0, -1], balance, places=4)
+        self.assertAlmostEqual(result.total_interest[0], paid + balance - 250000, places=4)
+    
+    def test_invalid_inputs(self):
+        """Test that invalid loans raise errors."""
+        with self.assertRaises(ValueError):
+            arm_schedule(-1, 5, 30, [5])
+        with self.assertRaises(ValueError):
+            arm_schedule(1000, 5, 30, [5], reset_months=0)
+        with self.assertRaises(ValueError):
+            arm_schedule(1000, 5, 30, np.zeros((1, 0)))
+
+
+class TestRevolvingPayoff(unittest.TestCase):
+    """Unit tests for the credit card payoff simulator."""
+    
+    @staticmethod
+    def _payoff(balance, apr, percent, floor, fixed):
+        """Reference payoff loop for one account."""
+        months, interest_paid = 0, 0.0
+        while balance > 0:
+            interest = round(balance * apr / 1200, 2)
+            statement = balance + interest
+            balance = statement - min(max(statement * percent / 100, floor, fixed), statement)
+            interest_paid += interest
+            months += 1
+        return months, interest_paid
+    
+    def test_matches_scalar_loop(self):
+        """Test minimum and fixed payments against a per-account loop."""
+        balances = [5000, 5000, 800, 12000]
+        aprs = [19.99, 19.99, 0, 24]
+        fixed = [0, 200, 0, 0]
+        result = simulate_revolving_payoff(balances, aprs, minimum_percent=3, fixed_payment=fixed)
+        
+        for index in range(4):
+            months, interest_paid = self._payoff(balances[index], aprs[index], 3, 25, fixed[index])
+            self.assertEqual(result.months[index], months)
+            self.assertAlmostEqual(result.total_interest[index], interest_paid, places=6)
+            self.assertAlmostEqual(result.total_paid[index], balances[index] + interest_paid, places=6)
+        self.assertTrue(result.paid_off.all())
+        self.assertEqual(result.months[2], 32)
+    
+    def test_never_paid_off(self):
+        """Test that a minimum below the interest charge is flagged."""
+        result = simulate_revolving_payoff([0, 1000], [20, 30], minimum_percent=1, minimum_floor=0,
+                                           max_months=120)
+        
+        np.testing.assert_array_equal(result.months, [0, 120])
+        np.testing.assert_array_equal(result.paid_off, [True, False])
+        self.assertGreater(result.total_interest[1], result.total_paid[1])
+    
+    def test_invalid_inputs(self):
+        """Test that invalid inputs raise errors."""
+        with self.assertRaises(ValueError):
+            simulate_revolving_payoff(-100, 20)
+        with self.assertRaises(ValueError):
+            simulate_revolving_payoff(100, 20, minimum_percent=0)
+        with self.assertRaises(ValueError):
+            simulate_revolving_payoff(100, 20, max_months=0)
+
+
+class TestDebtPlanner(unittest.TestCase):
+    """Unit tests for the event-driven snowball/avalanche planner."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.debts = [
+            Debt(2500, 22.9, 75),
+            Debt(9000, 6.5, 180),
+            Debt(4000, 17.5, 100),
+            Debt(0, 12, 50),
+        ]
+    
+    @staticmethod
+    def _simulate(debts, budget, order):
+        """Month-by-month reference simulation."""
+        balances = [float(debt.balance) for debt in debts]
+        payoff, interest, month = [0] * len(debts), [0.0] * len(debts), 0
+        while any(balance > 0 for balance in balances):
+            month += 1
+            unpaid = [index for index in order if balances[index] > 0]
+            extra = budget - sum(debts[index].minimum_payment for index in unpaid)
+            for position, index in enumerate(unpaid):
+                charge = balances[index] * debts[index].annual_rate / 1200
+                payment = debts[index].minimum_payment + (extra if position == 0 else 0)
+                statement = balances[index] + charge
+                balances[index] = max(statement - payment, 0.0)
+                interest[index] += charge
+                if balances[index] == 0:
+                    payoff[index] = month
+        return payoff, interest
+    
+    def test_matches_monthly_simulation(self):
+        """Test both strategies against a month-by-month simulation."""
+        for strategy in ('avalanche', 'snowball'):
+            plan = plan_payoff(self.debts, 600, strategy)
+            payoff, interest = self._simulate(self.debts, 600, plan.order)
+            
+            self.assertEqual(list(plan.payoff_months), payoff)
+            for expected, actual in zip(interest, plan.interest):
+                self.assertAlmostEqual(actual, expected, places=6)
+    
+    def test_strategy_order(self):
+        """Test targeting orders and that avalanche is never more expensive."""
+        avalanche = plan_payoff(self.debts, 600, 'avalanche')
+        snowball = plan_payoff(self.debts, 600, 'snowball')
+        
+        self.assertEqual(avalanche.order, (0, 2, 3, 1))
+        self.assertEqual(snowball.order, (3, 0, 2, 1))
+        self.assertLessEqual(avalanche.total_interest, snowball.total_interest)
+        self.assertEqual(avalanche.months, max(avalanche.payoff_months))
+    
+    def test_never_paid_off(self):
+        """Test that a budget below the interest charge never pays off."""
+        plan = plan_payoff([(10000, 24, 150)], 150)
+        
+        self.assertEqual(plan.months, math.inf)
+        self.assertEqual(plan.total_interest, math.inf)
+    
+    def test_batch_plan(self):
+        """Test batch evaluation across households."""
+        summary = batch_plan_payoff([self.debts, self.debts[:1]], [600, 100])
+        
+        self.assertEqual(summary.months[0], plan_payoff(self.debts, 600).months)
+        self.assertAlmostEqual(summary.total_interest[1], plan_payoff(self.debts[:1], 100).total_interest)
+    
+    def test_invalid_inputs(self):
+        """Test that invalid plans raise errors."""
+        with self.assertRaises(ValueError):
+            plan_payoff(self.debts, 600, 'random')
+        with self.assertRaises(ValueError):
+            plan_payoff(self.debts, 300)
+        with self.assertRaises(ValueError):
+            plan_payoff([(1000, 5, 0)], 300)
+
+
+class TestSavingsPlan(unittest.TestCase):
+    """Unit tests for time-varying contribution savings plans."""
+    
+    @staticmethod
+    def _months(target_amount, annual_rate, contributions, opening_balance):
+        """Month-by-month reference for the crossing month."""
+        balance = opening_balance
+        if balance >= target_amount:
+            return 0, balance
+        for month, contribution in enumerate(contributions, 1):
+            balance = balance * (1 + annual_rate / 1200) + contribution
+            if balance >= target_amount:
+                return month, balance
+        return len(contributions), balance
+    
+    def test_contribution_schedule(self):
+        """Test step-ups and overlapping pauses."""
+        schedule = contribution_schedule([200, 300], 48, step_up=[3, 0],
+                                         pauses=([0, 1, 1], [13, 5, 10], [25, 20, 12]))
+        
+        np.testing.assert_array_equal(schedule[0, :12], 200)
+        np.testing.assert_array_equal(schedule[0, 12:24], 0)
+        np.testing.assert_allclose(schedule[0, 24:36], 200 * 1.03 ** 2)
+        np.testing.assert_array_equal(schedule[1, 4:19], 0)
+        np.testing.assert_array_equal(schedule[1, 19:], 300)
+    
+    def test_matches_monthly_loop(self):
+        """Test the binary search against a month-by-month loop."""
+        schedule = contribution_schedule([200, 300, 50, 100], 360, step_up=[3, 0, 0, 2],
+                                         pauses=([0, 1], [13, 5], [25, 20]))
+        targets = [50000, 80000, 10, 1e9]
+        rates = [5, 0, 4, 5]
+        opening = [1000, 0, 20, 0]
+        result = months_to_goal(targets, rates, schedule, opening_balance=opening)
+        
+        for index in range(4):
+            months, balance = self._months(targets[index], rates[index], schedule[index], opening[index])
+            self.assertEqual(result.months[index], months)
+            self.assertAlmostEqual(result.balance[index], balance, places=6)
+        np.testing.assert_array_equal(result.reached, [True, True, True, False])
+    
+    def test_constant_contribution(self):
+        """Test agreement with calculate_savings_goal for a plain plan."""
+        result = months_to_goal(5000, 3, np.full(600, 200))
+        years = FinanceCalculator().calculate_savings_goal(5000, 200, 3)
+        
+        self.assertEqual(result.months[0], math.ceil(years * 12))
+    
+    def test_invalid_inputs(self):
+        """Test that invalid plans raise errors."""
+        with self.assertRaises(ValueError):
+            months_to_goal(0, 5, [100])
+        with self.assertRaises(ValueError):
+            months_to_goal(1000, 5, [-100])
+        with self.assertRaises(ValueError):
+            contribution_schedule(100, 12, pauses=([0], [0], [3]))
+    
+    @staticmethod
+    def _path(contribution, annual_rate, months, escalation, when, opening_balance):
+        """Month-by-month reference balance path."""
+        balance, path = opening_balance, []
+        for month in range(months):
+            amount = contribution * (1 + escalation / 100) ** (month // 12)
+            if when == 'begin':
+                balance = (balance + amount) * (1 + annual_rate / 1200)
+            else:
+                balance = balance * (1 + annual_rate / 1200) + amount
+            path.append(balance)
+        return path
+    
+    def test_project_balances(self):
+        """Test closed-form terminal values and paths against a monthly loop."""
+        cases = [(200, 5, 360, 3, 'end', 1000), (200, 0, 37, 2, 'begin', 0), (150, 6, 125, 0, 'begin', 500)]
+        for contribution, rate, months, escalation, when, opening in cases:
+            expected = self._path(contribution, rate, months, escalation, when, opening)
+            terminal = project_balances(contribution, rate, months, escalation, when=when,
+                                        opening_balance=opening)
+            paths = project_balances(contribution, rate, months, escalation, when=when,
+                                     opening_balance=opening, paths=True)
+            
+            self.assertAlmostEqual(float(terminal), expected[-1], places=6)
+            np.testing.assert_allclose(paths[0], expected, rtol=1e-12)
+    
+    def test_project_balances_matches_savings_goal(self):
+        """Test level contributions against the annuity used by calculate_savings_goal."""
+        years = FinanceCalculator().calculate_savings_goal(5000, 200, 3)
+        monthly_rate = 0.03 / 12
+        
+        # The goal is first reached within the month after the fractional term
+        self.assertLess(float(project_balances(200, 3, math.floor(years * 12))), 5000)
+        self.assertGreaterEqual(float(project_balances(200, 3, math.ceil(years * 12))), 5000)
+        self.assertAlmostEqual(float(project_balances(200, 3, 24)),
+                               200 * ((1 + monthly_rate) ** 24 - 1) / monthly_rate, places=8)
+        # Escalation equal to a year of growth makes the block series degenerate
+        escalation = ((1 + 6 / 1200) ** 12 - 1) * 100
+        self.assertAlmostEqual(float(project_balances(100, 6, 120, escalation)),
+                               self._path(100, 6, 120, escalation, 'end', 0)[-1], places=6)
+        with self.assertRaises(ValueError):
+            project_balances(100, 5, [12, 24], paths=True)
+        with self.assertRaises(ValueError):
+            project_balances(100, 5, 12, when='middle')
+
+
+class TestMonteCarlo(unittest.TestCase):
+    """Unit tests for the chunked Monte Carlo savings engine."""
+    
+    def test_reproducible_across_workers(self):
+        """Test that results depend on the seed, not on the worker count."""
+        serial = simulate_terminal_balances(500, 6, 15, 120, num_paths=5000, chunk_size=1500, seed=7)
+        parallel = simulate_terminal_balances(500, 6, 15, 120, num_paths=5000, chunk_size=1500, seed=7,
+                                              workers=2)
+        
+        self.assertEqual(serial.size, 5000)
+        np.testing.assert_array_equal(serial, parallel)
+    
+    def test_mean_matches_fixed_rate(self):
+        """Test that the mean path matches the closed-form projection."""
+        values = simulate_terminal_balances(500, 6, 15, 240, opening_balance=1000, num_paths=20000,
+                                            seed=11)
+        expected = float(project_balances(500, 6, 240, opening_balance=1000))
+        standard_error = values.std() / np.sqrt(values.size)
+        
+        self.assertLess(abs(values.mean() - expected), 4 * standard_error)
+        np.testing.assert_allclose(simulate_terminal_balances(500, 6, 0, 240, num_paths=3, seed=1),
+                                   float(project_balances(500, 6, 240)), rtol=1e-12)
+    
+    def test_goal_summary(self):
+        """Test percentile ordering and success probability."""
+        summary = simulate_savings_goal(100000, 500, 6, 15, 180, num_paths=10000, seed=3)
+        certain = simulate_savings_goal(1, 500, 6, 15, 180, num_paths=1000, seed=3)
+        
+        self.assertTrue(np.all(np.diff(summary.values) > 0))
+        self.assertTrue(0 < summary.success_probability < 1)
+        self.assertEqual(certain.success_probability, 1.0)
+        self.assertEqual(summary.num_paths, 10000)
+    
+    def test_invalid_inputs(self):
+        """Test that invalid simulations raise errors."""
+        with self.assertRaises(ValueError):
+            simulate_terminal_balances(500, 6, -1, 120)
+        with self.assertRaises(ValueError):
+            simulate_terminal_balances(500, 6, 15, 120, chunk_size=0)
+        with self.assertRaises(ValueError):
+            simulate_savings_goal(0, 500, 6, 15, 120)
+
+
+class TestVarianceReduction(unittest.TestCase):
+    """Unit tests for Sobol sampling and variance-reduced estimates."""
+    
+    def test_sobol_points(self):
+        """Test known points and one-dimensional stratification in every dimension."""
+        points = sobol_points(1024, MAX_SOBOL_DIMENSION)
+        
+        np.testing.assert_array_equal(points[:4, :3], [[0, 0, 0], [0.5, 0.5, 0.5],
+                                                       [0.75, 0.25, 0.25], [0.25, 0.75, 0.75]])
+        for dimension in range(MAX_SOBOL_DIMENSION):
+            counts = np.bincount((points[:, dimension] * 1024).astype(int), minlength=1024)
+            np.testing.assert_array_equal(counts, 1)
+        np.testing.assert_array_equal(sobol_points(8, 5, skip=100), sobol_points(108, 5)[100:])
+        with self.assertRaises(ValueError):
+            sobol_points(10, MAX_SOBOL_DIMENSION + 1)
+    
+    def test_normal_quantile(self):
+        """Test the normal quantile against known values and symmetry."""
+        self.assertAlmostEqual(float(normal_quantile(0.975)), 1.959963984540054, places=8)
+        self.assertAlmostEqual(float(normal_quantile(0.5)), 0.0)
+        probabilities = np.linspace(0.001, 0.999, 999)
+        np.testing.assert_allclose(normal_quantile(probabilities), -normal_quantile(1 - probabilities),
+                                   atol=1e-9)
+    
+    def test_brownian_bridge(self):
+        """Test that the bridge has the covariance of Brownian motion."""
+        rng = np.random.default_rng(0)
+        paths = brownian_bridge(rng.standard_normal((40000, 12)))
+        
+        covariance = np.cov(paths, rowvar=False)
+        expected = np.minimum.outer(np.arange(1, 13), np.arange(1, 13))
+        np.testing.assert_allclose(covariance, expected, atol=0.25)
+    
+    def test_variance_reduction(self):
+        """Test that every method is consistent and reduces the standard error."""
+        exact = float(project_balances(500, 6, 240))
+        plain = estimate_goal_probability(None, 500, 6, 15, 240, max_paths=16384, chunk_size=1024, seed=5)
+        for method, control in (('antithetic', False), ('monte_carlo', True), ('sobol', True)):
+            estimate = estimate_goal_probability(None, 500, 6, 15, 240, method=method,
+                                                 control_variate=control, max_paths=16384,
+                                                 chunk_size=1024, seed=5)
+            self.assertLess(estimate.standard_error, plain.standard_error)
+            self.assertLess(abs(estimate.value - exact), 4 * estimate.standard_error)
+    
+    def test_early_stopping(self):
+        """Test stopping at a target error, independent of the worker count."""
+        serial = estimate_goal_probability(150000, 500, 6, 15, 240, method='antithetic',
+                                           target_error=0.005, chunk_size=2048, seed=9)
+        parallel = estimate_goal_probability(150000, 500, 6, 15, 240, method='antithetic',
+                                             target_error=0.005, chunk_size=2048, seed=9, workers=2)
+        
+        self.assertTrue(serial.converged)
+        self.assertLessEqual(serial.standard_error, 0.005)
+        self.assertLess(serial.num_paths, 1000000)
+        self.assertEqual(serial, parallel)
+        with self.assertRaises(ValueError):
+            estimate_goal_probability(150000, 500, 6, 15, 240, method='halton')
+    
+    def test_required_contribution(self):
+        """Test the CRN contribution quantile against the shared paths."""
+        result = required_contribution([200000, 200000, 50000], [6, 6, 4], [15, 15, 10], [240, 240, 120],
+                                       probability=90, opening_balance=[0, 20000, 0], num_paths=4000,
+                                       seed=1)
+        normals = np.random.default_rng(1).standard_normal((4000, 240))
+        cumulative = np.cumsum(np.log1p(0.06 / 12) - 0.15 ** 2 / 24 + 0.15 / np.sqrt(12) * normals, axis=1)
+        annuity = np.exp(cumulative[:, -1]) * np.exp(-cumulative).sum(axis=1)
+        
+        # Same as bisecting over the shared paths: a cent less falls short
+        self.assertGreaterEqual(np.mean(result.contribution[0] * annuity >= 200000), 0.9)
+        self.assertLess(np.mean((result.contribution[0] - 0.01) * annuity >= 200000), 0.9)
+        np.testing.assert_array_equal(result.success_probability, 0.9)
+        self.assertLess(result.contribution[1], result.contribution[0])
+    
+    def test_required_contribution_deterministic(self):
+        """Test that zero volatility reproduces the fixed-rate annuity."""
+        result = required_contribution(300000, 6, 0, 360, num_paths=10)
+        
+        self.assertAlmostEqual(float(project_balances(result.contribution[0], 6, 360)), 300000, places=6)
+        self.assertEqual(required_contribution(1000, 6, 15, 120, opening_balance=5000).contribution[0], 0)
+        with self.assertRaises(ValueError):
+            required_contribution(1000, 6, 15, 120, probability=0)
+
+
+class TestDrawdownSimulator(unittest.TestCase):
+    """Unit tests for the bootstrapped retirement drawdown simulator."""
+    
+    def setUp(self):
+        """Write a small returns file for each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'returns.csv')
+        self.history = np.random.default_rng(0).normal(0.6, 4.5, 240)
+        with open(self.path, 'w') as handle:
+            handle.write('month,return,bonds\n')
+            for month, value in enumerate(self.history):
+                handle.write(f'{month},{float(value)!r},{float(value) / 2!r}\n')
+    
+    def tearDown(self):
+        """Remove the returns file and its cache."""
+        self.directory.cleanup()
+    
+    def test_load_returns(self):
+        """Test parsing, caching and memory-mapping of the returns file."""
+        returns = load_returns(self.path, 'return')
+        
+        self.assertIsInstance(returns, np.memmap)
+        np.testing.assert_array_equal(returns, self.history)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, 'returns.return.npy')))
+        np.testing.assert_array_equal(load_returns(self.path, 'return'), self.history)
+        np.testing.assert_array_equal(load_returns(self.path, 'bonds'), self.history / 2)
+        np.testing.assert_array_equal(load_returns(self.path, 1), self.history)
+        np.testing.assert_array_equal(load_returns(self.path), self.history / 2)
+        
+        cache_path = os.path.join(self.directory.name, 'custom')
+        np.testing.assert_array_equal(load_returns(self.path, 'bonds', cache_path=cache_path), self.history / 2)
+        self.assertTrue(os.path.exists(cache_path + '.npy'))
+        np.testing.assert_array_equal(load_returns(self.path, 'bonds', cache_path=cache_path), self.history / 2)
+        with self.assertRaises(ValueError):
+            load_returns(self.path, 'missing', cache_path=os.path.join(self.directory.name, 'other.npy'))
+    
+    def test_block_bootstrap(self):
+        """Test that resampled paths are made of contiguous circular blocks."""
+        paths = bootstrap_log_growth(self.history, 50, 30, block_size=12, rng=np.random.default_rng(1))
+        log_growth = np.log1p(self.history / 100)
+        
+        self.assertEqual(paths.shape, (50, 30))
+        for row in paths:
+            start = np.flatnonzero(log_growth == row[12])[0]
+            np.testing.assert_array_equal(row[12:24], log_growth[(start + np.arange(12)) % 240])
+    
+    def test_matches_monthly_loop(self):
+        """Test the vectorized search against a month-by-month loop."""
+        plans = [(1e6, 4000), (5e5, 4000), (1e6, 8000)]
+        result = simulate_drawdown(load_returns(self.path, 'return'), [plan[0] for plan in plans],
+                                   [plan[1] for plan in plans], 360, inflation=2, num_paths=200, seed=3)
+        paths = bootstrap_log_growth(self.history, 200, 360, rng=np.random.default_rng(3))
+        
+        for index, (balance, withdrawal) in enumerate(plans):
+            for path in range(200):
+                current, depleted = balance, 0
+                for month, growth in enumerate(paths[path]):
+                    amount = withdrawal * 1.02 ** (month // 12)
+                    if current < amount:
+                        current, depleted = 0.0, month + 1
+                        break
+                    current = (current - amount) * np.exp(growth)
+                self.assertEqual(result.depletion_month[index, path], depleted)
+                self.assertAlmostEqual(result.terminal_balances[index, path], current,
+                                       delta=1e-6 * max(current, 1))
+        self.assertAlmostEqual(result.success_probability[0], np.mean(result.depletion_month[0] == 0))
+    
+    def test_invalid_inputs(self):
+        """Test that invalid plans raise errors."""
+        with self.assertRaises(ValueError):
+            simulate_drawdown(self.history, 1e6, 0, 360)
+        with self.assertRaises(ValueError):
+            simulate_drawdown(self.history, 1e6, 4000, 0)
+
+
+class TestBonds(unittest.TestCase):
+    """Test cases for the vectorized bond engine."""
+    
+    def test_par_and_zero_coupon_prices(self):
+        """Test bonds priced at their coupon rate and zero-coupon bonds."""
+        np.testing.assert_allclose(bond_price(100, [3, 5, 8], [2, 10, 30], [3, 5, 8]), 100, rtol=1e-12)
+        np.testing.assert_allclose(bond_price(1000, 0, 10, 6, frequency=1), 1000 / 1.06 ** 10, rtol=1e-12)
+        np.testing.assert_allclose(bond_price(1000, 0, 5, 6, continuous=True), 1000 * np.exp(-0.3), rtol=1e-12)
+    
+    def test_price_matches_cash_flow_sum(self):
+        """Test fractional maturities and mixed conventions against a scalar sum."""
+        for face, coupon, years, yld, frequency, compound in ((1000, 6, 7.3, 8, 1, 4), (100, 4.5, 2.6, 3, 2, 12),
+                                                               (100, 9, 0.2, 12, 4, 4)):
+            num_coupons = int(np.ceil(years * frequency))
+            elapsed = num_coupons - years * frequency
+            expected = sum((face * coupon / 100 / frequency + (face if k == num_coupons else 0))
+                           * (1 + yld / 100 / compound) ** (-compound * (k - elapsed) / frequency)
+                           for k in range(1, num_coupons + 1))
+            self.assertAlmostEqual(float(bond_price(face, coupon, years, yld, frequency, compound)),
+                                   expected, places=9)
+        np.testing.assert_allclose(accrued_interest(100, 6, [7.25, 7.0]), [1.5, 0.0], atol=1e-12)
+    
+    def test_duration_and_convexity(self):
+        """Test analytic sensitivities against finite differences and known values."""
+        for options in ({}, {'compound_frequency': 12}, {'continuous': True}):
+            yields, step = np.array([2.0, 6.0, 11.0]), 1e-4
+            metrics = bond_metrics(100, [4, 0, 9], [8.4, 5, 20], yields, **options)
+            up, mid, down = (bond_price(100, [4, 0, 9], [8.4, 5, 20], yields + shift, **options)
+                             for shift in (step, 0, -step))
+            np.testing.assert_allclose(metrics.modified_duration, -(up - down) / (2 * step / 100) / mid,
+                                       rtol=1e-7)
+            np.testing.assert_allclose(metrics.convexity, (up - 2 * mid + down) / (step / 100) ** 2 / mid,
+                                       rtol=1e-4)
+        
+        zero = bond_metrics(100, 0, 5, 6)
+        self.assertAlmostEqual(float(zero.macaulay_duration), 5.0, places=12)
+        self.assertAlmostEqual(float(zero.modified_duration), 5 / 1.03, places=12)
+        continuous = bond_metrics(100, 5, 10, 5, continuous=True)
+        self.assertAlmostEqual(float(continuous.modified_duration), float(continuous.macaulay_duration))
+    
+    def test_yield_round_trip(self):
+        """Test solving yields back from prices for many bonds at once."""
+        rng = np.random.default_rng(3)
+        coupons, years, yields = rng.uniform(0, 10, 2000), rng.uniform(0.2, 30, 2000), rng.uniform(-1, 15, 2000)
+        prices = bond_price(100, coupons, years, yields, frequency=2, compound_frequency=np.inf)
+        result = bond_yield(prices, 100, coupons, years, frequency=2, compound_frequency=np.inf)
+        
+        self.assertTrue(result.converged.all())
+        np.testing.assert_allclose(result.root, yields, atol=1e-9)
+        self.assertFalse(bond_yield(1e-3, 100, 5, 10).converged)
+    
+    def test_invalid_bonds(self):
+        """Test that invalid bonds and yields raise errors."""
+        with self.assertRaises(ValueError):
+            bond_price(100, 5, 0, 5)
+        with self.assertRaises(ValueError):
+            bond_price(100, -1, 10, 5)
+        with self.assertRaises(ValueError):
+            bond_price(100, 5, 10, -250)
+        with self.assertRaises(ValueError):
+            bond_yield(0, 100, 5, 10)
+
+
+class TestDatedCashFlows(unittest.TestCase):
+    """Test cases for XNPV and XIRR over dated cash flows."""
+    
+    def setUp(self):
+        """Set up the spreadsheet reference stream."""
+        self.values = [-10000, 2750, 4250, 3250, 2750]
+        self.dates = np.array(['2008-01-01', '2008-03-01', '2008-10-30', '2009-02-15', '2009-04-01'],
+                              dtype='datetime64[D]')
+    
+    def test_spreadsheet_reference_values(self):
+        """Test XNPV and XIRR against the spreadsheet reference results."""
+        self.assertAlmostEqual(float(xnpv(9, [self.values], [self.dates])[0]), 2086.647602, places=5)
+        result = xirr([self.values], [self.dates])
+        self.assertTrue(result.converged[0])
+        self.assertAlmostEqual(result.root[0], 37.3362535, places=6)
+    
+    def test_ragged_matches_padded_matrix(self):
+        """Test that ragged rows and NaN/NaT-padded matrices agree."""
+        values = np.array(self.values + [-500, 100, 200, 300], dtype=float)
+        dates = np.concatenate((self.dates, self.dates[:4].astype('datetime64[s]')))
+        offsets = [0, 5, 9]
+        matrix = np.array([self.values + [np.nan], [-500, 100, 200, 300, np.nan, np.nan]])
+        padded = np.full(matrix.shape, np.datetime64('NaT'), dtype='datetime64[D]')
+        padded[0, :5], padded[1, :4] = self.dates, self.dates[:4]
+        
+        ragged = xirr(values, dates, offsets)
+        np.testing.assert_allclose(ragged.root, xirr(matrix, padded).root, rtol=1e-12)
+        np.testing.assert_allclose(xnpv(ragged.root, values, dates, offsets), 0, atol=1e-8)
+    
+    def test_yearly_dates_match_periodic_irr(self):
+        """Test that flows exactly 365 days apart reproduce the periodic IRR."""
+        matrix = np.array([[-1000, 300, 400, 500], [-800, 100, 100, 900]], dtype=float)
+        dates = np.datetime64('2021-01-01') + np.arange(4) * 365
+        
+        periodic = batch_irr(matrix)
+        np.testing.assert_allclose(xirr(matrix, np.tile(dates, (2, 1))).root, periodic.root * 100, rtol=1e-10)
+    
+    def test_invalid_dated_flows(self):
+        """Test that inconsistent dates raise errors."""
+        with self.assertRaises(ValueError):
+            xnpv(5, [self.values], [self.dates[::-1]])
+        with self.assertRaises(ValueError):
+            xnpv(5, [self.values], [[0, 1, 2, 3, 4]])
+        with self.assertRaises(ValueError):
+            xnpv(5, [self.values], [self.dates[:4]])
+        with self.assertRaises(ValueError):
+            xnpv(-100, [self.values], [self.dates])
+
+
+class TestDayCount(unittest.TestCase):
+    """Test cases for day-count conventions and business-day calendars."""
+    
+    def setUp(self):
+        """Set up a calendar with a few holidays and a calculator."""
+        self.holidays = np.array(['2024-01-01', '2024-05-27', '2024-12-25', '2025-01-01', '2025-03-31'],
+                                 dtype='datetime64[D]')
+        self.calendar = BusinessCalendar(self.holidays, first_year=2020, last_year=2030)
+        self.calculator = FinanceCalculator()
+    
+    def test_day_count_conventions(self):
+        """Test Actual/360, Actual/365 and 30/360 accrual periods."""
+        start = np.array(['2020-01-31', '2020-01-30', '2020-02-29', '2019-12-31'], dtype='datetime64[D]')
+        end = np.array(['2020-03-31', '2020-03-31', '2020-03-31', '2021-01-31'], dtype='datetime64[D]')
+        
+        np.testing.assert_array_equal(day_count(start, end, '30/360'), [60, 60, 32, 390])
+        np.testing.assert_array_equal(day_count(start, end, 'act/360'), [60, 61, 31, 397])
+        np.testing.assert_allclose(year_fraction(start, end, 'act/365'), np.array([60, 61, 31, 397]) / 365)
+        np.testing.assert_allclose(year_fraction(start, end, '30/360'), np.array([60, 60, 32, 390]) / 360)
+        with self.assertRaises(ValueError):
+            day_count(start, end, 'act/act')
+    
+    def test_accrued_simple_interest(self):
+        """Test dated simple interest against calculate_simple_interest."""
+        accrued = accrued_simple_interest(1000000, 5, '2024-01-15', '2024-07-15', 'act/360')
+        self.assertAlmostEqual(float(accrued), self.calculator.calculate_simple_interest(1000000, 5, 182 / 360))
+        with self.assertRaises(ValueError):
+            accrued_simple_interest(1000, 5, '2024-07-15', '2024-01-15')
+    
+    def test_business_days_match_numpy(self):
+        """Test bitset lookups and every roll against numpy's business-day functions."""
+        rng = np.random.default_rng(5)
+        dates = np.datetime64('2020-01-01') + rng.integers(0, 4000, 20000)
+        reference = np.busdaycalendar(holidays=self.holidays)
+        
+        np.testing.assert_array_equal(self.calendar.is_business_day(dates),
+                                      np.is_busday(dates, busdaycal=reference))
+        for roll, numpy_roll in (('following', 'following'), ('preceding', 'preceding'),
+                                 ('modified_following', 'modifiedfollowing'),
+                                 ('modified_preceding', 'modifiedpreceding')):
+            np.testing.assert_array_equal(self.calendar.adjust(dates, roll),
+                                          np.busday_offset(dates, 0, roll=numpy_roll, busdaycal=reference))
+    
+    def test_weekend_only_calendar(self):
+        """Test calendars built without any holidays."""
+        dates = np.datetime64('2024-01-01') + np.arange(400)
+        for calendar, weekend in ((BusinessCalendar(), (5, 6)), (BusinessCalendar([]), (5, 6)),
+                                  (BusinessCalendar(weekend=(4, 5)), (4, 5))):
+            mask = [day not in weekend for day in range(7)]
+            np.testing.assert_array_equal(calendar.is_business_day(dates), np.is_busday(dates, weekmask=mask))
+        self.assertEqual(BusinessCalendar().adjust('2024-06-01'), np.datetime64('2024-06-03'))
+    
+    def test_modified_following_stays_in_month(self):
+        """Test month-end rolls and holidays on known dates."""
+        adjusted = self.calendar.adjust(['2025-03-29', '2025-03-30', '2024-12-25', '2024-06-03'],
+                                        'modified_following')
+        np.testing.assert_array_equal(adjusted, np.array(['2025-03-28', '2025-03-28', '2024-12-26', '2024-06-03'],
+                                                         dtype='datetime64[D]'))
+        self.assertEqual(self.calendar.bitsets.shape, (11, 46))
+        with self.assertRaises(ValueError):
+            self.calendar.adjust('2031-01-02')
+        with self.assertRaises(ValueError):
+            self.calendar.adjust('2024-01-02', 'nearest')
+
+
+class TestYieldCurve(unittest.TestCase):
+    """Test cases for the term-structure curve and curve-aware calculators."""
+    
+    def setUp(self):
+        """Set up a calculator, a flat monthly curve and an upward-sloping curve."""
+        self.calculator = FinanceCalculator()
+        self.flat = YieldCurve([1, 30], [5, 5], compound_frequency=12)
+        self.curve = YieldCurve([0.5, 1, 2, 5, 10, 30], [4.5, 4.4, 4.1, 3.9, 4.0, 4.3])
+    
+    def test_pillars_and_log_linear_interpolation(self):
+        """Test pillar zero rates, interpolated discount factors and forwards."""
+        np.testing.assert_allclose(self.curve.zero_rates(self.curve.times), [4.5, 4.4, 4.1, 3.9, 4.0, 4.3],
+                                   rtol=1e-12)
+        discount = self.curve.discount_factors([2, 3.5, 5])
+        self.assertAlmostEqual(discount[1], np.sqrt(discount[0] * discount[2]), places=14)
+        
+        forwards = self.curve.forward_rates([2, 2.5, 4], [3, 3.5, 5], continuous=True)
+        np.testing.assert_allclose(forwards, forwards[0], rtol=1e-12)
+        np.testing.assert_allclose(self.curve.forward_rates(2.5, 2.5, continuous=True), forwards[0], rtol=1e-12)
+        np.testing.assert_allclose(self.curve.forward_rates(0, 2), self.curve.zero_rates(2), rtol=1e-12)
+        
+        rebuilt = YieldCurve.from_discount_factors(self.curve.times, self.curve.discount_factors(self.curve.times))
+        np.testing.assert_allclose(rebuilt.discount_factors([0.25, 7, 40]),
+                                   self.curve.discount_factors([0.25, 7, 40]), rtol=1e-12)
+    
+    def test_flat_curve_matches_flat_rate(self):
+        """Test that a flat monthly-compounded curve reproduces the flat-rate methods."""
+        self.assertEqual(self.calculator.calculate_monthly_payment(200000, self.flat, 30),
+                         self.calculator.calculate_monthly_payment(200000, 5, 30))
+        self.assertEqual(self.calculator.calculate_savings_goal(100000, 500, self.flat),
+                         self.calculator.calculate_savings_goal(100000, 500, 5))
+        self.assertEqual(self.calculator.calculate_compound_interest(1000, self.flat, 10),
+                         self.calculator.calculate_compound_interest(1000, 5, 10, 12))
+        
+        batch = BatchCalculator()
+        for on_curve, flat in ((batch.calculate_monthly_payment([200000, -1, 1000], self.flat, [30, 10, 0.5]),
+                                batch.calculate_monthly_payment([200000, -1, 1000], 5, [30, 10, 0.5])),
+                               (batch.calculate_savings_goal([100000, 0, 1e12], 500, self.flat),
+                                batch.calculate_savings_goal([100000, 0, 1e12], 500, 5))):
+            np.testing.assert_array_equal(on_curve.values, flat.values)
+            np.testing.assert_array_equal(on_curve.errors, flat.errors)
+    
+    def test_curve_payments_and_goals(self):
+        """Test payments and savings goals on a sloped curve against month-by-month sums."""
+        payment = self.curve.monthly_payment(200000, 30)
+        discount = self.curve.discount_factors(np.arange(1, 361) / 12)
+        self.assertAlmostEqual(float(payment * discount.sum()), 200000, places=6)
+        
+        years = float(self.curve.years_to_goal(100000, 500))
+        months = int(np.ceil(years * 12))
+        balances = 500 * np.cumsum(discount[:months]) / discount[:months]
+        self.assertLess(balances[-2], 100000)
+        self.assertGreaterEqual(balances[-1], 100000)
+        self.assertEqual(self.calculator.calculate_savings_goal(100000, 500, self.curve), round(years, 2))
+    
+    def test_curve_amortization_schedules(self):
+        """Test generated and lazy schedules that accrue at the curve's monthly forward rates."""
+        rows = list(iter_amortization_schedule(200000, self.curve, 30))
+        schedule = self.calculator.amortization_schedule(200000, self.curve, 30)
+        discount = self.curve.monthly_discount_factors(360)
+        
+        self.assertEqual(len(schedule), 360)
+        self.assertEqual(rows[0].payment, self.calculator.calculate_monthly_payment(200000, self.curve, 30))
+        self.assertAlmostEqual(rows[0].interest, 200000 * (discount[0] / discount[1] - 1), places=6)
+        self.assertEqual(rows[-1].balance, 0.0)
+        self.assertAlmostEqual(sum(row.principal for row in rows), 200000, places=6)
+        for row, expected in zip(schedule, rows):
+            for name in ('payment', 'interest', 'principal', 'balance'):
+                self.assertAlmostEqual(getattr(row, name), getattr(expected, name), places=6)
+        np.testing.assert_allclose(schedule[120:132].column('interest'),
+                                   [row.interest for row in rows[120:132]], atol=1e-6)
+        self.assertEqual(schedule[5:2].column('interest').size, 0)
+        self.assertEqual(list(schedule[5:2]), [])
+        
+        balances = balance_after_payment([200000, 200000, -1], self.curve, 30, [0, 120, 12])
+        np.testing.assert_allclose(balances.values[:2], [200000, rows[119].balance], atol=1e-6)
+        self.assertEqual(balances.errors[2], ERROR_INVALID_AMOUNT)
+        np.testing.assert_allclose(interest_paid_through(200000, self.curve, 30, [120, 360]).values,
+                                   [sum(row.interest for row in rows[:120]), sum(row.interest for row in rows)],
+                                   atol=1e-6)
+        
+        for row, expected in zip(self.calculator.amortization_schedule(1000, self.flat, 1),
+                                 iter_amortization_schedule(1000, 5, 1)):
+            self.assertAlmostEqual(row.balance, expected.balance, places=6)
+    
+    def test_curve_loan_analytics(self):
+        """Test prepayments and APRs on a curve, and functions that only take flat rates."""
+        rows = list(iter_amortization_schedule(200000, self.curve, 30))
+        result = simulate_prepayments([200000, 200000], self.curve, 30, extra_monthly=[0, 200],
+                                      record_schedule=True)
+        self.assertEqual(result.payoff_period[0], 360)
+        self.assertLess(result.payoff_period[1], 360)
+        self.assertAlmostEqual(result.interest_saved[0], 0.0, places=6)
+        self.assertGreater(result.interest_saved[1], 0)
+        np.testing.assert_allclose(result.schedule.balance[0, :360], [row.balance for row in rows], atol=1e-6)
+        
+        np.testing.assert_allclose(batch_apr([200000, 200000], self.flat, 30, [0, 3000]).root,
+                                   batch_apr([200000, 200000], 5, 30, [0, 3000]).root)
+        
+        for function, args in ((payment_grid, (self.curve, [30], [200000])),
+                               (months_to_goal, (100000, self.curve, [[500] * 12])),
+                               (project_balances, (500, self.curve, 12))):
+            with self.assertRaises(ValueError):
+                function(*args)
+    
+    def test_invalid_curves(self):
+        """Test invalid pillars, times and unreachable goals."""
+        with self.assertRaises(ValueError):
+            YieldCurve([1, 1, 2], [4, 4, 4])
+        with self.assertRaises(ValueError):
+            YieldCurve([1, 2], [4])
+        with self.assertRaises(ValueError):
+            self.curve.discount_factors(-1)
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_savings_goal(100000, 500, YieldCurve([1], [-50], continuous=True))
+        self.assertEqual(BatchCalculator().calculate_savings_goal(
+            100000, 500, YieldCurve([1], [-50], continuous=True)).errors, ERROR_INVALID_RATE)
+
+
 if __name__ == '__main__':
     # Run unit tests
     unittest.main(verbosity=2)